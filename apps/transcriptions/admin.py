@@ -1,5 +1,17 @@
+from datetime import timedelta
 from django.contrib import admin
-from .models import Transcription, TranscriptionSettings
+from django.utils import timezone
+from . import ops_metrics
+from .models import (
+    EmailOutbox,
+    MaintenanceCheckpoint,
+    OpsMetricsBucket,
+    TaskOutbox,
+    Transcription,
+    TranscriptionSettings,
+    TranscriptionStats,
+    TranscriptionTombstone,
+)
 
 @admin.register(Transcription)
 class TranscriptionAdmin(admin.ModelAdmin):
@@ -14,7 +26,14 @@ class TranscriptionAdmin(admin.ModelAdmin):
     ]
     list_filter = ['status', 'language', 'created_at']
     search_fields = ['title', 'user__email']
-    readonly_fields = ['created_at', 'updated_at', 'completed_at', 'file_size']
+    readonly_fields = [
+        'created_at',
+        'updated_at',
+        'completed_at',
+        'file_size',
+        'text_archive_key',
+        'text_archived_at',
+    ]
     
     fieldsets = (
         ('Basic Info', {
@@ -26,6 +45,10 @@ class TranscriptionAdmin(admin.ModelAdmin):
         ('Transcription', {
             'fields': ('transcribed_text', 'language', 'model_name')
         }),
+        ('Archive', {
+            'fields': ('text_archive_key', 'text_archived_at'),
+            'classes': ('collapse',)
+        }),
         ('Error Info', {
             'fields': ('error_message',),
             'classes': ('collapse',)
@@ -52,6 +75,88 @@ class TranscriptionSettingsAdmin(admin.ModelAdmin):
             'fields': ('default_language', 'default_model')
         }),
         ('Preferences', {
-            'fields': ('notifications_enabled', 'auto_delete_audio')
+            'fields': (
+                'notifications_enabled',
+                'notification_mode',
+                'digest_window_minutes',
+                'auto_delete_audio',
+            )
         }),
     )
+
+
+@admin.register(TaskOutbox)
+class TaskOutboxAdmin(admin.ModelAdmin):
+    list_display = ['id', 'task_name', 'task_id', 'attempts', 'created_at', 'sent_at']
+    list_filter = ['task_name', ('sent_at', admin.EmptyFieldListFilter)]
+    search_fields = ['task_id', 'task_name']
+    readonly_fields = ['created_at', 'sent_at', 'attempts', 'last_error']
+
+
+@admin.register(EmailOutbox)
+class EmailOutboxAdmin(admin.ModelAdmin):
+    list_display = ['id', 'subject', 'status', 'attempts', 'created_at', 'next_attempt_at', 'sent_at']
+    list_filter = ['status', 'created_at']
+    search_fields = ['subject', 'to']
+    readonly_fields = ['created_at', 'sent_at', 'attempts', 'last_error']
+
+
+@admin.register(MaintenanceCheckpoint)
+class MaintenanceCheckpointAdmin(admin.ModelAdmin):
+    list_display = ['job', 'state', 'updated_at']
+    readonly_fields = ['updated_at']
+
+
+@admin.register(TranscriptionTombstone)
+class TranscriptionTombstoneAdmin(admin.ModelAdmin):
+    list_display = ['transcription_id', 'user', 'deleted_at']
+    search_fields = ['transcription_id', 'user__email']
+    readonly_fields = ['deleted_at']
+
+
+@admin.register(TranscriptionStats)
+class TranscriptionStatsAdmin(admin.ModelAdmin):
+    list_display = ['user', 'total_transcriptions', 'total_duration_seconds', 'updated_at', 'reconciled_at']
+    search_fields = ['user__email']
+    readonly_fields = ['updated_at', 'reconciled_at']
+
+
+@admin.register(OpsMetricsBucket)
+class OpsMetricsBucketAdmin(admin.ModelAdmin):
+    """Read-only ops dashboard: totals of recent windows above the bucket list."""
+    
+    list_display = [
+        'start',
+        'resolution',
+        'submissions',
+        'completions',
+        'failures',
+        'failure_rate',
+        'audio_seconds',
+        'avg_latency_seconds',
+    ]
+    list_filter = ['resolution']
+    date_hierarchy = 'start'
+    ordering = ['-start']
+    
+    SUMMARY_WINDOWS = (
+        ('Last hour', timedelta(hours=1)),
+        ('Last 24 hours', timedelta(hours=24)),
+        ('Last 7 days', timedelta(days=7)),
+        ('Last 30 days', timedelta(days=30)),
+    )
+    
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
+    
+    def changelist_view(self, request, extra_context=None):
+        now = timezone.now()
+        summary = [
+            (label, ops_metrics.query(now - window, now)['totals'])
+            for label, window in self.SUMMARY_WINDOWS
+        ]
+        extra_context = {**(extra_context or {}), 'ops_summary': summary}
+        return super().changelist_view(request, extra_context=extra_context)
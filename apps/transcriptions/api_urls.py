@@ -1,7 +1,14 @@
 # transcriptions/api_urls.py
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
-from .views import TranscriptionViewSet, TranscriptionSettingsViewSet, health_check
+from .views import (
+    TranscriptionViewSet,
+    TranscriptionSettingsViewSet,
+    conditional_get_metrics,
+    health_check,
+    ops_metrics_stats,
+)
+from .streams import job_events
 
 router = DefaultRouter()
 router.register(r"transcriptions", TranscriptionViewSet, basename="transcription")
@@ -10,4 +17,7 @@ router.register(r"settings", TranscriptionSettingsViewSet, basename="transcripti
 urlpatterns = [
     path("", include(router.urls)),
     path("health/", health_check, name="health-check"),
+    path("events/", job_events, name="transcription-events"),
+    path("metrics/conditional-get/", conditional_get_metrics, name="conditional-get-metrics"),
+    path("metrics/ops/", ops_metrics_stats, name="ops-metrics"),
 ]
\ No newline at end of file
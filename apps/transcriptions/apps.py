@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class TranscriptionsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.transcriptions'
+
+    def ready(self):
+        import apps.transcriptions.signals  # noqa: F401, PLC0415
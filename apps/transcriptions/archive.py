@@ -0,0 +1,146 @@
+"""
+Cold-tier archival of transcript text.
+
+Old transcripts are moved out of Postgres into zstd-compressed JSON objects
+in the audio storage backend, text and timestamped segments together. The
+row keeps a short preview in ``transcribed_text``, no segments, and a
+pointer in ``text_archive_key``; ``Transcription.full_text`` and
+``full_segments`` rehydrate them through a process-local LRU cache.
+"""
+import json
+import logging
+from datetime import timedelta
+from functools import lru_cache
+import zstandard
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db.models import Q
+from django.db.models.functions import Length
+from django.utils import timezone
+from . import conditional, search
+from .models import Transcription
+from .storage import delete_objects
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_PREFIX = 'transcripts'
+
+
+def archive_name(transcription):
+    return f"{ARCHIVE_PREFIX}/{transcription.user_id}/{transcription.id}.json.zst"
+
+
+def compress_transcript(text, segments):
+    compressor = zstandard.ZstdCompressor(level=settings.TRANSCRIPT_ARCHIVE_ZSTD_LEVEL)
+    payload = json.dumps({'text': text, 'segments': segments}, ensure_ascii=False)
+    return compressor.compress(payload.encode('utf-8'))
+
+
+def decompress_transcript(data):
+    """``(text, segments)`` of an archive object."""
+    payload = json.loads(zstandard.ZstdDecompressor().decompress(data))
+    return payload['text'], payload['segments']
+
+
+def forget(key):
+    """Delete the archive object of a deleted transcription."""
+    _, failed = delete_objects([key])
+    for name, error in failed.items():
+        logger.warning(f"Deleting archived transcript {name} failed: {error}")
+
+
+def make_preview(text):
+    limit = settings.TRANSCRIPT_PREVIEW_CHARS
+    if len(text) <= limit:
+        return text
+    return text[:limit].rstrip() + '…'
+
+
+@lru_cache(maxsize=256)
+def load_archive(key):
+    """Read and decompress an archived transcript (LRU-cached per process)."""
+    with default_storage.open(key, 'rb') as f:
+        return decompress_transcript(f.read())
+
+
+def load_archived_text(key):
+    return load_archive(key)[0]
+
+
+def load_archived_segments(key):
+    return load_archive(key)[1]
+
+
+def archivable_queryset(now=None):
+    """Completed, not yet archived transcripts older than the threshold."""
+    now = now or timezone.now()
+    cutoff = now - timedelta(days=settings.TRANSCRIPT_ARCHIVE_AFTER_DAYS)
+    return (
+        Transcription.objects
+        .filter(status='completed', text_archive_key='')
+        .filter(Q(completed_at__lt=cutoff) | Q(completed_at__isnull=True, created_at__lt=cutoff))
+        .annotate(text_length=Length('transcribed_text'))
+        .filter(text_length__gt=settings.TRANSCRIPT_PREVIEW_CHARS)
+    )
+
+
+def archive_transcripts(batch_size=None, max_rows=None):
+    """
+    Move old transcript text and segments to compressed objects in storage.
+
+    The object is written before the row is updated, and the update is
+    conditional on the row still being unarchived, so a crash in between
+    leaves at most an unreferenced archive object, never a lost transcript.
+
+    Returns:
+        dict: Counts of archived rows, bytes before and after compression
+    """
+    batch_size = batch_size or settings.TRANSCRIPT_ARCHIVE_BATCH_SIZE
+    max_rows = max_rows or settings.TRANSCRIPT_ARCHIVE_MAX_ROWS
+    totals = {'archived': 0, 'failed': 0, 'raw_bytes': 0, 'stored_bytes': 0}
+
+    rows = (
+        archivable_queryset()
+        .order_by('id')
+        .only('id', 'user_id', 'transcribed_text', 'segments')[:max_rows]
+    )
+    for transcription in rows.iterator(chunk_size=batch_size):
+        text = transcription.transcribed_text
+        try:
+            data = compress_transcript(text, transcription.segments)
+            key = default_storage.save(archive_name(transcription), ContentFile(data))
+        except Exception as e:
+            logger.error(f"Archiving transcription {transcription.id} failed: {e}")
+            totals['failed'] += 1
+            continue
+
+        fields = {
+            'transcribed_text': make_preview(text),
+            'segments': [],
+            'text_archive_key': key,
+            'text_archived_at': timezone.now(),
+        }
+        if search.supported():
+            # Keep indexing the whole text, not the preview that replaces it
+            fields['search_vector'] = search.build_vector(text)
+        updated = Transcription.objects.filter(
+            id=transcription.id,
+            text_archive_key='',
+        ).update(**fields)
+        if not updated:
+            default_storage.delete(key)
+            continue
+        # The row version is unchanged (detail rehydrates the same text), but
+        # list pages selecting transcribed_text now show the preview
+        conditional.invalidate(user_ids=[transcription.user_id])
+
+        totals['archived'] += 1
+        totals['raw_bytes'] += len(text.encode('utf-8'))
+        totals['stored_bytes'] += len(data)
+
+    logger.info(
+        f"Archived {totals['archived']} transcript(s): "
+        f"{totals['raw_bytes']} bytes -> {totals['stored_bytes']} bytes compressed"
+    )
+    return totals
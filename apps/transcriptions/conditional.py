@@ -0,0 +1,209 @@
+"""
+Conditional GET (ETag / Last-Modified) for transcription endpoints.
+
+Detail and status ETags are derived from ``(id, updated_at)``; the list ETag
+from a per-user token that changes whenever one of the user's transcriptions
+is saved or deleted. Both are kept in the cache and written after commit
+(see signals.py), so a matching ``If-None-Match`` is answered with a 304
+without loading the row. A cache miss costs one ``(user_id, updated_at)``
+lookup.
+
+Every evaluated request is counted per endpoint; ``metrics()`` reports the
+304 hit rate.
+"""
+import hashlib
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Max
+from django.http import HttpResponseNotModified
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+
+from .models import Transcription
+
+VERSION_KEY = 'transcription-version:{pk}'
+LIST_VERSION_KEY = 'transcription-list-version:{user_id}'
+METRICS_KEY = 'conditional-get:{endpoint}:{counter}'
+ENDPOINTS = ('detail', 'status', 'list')
+COUNTERS = ('requests', 'conditional', 'not_modified')
+# Query parameters that do not change the representation
+UNVERSIONED_PARAMS = ('wait',)
+
+
+def get_version(pk, user_id):
+    """
+    Return ``updated_at`` of a transcription owned by ``user_id``.
+
+    Returns None for unknown ids and for other users' transcriptions, so the
+    caller falls through to its regular 404 handling.
+    """
+    try:
+        pk = int(pk)
+    except (TypeError, ValueError):
+        return None
+    key = VERSION_KEY.format(pk=pk)
+    entry = cache.get(key)
+    if entry is None:
+        entry = Transcription.objects.filter(pk=pk).values_list('user_id', 'updated_at').first()
+        if entry is None:
+            return None
+        # add(): never overwrite a newer version written after commit
+        cache.add(key, entry, settings.CONDITIONAL_VERSION_TIMEOUT)
+    owner_id, updated_at = entry
+    return updated_at if owner_id == user_id else None
+
+
+def get_list_version(user_id):
+    """Return the (token, last_modified) pair of a user's transcription list."""
+    key = LIST_VERSION_KEY.format(user_id=user_id)
+    entry = cache.get(key)
+    if entry is None:
+        last_modified = (
+            Transcription.objects.filter(user_id=user_id)
+            .aggregate(last=Max('updated_at'))['last']
+        )
+        entry = (uuid.uuid4().hex, last_modified)
+        if not cache.add(key, entry, settings.CONDITIONAL_VERSION_TIMEOUT):
+            entry = cache.get(key, entry)
+    return entry
+
+
+def record_version(transcription):
+    """Write the current version of a saved transcription after commit."""
+    pk, user_id, updated_at = transcription.pk, transcription.user_id, transcription.updated_at
+
+    def write():
+        cache.set_many({
+            VERSION_KEY.format(pk=pk): (user_id, updated_at),
+            LIST_VERSION_KEY.format(user_id=user_id): (uuid.uuid4().hex, updated_at),
+        }, settings.CONDITIONAL_VERSION_TIMEOUT)
+
+    transaction.on_commit(write)
+
+
+def invalidate(pks=(), user_ids=()):
+    """Drop cached versions after bulk updates or deletes that bypass save()."""
+    pks, user_ids = list(pks), set(user_ids)
+
+    def write():
+        cache.delete_many([VERSION_KEY.format(pk=pk) for pk in pks])
+        now = timezone.now()
+        cache.set_many({
+            LIST_VERSION_KEY.format(user_id=user_id): (uuid.uuid4().hex, now)
+            for user_id in user_ids
+        }, settings.CONDITIONAL_VERSION_TIMEOUT)
+
+    transaction.on_commit(write)
+
+
+def make_etag(request, *parts):
+    """
+    Build a strong ETag from the resource version and the representation.
+
+    The query string and the negotiated format are part of the tag because
+    ``?fields=``/``?omit=``, the cursor and the renderer all change the body.
+    """
+    accepted = getattr(request, 'accepted_renderer', None)
+    query = request.GET.copy()
+    for param in UNVERSIONED_PARAMS:
+        query.pop(param, None)
+    variant = (query.urlencode(), getattr(accepted, 'format', ''))
+    value = ':'.join(str(part) for part in (*parts, *variant))
+    return '"%s"' % hashlib.blake2b(value.encode(), digest_size=16).hexdigest()
+
+
+def is_conditional(request):
+    return 'HTTP_IF_NONE_MATCH' in request.META or 'HTTP_IF_MODIFIED_SINCE' in request.META
+
+
+def is_not_modified(request, etag, last_modified=None):
+    """
+    Evaluate If-None-Match (weak comparison) or, without it, If-Modified-Since.
+    """
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match:
+        etags = parse_etags(if_none_match)
+        return etags == ['*'] or etag in (tag.removeprefix('W/') for tag in etags)
+
+    if_modified_since = parse_http_date_safe(request.META.get('HTTP_IF_MODIFIED_SINCE', ''))
+    if if_modified_since is None or last_modified is None:
+        return False
+    return int(last_modified.timestamp()) <= if_modified_since
+
+
+def not_modified_response(request, endpoint, etag, last_modified=None):
+    """
+    Return a 304 response when the client copy is current, else None.
+
+    Counts the request towards the endpoint's hit-rate metrics.
+    """
+    conditional = is_conditional(request)
+    not_modified = conditional and is_not_modified(request, etag, last_modified)
+    record(endpoint, conditional, not_modified)
+    if not not_modified:
+        return None
+    return set_validators(HttpResponseNotModified(), etag, last_modified)
+
+
+def check_object(request, endpoint, pk):
+    """
+    Answer a conditional request for one transcription from its cached version.
+
+    Returns a 304 response, or None when the view has to render the object.
+    """
+    updated_at = get_version(pk, request.user.id) if is_conditional(request) else None
+    if updated_at is None:
+        record(endpoint, is_conditional(request), False)
+        return None
+    etag = make_etag(request, endpoint, int(pk), updated_at)
+    return not_modified_response(request, endpoint, etag, updated_at)
+
+
+def set_validators(response, etag, last_modified=None):
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    # Per-user data: always revalidate, never serve heuristically from cache
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def _incr(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, None):
+            cache.incr(key)
+
+
+def record(endpoint, conditional, not_modified):
+    _incr(METRICS_KEY.format(endpoint=endpoint, counter='requests'))
+    if conditional:
+        _incr(METRICS_KEY.format(endpoint=endpoint, counter='conditional'))
+    if not_modified:
+        _incr(METRICS_KEY.format(endpoint=endpoint, counter='not_modified'))
+
+
+def metrics():
+    """
+    Return request counters and the 304 hit rate per endpoint.
+
+    ``hit_rate`` is the share of conditional requests answered with a 304.
+    """
+    keys = {
+        (endpoint, counter): METRICS_KEY.format(endpoint=endpoint, counter=counter)
+        for endpoint in ENDPOINTS
+        for counter in COUNTERS
+    }
+    values = cache.get_many(keys.values())
+    report = {}
+    for endpoint in ENDPOINTS:
+        counts = {counter: values.get(keys[endpoint, counter], 0) for counter in COUNTERS}
+        conditional = counts['conditional']
+        counts['hit_rate'] = round(counts['not_modified'] / conditional, 4) if conditional else 0.0
+        report[endpoint] = counts
+    return report
@@ -0,0 +1,113 @@
+"""
+Response cache for the dashboard endpoints (stats, timeline, autocomplete).
+
+Entries are keyed by user, endpoint, parameters and a per-user version
+token. Saves and deletes that change what the dashboard shows replace the
+token after commit (see signals.py), so old entries are never read again
+and simply expire; nothing has to enumerate them.
+
+Concurrent misses for the same key are coalesced: the first request takes a
+short lock with ``cache.add`` and computes, the others wait for its result
+instead of running the same aggregates in parallel.
+"""
+import hashlib
+import logging
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = 'dashboard-version:{user_id}'
+ENTRY_KEY = 'dashboard:{endpoint}:{user_id}:{version}:{variant}'
+LOCK_KEY = 'dashboard-lock:{entry}'
+
+# Columns shown by stats/timeline; saves touching only others keep the cache
+DASHBOARD_FIELDS = frozenset((
+    'title', 'status', 'language', 'model_name', 'duration_seconds', 'file_size', 'created_at',
+))
+
+_MISSING = object()
+
+
+def get_version(user_id):
+    key = VERSION_KEY.format(user_id=user_id)
+    version = cache.get(key)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not cache.add(key, version, settings.DASHBOARD_CACHE_VERSION_TIMEOUT):
+            version = cache.get(key, version)
+    return version
+
+
+def bump(user_ids):
+    """Replace the users' version tokens after commit."""
+    user_ids = set(user_ids)
+
+    def write():
+        cache.set_many({
+            VERSION_KEY.format(user_id=user_id): uuid.uuid4().hex
+            for user_id in user_ids
+        }, settings.DASHBOARD_CACHE_VERSION_TIMEOUT)
+
+    transaction.on_commit(write)
+
+
+def affects_dashboard(update_fields):
+    return update_fields is None or bool(DASHBOARD_FIELDS & set(update_fields))
+
+
+def entry_key(endpoint, user_id, params):
+    variant = '&'.join(f'{name}={value}' for name, value in sorted(params.items()))
+    return ENTRY_KEY.format(
+        endpoint=endpoint,
+        user_id=user_id,
+        version=get_version(user_id),
+        variant=hashlib.blake2b(variant.encode(), digest_size=12).hexdigest(),
+    )
+
+
+def get_or_compute(endpoint, user_id, params, compute, timeout=None):
+    """
+    Return the cached response data, computing it at most once per key.
+
+    Args:
+        endpoint (str): Name of the endpoint
+        user_id (int): Owner of the data
+        params (dict): Everything besides the user the data depends on
+        compute: Zero-argument callable producing the data
+        timeout (int): Entry lifetime, DASHBOARD_CACHE_TIMEOUT by default
+
+    Returns:
+        The cached or freshly computed data
+    """
+    if not settings.DASHBOARD_CACHE_ENABLED:
+        return compute()
+    key = entry_key(endpoint, user_id, params)
+    data = cache.get(key, _MISSING)
+    if data is not _MISSING:
+        return data
+
+    lock = LOCK_KEY.format(entry=key)
+    if not cache.add(lock, 1, settings.DASHBOARD_CACHE_LOCK_TIMEOUT):
+        # Another request is computing this entry; wait for it
+        deadline = time.monotonic() + settings.DASHBOARD_CACHE_LOCK_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(settings.DASHBOARD_CACHE_POLL_INTERVAL)
+            data = cache.get(key, _MISSING)
+            if data is not _MISSING:
+                return data
+            if cache.get(lock) is None:
+                break
+        logger.info(f"Dashboard cache wait for {endpoint} of user {user_id} timed out")
+        return compute()
+
+    try:
+        data = compute()
+        cache.set(key, data, timeout or settings.DASHBOARD_CACHE_TIMEOUT)
+        return data
+    finally:
+        cache.delete(lock)
@@ -0,0 +1,91 @@
+"""
+Transcription job events over Redis pub/sub.
+
+Every committed status transition is published as JSON on the owner's
+channel ``transcription-events:<user>`` (see signals.py), together with
+``progress`` events for the stages of ``process_transcription``. Long-poll status
+requests subscribe to it instead of re-querying; the event carries the full
+status row, so a woken request answers without touching the database.
+"""
+import json
+import logging
+import time
+import redis
+from django.conf import settings
+from .redis_client import get_redis
+from .status_cache import decode, encode
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = 'transcription-events:{user_id}'
+
+
+def enabled():
+    return settings.STATUS_EVENTS_ENABLED
+
+
+def channel(user_id):
+    return CHANNEL.format(user_id=user_id)
+
+
+def publish_status(row, user_id):
+    """Publish a STATUS_COLUMNS row as a ``status`` event."""
+    if not enabled():
+        return
+    payload = json.dumps({'type': 'status', **encode(row)})
+    try:
+        get_redis().publish(channel(user_id), payload)
+    except redis.RedisError as e:
+        logger.warning(f"Publishing status of transcription {row[0]} failed: {e}")
+
+
+def publish_progress(transcription_id, user_id, stage):
+    """Publish a ``progress`` event for a processing stage of a job."""
+    if not enabled():
+        return
+    payload = json.dumps({'type': 'progress', 'id': transcription_id, 'stage': stage})
+    try:
+        get_redis().publish(channel(user_id), payload)
+    except redis.RedisError as e:
+        logger.warning(f"Publishing progress of transcription {transcription_id} failed: {e}")
+
+
+class StatusListener:
+    """
+    Subscription to a user's job events.
+
+    Subscribe before reading the current status, then ``wait()``: a
+    transition that happens in between is still delivered.
+    """
+
+    def __init__(self, user_id):
+        self.user_id = user_id
+        self.pubsub = None
+
+    def __enter__(self):
+        self.pubsub = get_redis().pubsub(ignore_subscribe_messages=True)
+        self.pubsub.subscribe(channel(self.user_id))
+        return self
+
+    def __exit__(self, *exc_info):
+        self.pubsub.close()
+
+    def wait(self, pk, timeout):
+        """
+        Block until a status event for ``pk`` arrives.
+
+        Returns:
+            tuple: The new STATUS_COLUMNS row, or None after ``timeout`` seconds
+        """
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            message = self.pubsub.get_message(timeout=remaining)
+            if message is None:
+                continue
+            try:
+                event = json.loads(message['data'])
+            except (TypeError, ValueError):
+                continue
+            if event.get('type') == 'status' and str(event.get('id')) == str(pk):
+                return decode(event)
+        return None
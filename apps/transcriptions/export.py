@@ -0,0 +1,154 @@
+"""
+Streaming ZIP export of transcripts.
+
+``stream_archive`` yields the archive while it is being written: rows are
+read in ``EXPORT_CHUNK_SIZE`` keyset pages and every entry is compressed
+into a small buffer that is drained after each file. Memory therefore
+stays bounded by one page of rows, whether the archive holds 10 files or
+10,000. ``zipfile`` writes data descriptors when its output is not
+seekable, so no entry has to be revisited once sent.
+
+No cursor stays open between pages, so under ASGI the archive can be
+driven one step at a time from worker threads (``streams.iterate_async``).
+"""
+import io
+import json
+import logging
+import zipfile
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.text import slugify
+from . import fastpath, subtitles
+
+logger = logging.getLogger(__name__)
+
+# Everything the renderers read; text_archive_key backs full_text/full_segments
+EXPORT_COLUMNS = (
+    'id', 'title', 'status', 'language', 'model_name', 'duration_seconds',
+    'transcribed_text', 'text_archive_key', 'segments', 'created_at', 'completed_at',
+)
+
+
+class StreamBuffer(io.RawIOBase):
+    """Write-only, unseekable sink collecting the bytes written since the last drain."""
+
+    def __init__(self):
+        super().__init__()
+        self.chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def render_txt(transcription):
+    return transcription.full_text
+
+
+def render_subtitles(transcription, file_format):
+    segments = transcription.full_segments
+    if not segments:
+        # Transcribed before segments were stored: one cue for the recording
+        text = transcription.full_text.strip()
+        if not text:
+            return ''
+        segments = [{'start': 0, 'end': transcription.duration_seconds or 0, 'text': text}]
+    return ''.join(subtitles.render(segments, file_format))
+
+
+def render_srt(transcription):
+    return render_subtitles(transcription, 'srt')
+
+
+def render_vtt(transcription):
+    return render_subtitles(transcription, 'vtt')
+
+
+def render_json(transcription):
+    return json.dumps({
+        'id': transcription.id,
+        'title': transcription.title,
+        'status': transcription.status,
+        'language': transcription.language,
+        'model_name': transcription.model_name,
+        'duration_seconds': transcription.duration_seconds,
+        'created_at': fastpath.format_datetime(transcription.created_at),
+        'completed_at': fastpath.format_datetime(transcription.completed_at),
+        'text': transcription.full_text,
+        'segments': transcription.full_segments,
+    }, ensure_ascii=False, indent=2)
+
+
+FORMATS = {
+    'txt': render_txt,
+    'srt': render_srt,
+    'vtt': render_vtt,
+    'json': render_json,
+}
+
+
+def file_name(transcription, file_format):
+    # The id keeps names unique among equal titles
+    return f"{transcription.id}-{slugify(transcription.title) or 'untitled'}.{file_format}"
+
+
+def zip_info(name, when):
+    local = timezone.localtime(when or timezone.now())
+    info = zipfile.ZipInfo(name, date_time=local.timetuple()[:6])
+    info.compress_type = zipfile.ZIP_DEFLATED
+    return info
+
+
+def iter_rows(queryset):
+    """Yield the rows of ``queryset`` newest first, one keyset page per query."""
+    queryset = queryset.only(*EXPORT_COLUMNS).order_by('-created_at', '-id')
+    page = queryset
+    while True:
+        rows = list(page[:settings.EXPORT_CHUNK_SIZE])
+        yield from rows
+        if len(rows) < settings.EXPORT_CHUNK_SIZE:
+            return
+        last = rows[-1]
+        page = queryset.filter(
+            Q(created_at__lt=last.created_at) | Q(created_at=last.created_at, id__lt=last.id)
+        )
+
+
+def stream_archive(queryset, file_format):
+    """
+    Yield a ZIP archive with one ``file_format`` file per transcription.
+
+    Transcripts that cannot be rendered (unreadable cold-tier archive) are
+    listed in an ``errors.txt`` entry instead of failing the download
+    halfway.
+
+    Args:
+        queryset: Transcriptions to export, unsliced
+        file_format (str): Key of ``FORMATS``
+    """
+    render = FORMATS[file_format]
+    buffer = StreamBuffer()
+    failed = []
+    with zipfile.ZipFile(buffer, mode='w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for transcription in iter_rows(queryset):
+            try:
+                content = render(transcription)
+            except Exception as e:
+                logger.error(f"Exporting transcription {transcription.id} failed: {e}")
+                failed.append(transcription.id)
+                continue
+            archive.writestr(zip_info(file_name(transcription, file_format), transcription.created_at), content)
+            yield buffer.drain()
+        if failed:
+            lines = ''.join(f"{pk}\n" for pk in failed)
+            archive.writestr(zip_info('errors.txt', None), f"Transcriptions that could not be exported:\n{lines}")
+    yield buffer.drain()
@@ -0,0 +1,117 @@
+"""
+Serialization fast path for hot transcription endpoints.
+
+Builds response dicts directly from ``values_list()`` tuples instead of
+running DRF ``ModelSerializer`` field machinery per row. Output matches
+``TranscriptionSerializer`` field for field (see tests/test_fastpath.py).
+"""
+from django.utils import timezone
+
+DATETIME_FIELDS = ('created_at', 'updated_at', 'completed_at')
+
+# Serializer fields rendered straight from their column
+PLAIN_FIELDS = (
+    'id',
+    'title',
+    'file_size',
+    'duration_seconds',
+    'transcribed_text',
+    'status',
+    'error_message',
+    'language',
+    'model_name',
+)
+
+# Serializer fields the fast path can render; anything else (audio_file URLs)
+# falls back to the DRF serializer.
+SUPPORTED_FIELDS = frozenset(
+    PLAIN_FIELDS + DATETIME_FIELDS + ('user', 'is_processing', 'is_complete')
+)
+
+
+def format_datetime(value, tz=None):
+    """Render a datetime exactly like DRF's DateTimeField (ISO 8601, 'Z')."""
+    if value is None:
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(tz or timezone.get_current_timezone())
+    value = value.isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
+
+
+def supports(fields):
+    return all(name in SUPPORTED_FIELDS for name in fields)
+
+
+def columns_for(fields):
+    """Model columns to fetch with values_list() for the given fields."""
+    columns = []
+    for name in fields:
+        if name in ('is_processing', 'is_complete'):
+            name = 'status'
+        elif name == 'user':
+            continue
+        if name not in columns:
+            columns.append(name)
+    return columns
+
+
+def make_row_serializer(fields, user=None):
+    """
+    Build a function turning a values_list() tuple into a response dict.
+
+    Args:
+        fields (list): Serializer field names, in output order
+        user: Owner of every row; ``user`` renders as ``str(user)`` without a
+            per-row user fetch
+
+    Returns:
+        tuple: (columns to fetch, row -> dict function)
+    """
+    columns = columns_for(fields)
+    index = {column: i for i, column in enumerate(columns)}
+    user_repr = str(user) if user is not None else None
+    # Resolved once; the lookup goes through asgiref locals and is not cheap
+    tz = timezone.get_current_timezone()
+
+    getters = []
+    for name in fields:
+        if name in DATETIME_FIELDS:
+            i = index[name]
+            getters.append((name, lambda row, i=i: format_datetime(row[i], tz)))
+        elif name == 'is_processing':
+            i = index['status']
+            getters.append((name, lambda row, i=i: row[i] in ('pending', 'processing')))
+        elif name == 'is_complete':
+            i = index['status']
+            getters.append((name, lambda row, i=i: row[i] == 'completed'))
+        elif name == 'user':
+            getters.append((name, lambda row: user_repr))
+        else:
+            i = index[name]
+            getters.append((name, lambda row, i=i: row[i]))
+
+    def serialize(row):
+        return {name: getter(row) for name, getter in getters}
+
+    return columns, serialize
+
+
+STATUS_COLUMNS = ('id', 'status', 'created_at', 'updated_at', 'completed_at', 'error_message')
+
+
+def serialize_status(row):
+    """Status payload from a (id, status, created_at, updated_at, completed_at, error_message) row."""
+    pk, status, created_at, updated_at, completed_at, error_message = row
+    return {
+        'id': pk,
+        'status': status,
+        'created_at': created_at,
+        'updated_at': updated_at,
+        'completed_at': completed_at,
+        'error_message': error_message or '',
+        'is_processing': status in ('pending', 'processing'),
+        'is_complete': status == 'completed',
+    }
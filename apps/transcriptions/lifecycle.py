@@ -0,0 +1,179 @@
+"""
+Audio lifecycle management.
+
+Deletes audio of completed transcriptions whose owner enabled
+``auto_delete_audio``, or that are older than the global retention policy,
+and garbage-collects stored objects no transcription references any more.
+Both jobs checkpoint their progress so an interrupted pass resumes where it
+stopped.
+"""
+import logging
+from datetime import timedelta
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from . import conditional, status_cache
+from .models import MaintenanceCheckpoint, Transcription
+from .storage import delete_objects, iter_object_pages
+
+logger = logging.getLogger(__name__)
+
+PURGE_CHECKPOINT = 'audio_purge'
+ORPHAN_GC_CHECKPOINT = 'audio_orphan_gc'
+AUDIO_PREFIX = 'audio/'
+
+
+def purgeable_audio_queryset(now=None):
+    """Completed transcriptions that still reference an audio object."""
+    now = now or timezone.now()
+    policy = Q(user__transcription_settings__auto_delete_audio=True)
+    retention_days = settings.AUDIO_RETENTION_DAYS
+    if retention_days:
+        policy |= Q(completed_at__lt=now - timedelta(days=retention_days))
+    return (
+        Transcription.objects
+        .filter(status='completed', audio_file__isnull=False)
+        .exclude(audio_file='')
+        .filter(policy)
+    )
+
+
+def purge_audio(batch_size=None, max_batches=None):
+    """
+    Delete purgeable audio objects in batches and null out ``audio_file``.
+
+    Args:
+        batch_size (int): Rows handled per batch (one DeleteObjects call per 1000)
+        max_batches (int): Upper bound of batches for this run
+
+    Returns:
+        dict: Counts of deleted and failed objects and whether the pass finished
+    """
+    batch_size = batch_size or settings.AUDIO_PURGE_BATCH_SIZE
+    max_batches = max_batches or settings.AUDIO_PURGE_MAX_BATCHES
+    checkpoint = MaintenanceCheckpoint.load(PURGE_CHECKPOINT)
+    last_id = checkpoint.state.get('last_id', 0)
+    totals = {'deleted': 0, 'failed': 0, 'finished': False}
+
+    for _ in range(max_batches):
+        batch = list(
+            purgeable_audio_queryset()
+            .filter(id__gt=last_id)
+            .order_by('id')
+            .values_list('id', 'audio_file', 'user_id')[:batch_size]
+        )
+        if not batch:
+            totals['finished'] = True
+            last_id = 0
+            break
+
+        deleted, failed = delete_objects(name for _, name, _ in batch)
+        deleted = set(deleted)
+        purged = [(pk, user_id) for pk, name, user_id in batch if name in deleted]
+        if purged:
+            purged_ids = [pk for pk, _ in purged]
+            Transcription.objects.filter(id__in=purged_ids).update(
+                audio_file=None,
+                updated_at=timezone.now(),
+            )
+            conditional.invalidate(purged_ids, {user_id for _, user_id in purged})
+            status_cache.forget(purged_ids)
+        for name, error in failed.items():
+            logger.warning(f"Audio purge could not delete {name}: {error}")
+
+        totals['deleted'] += len(purged)
+        totals['failed'] += len(failed)
+        last_id = batch[-1][0]
+        checkpoint.save_state(last_id=last_id)
+
+        if len(batch) < batch_size:
+            totals['finished'] = True
+            last_id = 0
+            break
+
+    checkpoint.save_state(last_id=last_id)
+    logger.info(
+        f"Audio purge deleted {totals['deleted']} object(s), "
+        f"{totals['failed']} failed, finished={totals['finished']}"
+    )
+    return totals
+
+
+def collect_orphaned_audio(grace=None, max_pages=None, dry_run=False):
+    """
+    Delete stored audio objects that no Transcription references.
+
+    Objects are listed page by page (ListObjectsV2 on S3). Each page is
+    matched against the indexed ``audio_file`` column with a single
+    ``IN`` query; unreferenced objects older than the grace period are
+    deleted in one batch per page. The grace period protects uploads whose
+    row has not been committed yet.
+
+    Args:
+        grace (timedelta): Minimum object age before it may be deleted
+        max_pages (int): Upper bound of listing pages for this run
+        dry_run (bool): Only report what would be deleted
+
+    Returns:
+        dict: Report with scanned/orphaned/deleted counts and bytes reclaimed
+    """
+    grace = grace if grace is not None else settings.AUDIO_ORPHAN_GRACE
+    max_pages = max_pages or settings.AUDIO_ORPHAN_MAX_PAGES
+    cutoff = timezone.now() - grace
+    checkpoint = MaintenanceCheckpoint.load(ORPHAN_GC_CHECKPOINT)
+    start_after = checkpoint.state.get('start_after', '')
+    report = {
+        'scanned': 0,
+        'orphaned': 0,
+        'deleted': 0,
+        'failed': 0,
+        'bytes_reclaimed': 0,
+        'finished': True,
+        'dry_run': dry_run,
+    }
+    if not dry_run:
+        report.update(checkpoint.state.get('partial', {}))
+
+    pages = iter_object_pages(AUDIO_PREFIX, start_after=start_after)
+    for page_number, page in enumerate(pages):
+        if page_number >= max_pages:
+            report['finished'] = False
+            break
+
+        names = [name for name, _, _ in page]
+        referenced = set(
+            Transcription.objects
+            .filter(audio_file__in=names)
+            .values_list('audio_file', flat=True)
+        )
+        orphans = {
+            name: size for name, size, modified in page
+            if name not in referenced and modified < cutoff
+        }
+        report['scanned'] += len(page)
+        report['orphaned'] += len(orphans)
+
+        if orphans and not dry_run:
+            deleted, failed = delete_objects(list(orphans))
+            report['deleted'] += len(deleted)
+            report['failed'] += len(failed)
+            report['bytes_reclaimed'] += sum(orphans[name] for name in deleted)
+        elif dry_run:
+            report['bytes_reclaimed'] += sum(orphans.values())
+
+        start_after = names[-1]
+        if not dry_run:
+            partial = {k: v for k, v in report.items() if k not in ('finished', 'dry_run')}
+            checkpoint.save_state(start_after=start_after, partial=partial)
+
+    if not dry_run and report['finished']:
+        # Start over from the first key next time and keep the final report
+        checkpoint.save_state(last_report=report)
+
+    logger.info(
+        f"Orphaned audio GC scanned {report['scanned']} object(s), "
+        f"{report['orphaned']} orphaned, {report['deleted']} deleted, "
+        f"{report['bytes_reclaimed']} bytes reclaimed"
+        f"{' (dry run)' if dry_run else ''}"
+    )
+    return report
@@ -0,0 +1,222 @@
+"""
+Asynchronous email delivery through a persistent outbox.
+
+``OutboxEmailBackend`` is configured as ``EMAIL_BACKEND`` so every caller
+(``send_mail``, allauth confirmations, password resets, admin notifications)
+only writes an ``EmailOutbox`` row. The ``mail`` Celery queue drains those
+rows in batches over one reused connection of ``EMAIL_DELIVERY_BACKEND``.
+"""
+import base64
+import logging
+from datetime import timedelta
+from django.conf import settings
+from django.core.cache import cache
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.core.mail.backends.base import BaseEmailBackend
+from django.db import transaction
+from django.utils import timezone
+from .models import EmailOutbox
+from .outbox import enqueue_task
+
+logger = logging.getLogger(__name__)
+
+DRAIN_TASK = 'apps.transcriptions.tasks.send_queued_emails'
+DRAIN_SCHEDULED_KEY = 'email_outbox:drain_scheduled'
+
+
+def _serialize_attachments(message):
+    attachments = []
+    for attachment in message.attachments:
+        if not isinstance(attachment, tuple):
+            return None
+        filename, content, mimetype = attachment
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        attachments.append({
+            'filename': filename,
+            'content': base64.b64encode(content).decode('ascii'),
+            'mimetype': mimetype,
+        })
+    return attachments
+
+
+def build_message(entry, connection=None):
+    """Rebuild an EmailMultiAlternatives from an EmailOutbox row."""
+    message = EmailMultiAlternatives(
+        subject=entry.subject,
+        body=entry.body,
+        from_email=entry.from_email or None,
+        to=entry.to,
+        cc=entry.cc,
+        bcc=entry.bcc,
+        reply_to=entry.reply_to,
+        headers=entry.headers,
+        connection=connection,
+    )
+    for content, mimetype in entry.alternatives:
+        message.attach_alternative(content, mimetype)
+    for attachment in entry.attachments:
+        message.attach(
+            attachment['filename'],
+            base64.b64decode(attachment['content']),
+            attachment['mimetype'],
+        )
+    return message
+
+
+def schedule_drain():
+    """Trigger the mail queue after commit, at most once per short window."""
+    if cache.add(DRAIN_SCHEDULED_KEY, 1, timeout=settings.EMAIL_OUTBOX_DRAIN_DEBOUNCE):
+        enqueue_task(DRAIN_TASK, queue=settings.EMAIL_OUTBOX_QUEUE)
+
+
+class OutboxEmailBackend(BaseEmailBackend):
+    """Email backend that queues messages instead of talking to SMTP."""
+
+    def send_messages(self, email_messages):
+        if not email_messages:
+            return 0
+
+        entries, direct = [], []
+        for message in email_messages:
+            if not message.recipients():
+                continue
+            attachments = _serialize_attachments(message)
+            if attachments is None:
+                # MIME attachments cannot be persisted; deliver them inline.
+                direct.append(message)
+                continue
+            entries.append(EmailOutbox(
+                subject=str(message.subject),
+                body=str(message.body),
+                from_email=message.from_email or '',
+                to=list(message.to),
+                cc=list(message.cc),
+                bcc=list(message.bcc),
+                reply_to=list(message.reply_to),
+                headers=dict(message.extra_headers),
+                alternatives=[
+                    [str(content), mimetype]
+                    for content, mimetype in getattr(message, 'alternatives', [])
+                ],
+                attachments=attachments,
+            ))
+
+        queued = 0
+        try:
+            with transaction.atomic():
+                EmailOutbox.objects.bulk_create(entries)
+                queued = len(entries)
+                if queued:
+                    schedule_drain()
+        except Exception:
+            if not self.fail_silently:
+                raise
+            logger.exception("Failed to queue outgoing email")
+
+        if direct:
+            connection = get_connection(
+                settings.EMAIL_DELIVERY_BACKEND,
+                fail_silently=self.fail_silently,
+            )
+            queued += connection.send_messages(direct) or 0
+        return queued
+
+
+def _retry_delay(attempts):
+    base = settings.EMAIL_OUTBOX_RETRY_BASE_SECONDS
+    return timedelta(seconds=min(base * 2 ** (attempts - 1), 6 * 60 * 60))
+
+
+def _mark_failed_attempt(entry, error, now):
+    entry.attempts += 1
+    entry.last_error = str(error)[:1000]
+    if entry.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+        entry.status = 'failed'
+    else:
+        entry.next_attempt_at = now + _retry_delay(entry.attempts)
+
+
+def _record_failed_attempt(entry, error, now):
+    _mark_failed_attempt(entry, error, now)
+    EmailOutbox.objects.filter(id=entry.id).update(
+        status=entry.status,
+        attempts=entry.attempts,
+        last_error=entry.last_error,
+        next_attempt_at=entry.next_attempt_at,
+    )
+
+
+def claim_pending(batch_size, now):
+    """
+    Lease a batch of due rows to the calling worker.
+
+    The rows stay ``pending`` but their ``next_attempt_at`` moves
+    ``EMAIL_OUTBOX_LEASE_SECONDS`` ahead, so concurrent drains skip them
+    once this short transaction commits. A worker that dies mid-batch
+    leaves its rows to be retried when the lease expires.
+    """
+    with transaction.atomic():
+        entries = list(
+            EmailOutbox.objects.select_for_update(skip_locked=True)
+            .filter(status='pending', next_attempt_at__lte=now)
+            .order_by('id')[:batch_size]
+        )
+        if entries:
+            EmailOutbox.objects.filter(id__in=[entry.id for entry in entries]).update(
+                next_attempt_at=now + timedelta(seconds=settings.EMAIL_OUTBOX_LEASE_SECONDS),
+            )
+    return entries
+
+
+def deliver_pending(batch_size=None):
+    """
+    Deliver a batch of due EmailOutbox rows over a single connection.
+
+    Rows are leased in a short transaction and sent outside of it, so no
+    row lock or transaction is held across SMTP round-trips; each result
+    is recorded as soon as its message went out. Failed messages are
+    rescheduled with exponential backoff until
+    ``EMAIL_OUTBOX_MAX_ATTEMPTS`` is reached.
+
+    Returns:
+        dict: Counts of claimed, sent and failed messages
+    """
+    batch_size = batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE
+    now = timezone.now()
+    sent = failed = 0
+
+    entries = claim_pending(batch_size, now)
+    if not entries:
+        return {'claimed': 0, 'sent': 0, 'failed': 0}
+
+    connection = get_connection(settings.EMAIL_DELIVERY_BACKEND, fail_silently=False)
+    try:
+        connection.open()
+    except Exception as e:
+        logger.warning(f"Email outbox: cannot open mail connection: {e}")
+        for entry in entries:
+            _record_failed_attempt(entry, e, now)
+        failed = len(entries)
+    else:
+        try:
+            for entry in entries:
+                try:
+                    connection.send_messages([build_message(entry, connection)])
+                except Exception as e:
+                    _record_failed_attempt(entry, e, now)
+                    failed += 1
+                else:
+                    EmailOutbox.objects.filter(id=entry.id).update(
+                        status='sent',
+                        sent_at=timezone.now(),
+                        last_error='',
+                    )
+                    sent += 1
+        finally:
+            connection.close()
+
+    result = {'claimed': len(entries), 'sent': sent, 'failed': failed}
+    log = logger.warning if failed else logger.info
+    log(f"Email outbox delivered {result['sent']}/{result['claimed']} message(s)")
+    return result
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.9 on 2026-10-18 23:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transcriptions', '0003_alter_transcriptionsettings_backend_url'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskOutbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task_name', models.CharField(max_length=255)),
+                ('task_id', models.CharField(help_text='Celery task id used when publishing (idempotent re-sends)', max_length=36, unique=True)),
+                ('args', models.JSONField(blank=True, default=list)),
+                ('kwargs', models.JSONField(blank=True, default=dict)),
+                ('queue', models.CharField(blank=True, max_length=100)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Task Outbox Entry',
+                'verbose_name_plural': 'Task Outbox',
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['sent_at', 'id'], name='transcripti_sent_at_f4dd38_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.9 on 2026-10-18 23:58
+
+import django.core.validators
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transcriptions', '0005_email_outbox'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transcription',
+            name='notification_pending',
+            field=models.BooleanField(default=False, help_text='Completion not yet included in a digest email'),
+        ),
+        migrations.AddField(
+            model_name='transcriptionsettings',
+            name='digest_window_minutes',
+            field=models.PositiveIntegerField(default=15, help_text='Completions within this window are combined into one digest', validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(1440)]),
+        ),
+        migrations.AddField(
+            model_name='transcriptionsettings',
+            name='notification_mode',
+            field=models.CharField(choices=[('immediate', 'One email per transcription'), ('digest', 'Digest of completed transcriptions')], default='immediate', help_text='How completion emails are delivered', max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='transcription',
+            index=models.Index(condition=models.Q(('notification_pending', True)), fields=['user', 'completed_at'], name='transcription_digest_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-19 00:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transcriptions', '0007_maintenance_checkpoint'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='transcription',
+            name='audio_file',
+            field=models.FileField(blank=True, db_index=True, null=True, upload_to='audio/%Y/%m/'),
+        ),
+    ]
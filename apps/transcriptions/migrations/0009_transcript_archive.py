@@ -0,0 +1,23 @@
+# Generated by Django 5.2.9 on 2026-10-19 00:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transcriptions', '0008_index_audio_file'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transcription',
+            name='text_archive_key',
+            field=models.CharField(blank=True, help_text='Storage name of the zstd-compressed full text', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='transcription',
+            name='text_archived_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
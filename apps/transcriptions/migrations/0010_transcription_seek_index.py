@@ -0,0 +1,19 @@
+# Generated by Django 5.2.9 on 2026-10-19 00:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transcriptions', '0009_transcript_archive'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transcription',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='transcription_user_seek_idx'),
+        ),
+    ]
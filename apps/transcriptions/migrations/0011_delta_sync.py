@@ -0,0 +1,47 @@
+# Generated by Django 5.2.9 on 2026-10-19 00:23
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transcriptions', '0010_transcription_seek_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranscriptionTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('transcription_id', models.BigIntegerField()),
+                ('deleted_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': 'Transcription Tombstone',
+                'verbose_name_plural': 'Transcription Tombstones',
+                'ordering': ['deleted_at', 'id'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='transcription',
+            index=models.Index(fields=['user', 'updated_at', 'id'], name='transcription_user_changes_idx'),
+        ),
+        migrations.AddField(
+            model_name='transcriptiontombstone',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='transcriptiontombstone',
+            index=models.Index(fields=['user', 'deleted_at', 'id'], name='transcripti_user_id_033670_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transcriptiontombstone',
+            index=models.Index(fields=['deleted_at'], name='transcripti_deleted_71ead6_idx'),
+        ),
+    ]
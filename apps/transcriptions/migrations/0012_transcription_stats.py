@@ -0,0 +1,34 @@
+# Generated by Django 5.2.9 on 2026-10-19 00:25
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transcriptions', '0011_delta_sync'),
+        ('users', '__first__'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranscriptionStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='transcription_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('total_transcriptions', models.PositiveIntegerField(default=0)),
+                ('total_duration_seconds', models.BigIntegerField(default=0)),
+                ('total_file_size_bytes', models.BigIntegerField(default=0)),
+                ('status_counts', models.JSONField(blank=True, default=dict)),
+                ('language_counts', models.JSONField(blank=True, default=dict)),
+                ('model_counts', models.JSONField(blank=True, default=dict)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('reconciled_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Transcription Stats',
+                'verbose_name_plural': 'Transcription Stats',
+            },
+        ),
+    ]
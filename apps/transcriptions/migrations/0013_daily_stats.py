@@ -0,0 +1,56 @@
+# Generated by Django 5.2.9 on 2026-10-19 00:28
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+
+def backfill_daily_stats(apps, schema_editor):
+    Transcription = apps.get_model('transcriptions', 'Transcription')
+    TranscriptionDailyStats = apps.get_model('transcriptions', 'TranscriptionDailyStats')
+    days = (
+        Transcription.objects
+        .annotate(day=TruncDate('created_at', tzinfo=timezone.get_default_timezone()))
+        .values_list('user_id', 'day')
+        .annotate(count=Count('id'), total_duration=Sum('duration_seconds'))
+        .order_by()
+    )
+    batch = []
+    for user_id, day, count, total_duration in days.iterator(chunk_size=2000):
+        batch.append(TranscriptionDailyStats(
+            user_id=user_id, date=day, count=count, total_duration=total_duration or 0,
+        ))
+        if len(batch) >= 2000:
+            TranscriptionDailyStats.objects.bulk_create(batch)
+            batch = []
+    TranscriptionDailyStats.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transcriptions', '0012_transcription_stats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranscriptionDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('count', models.IntegerField(default=0)),
+                ('total_duration', models.BigIntegerField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Transcription Daily Stats',
+                'verbose_name_plural': 'Transcription Daily Stats',
+                'constraints': [models.UniqueConstraint(fields=('user', 'date'), name='transcription_daily_stats_unique')],
+            },
+        ),
+        migrations.RunPython(backfill_daily_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.9 on 2026-10-19 00:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transcriptions', '0013_daily_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OpsMetricsBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('resolution', models.CharField(choices=[('minute', 'Minute'), ('hour', 'Hour'), ('day', 'Day')], max_length=10)),
+                ('start', models.DateTimeField()),
+                ('submissions', models.PositiveIntegerField(default=0)),
+                ('completions', models.PositiveIntegerField(default=0)),
+                ('failures', models.PositiveIntegerField(default=0)),
+                ('audio_seconds', models.BigIntegerField(default=0)),
+                ('latency_sum_seconds', models.FloatField(default=0)),
+                ('latency_histogram', models.JSONField(blank=True, default=dict, help_text='Completions per latency bucket upper bound in seconds')),
+            ],
+            options={
+                'verbose_name': 'Ops Metrics Bucket',
+                'verbose_name_plural': 'Ops Metrics',
+                'ordering': ['resolution', 'start'],
+                'constraints': [models.UniqueConstraint(fields=('resolution', 'start'), name='ops_metrics_bucket_unique')],
+            },
+        ),
+    ]
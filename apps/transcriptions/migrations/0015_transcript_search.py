@@ -0,0 +1,68 @@
+# Generated by Django 5.2.9 on 2026-10-19 00:36
+
+import django.contrib.postgres.search
+from django.conf import settings
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import Case, CharField, Max, Value, When
+
+# GIN is PostgreSQL-only, so the index is not part of the model state
+# (SQLite would fail to recreate it whenever it rebuilds the table)
+CREATE_INDEX = (
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS transcription_search_idx '
+    'ON transcriptions_transcription USING gin (search_vector)'
+)
+DROP_INDEX = 'DROP INDEX CONCURRENTLY IF EXISTS transcription_search_idx'
+
+
+def backfill_search_vectors(apps, schema_editor):
+    # Archived rows only keep a preview here; the index_archived_transcripts
+    # task indexes them from storage
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    Transcription = apps.get_model('transcriptions', 'Transcription')
+    config = Case(
+        When(language__istartswith='de', then=Value('german')),
+        When(language__istartswith='en', then=Value('english')),
+        default=Value('simple'),
+        output_field=CharField(),
+    )
+    vector = (
+        SearchVector('title', weight='A', config=config)
+        + SearchVector('transcribed_text', weight='B', config=config)
+    )
+    last_id = Transcription.objects.aggregate(last=Max('id'))['last'] or 0
+    for start in range(0, last_id, 5000):
+        Transcription.objects.filter(
+            id__gt=start, id__lte=start + 5000, text_archive_key='',
+        ).update(search_vector=vector)
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(CREATE_INDEX)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(DROP_INDEX)
+
+
+class Migration(migrations.Migration):
+    # The index is built concurrently, outside a transaction
+    atomic = False
+
+    dependencies = [
+        ('transcriptions', '0014_ops_metrics'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transcription',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_search_vectors, migrations.RunPython.noop),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.9 on 2026-10-19 00:38
+
+from django.db import migrations
+
+# Trigrams of UPPER(title) serve icontains/istartswith (admin search,
+# autocomplete) and word-similarity matches. PostgreSQL only, so the index
+# is not part of the model state.
+CREATE_INDEX = (
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS transcription_title_trgm_idx '
+    'ON transcriptions_transcription USING gin (UPPER(title) gin_trgm_ops)'
+)
+DROP_INDEX = 'DROP INDEX CONCURRENTLY IF EXISTS transcription_title_trgm_idx'
+
+
+def create_title_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        schema_editor.execute(CREATE_INDEX)
+
+
+def drop_title_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(DROP_INDEX)
+
+
+class Migration(migrations.Migration):
+    # The index is built concurrently, outside a transaction
+    atomic = False
+
+    dependencies = [
+        ('transcriptions', '0015_transcript_search'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_title_index, drop_title_index),
+    ]
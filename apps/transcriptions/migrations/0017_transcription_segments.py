@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-19 00:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transcriptions', '0016_title_trigram'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transcription',
+            name='segments',
+            field=models.JSONField(blank=True, default=list, help_text='Timestamped segments [{start, end, text}] for subtitles'),
+        ),
+    ]
@@ -1,5 +1,8 @@
+from django.contrib.postgres.search import SearchVectorField
+from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 
 
 class Transcription(models.Model):
@@ -15,7 +18,8 @@ class Transcription(models.Model):
     audio_file = models.FileField(
         upload_to='audio/%Y/%m/',
         null=True,
-        blank=True
+        blank=True,
+        db_index=True
     )
     file_size = models.BigIntegerField(
         null=True,
@@ -31,6 +35,22 @@ class Transcription(models.Model):
     # Transkription
     title = models.CharField(max_length=255, blank=True)
     transcribed_text = models.TextField(blank=True)
+    segments = models.JSONField(
+        default=list,
+        blank=True,
+        help_text="Timestamped segments [{start, end, text}] for subtitles"
+    )
+    
+    # Cold-tier archive (transcribed_text then only holds a preview)
+    text_archive_key = models.CharField(
+        max_length=255,
+        blank=True,
+        help_text="Storage name of the zstd-compressed full text"
+    )
+    text_archived_at = models.DateTimeField(null=True, blank=True)
+    
+    # Full-text search (PostgreSQL only, maintained by search.py)
+    search_vector = SearchVectorField(null=True, editable=False)
     
     # Processing Status
     STATUS_CHOICES = [
@@ -71,11 +91,33 @@ class Transcription(models.Model):
         help_text="When transcription was completed"
     )
     
+    # Notifications
+    notification_pending = models.BooleanField(
+        default=False,
+        help_text="Completion not yet included in a digest email"
+    )
+    
     class Meta:
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['user', 'status']),
             models.Index(fields=['status', 'created_at']),
+            models.Index(
+                fields=['user', '-created_at', '-id'],
+                name='transcription_user_seek_idx',
+            ),
+            models.Index(
+                fields=['user', 'completed_at'],
+                condition=models.Q(notification_pending=True),
+                name='transcription_digest_idx',
+            ),
+            models.Index(
+                fields=['user', 'updated_at', 'id'],
+                name='transcription_user_changes_idx',
+            ),
+            # PostgreSQL-only GIN indexes are created by migrations 0015
+            # (search_vector) and 0016 (trigrams of UPPER(title)); keeping
+            # them out of the model state lets SQLite rebuild the table
         ]
         verbose_name = 'Transcription'
         verbose_name_plural = 'Transcriptions'
@@ -90,6 +132,145 @@ class Transcription(models.Model):
     @property
     def is_complete(self):
         return self.status == 'completed'
+    
+    @property
+    def is_text_archived(self):
+        return bool(self.text_archive_key)
+    
+    @property
+    def full_text(self):
+        """Transcribed text, rehydrated from the archive if necessary."""
+        if not self.text_archive_key:
+            return self.transcribed_text
+        from .archive import load_archived_text
+        return load_archived_text(self.text_archive_key)
+
+    @property
+    def full_segments(self):
+        """Timestamped segments, rehydrated from the archive if necessary."""
+        if not self.text_archive_key:
+            return self.segments
+        from .archive import load_archived_segments
+        return load_archived_segments(self.text_archive_key)
+
+
+class TranscriptionTombstone(models.Model):
+    """Marker of a deleted transcription for delta sync (see sync.py)."""
+    
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='+'
+    )
+    transcription_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(default=timezone.now)
+    
+    class Meta:
+        ordering = ['deleted_at', 'id']
+        indexes = [
+            models.Index(fields=['user', 'deleted_at', 'id']),
+            models.Index(fields=['deleted_at']),
+        ]
+        verbose_name = 'Transcription Tombstone'
+        verbose_name_plural = 'Transcription Tombstones'
+    
+    def __str__(self):
+        return f"Transcription {self.transcription_id} deleted at {self.deleted_at}"
+
+
+class TranscriptionStats(models.Model):
+    """Per-user totals behind the stats endpoint, maintained by rollups.py."""
+    
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='transcription_stats'
+    )
+    total_transcriptions = models.PositiveIntegerField(default=0)
+    total_duration_seconds = models.BigIntegerField(default=0)
+    total_file_size_bytes = models.BigIntegerField(default=0)
+    status_counts = models.JSONField(default=dict, blank=True)
+    language_counts = models.JSONField(default=dict, blank=True)
+    model_counts = models.JSONField(default=dict, blank=True)
+    
+    updated_at = models.DateTimeField(auto_now=True)
+    reconciled_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        verbose_name = 'Transcription Stats'
+        verbose_name_plural = 'Transcription Stats'
+    
+    def __str__(self):
+        return f"Stats for user {self.user_id}: {self.total_transcriptions} transcriptions"
+
+
+class TranscriptionDailyStats(models.Model):
+    """Transcriptions created per user and day (TIME_ZONE), behind the timeline."""
+    
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='+'
+    )
+    date = models.DateField()
+    count = models.IntegerField(default=0)
+    total_duration = models.BigIntegerField(default=0)
+    
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'date'], name='transcription_daily_stats_unique'),
+        ]
+        verbose_name = 'Transcription Daily Stats'
+        verbose_name_plural = 'Transcription Daily Stats'
+    
+    def __str__(self):
+        return f"{self.date}: {self.count} transcriptions (user {self.user_id})"
+
+
+class OpsMetricsBucket(models.Model):
+    """Platform-wide job counters per minute, hour or day (see ops_metrics.py)."""
+    
+    RESOLUTION_CHOICES = [
+        ('minute', 'Minute'),
+        ('hour', 'Hour'),
+        ('day', 'Day'),
+    ]
+    resolution = models.CharField(max_length=10, choices=RESOLUTION_CHOICES)
+    start = models.DateTimeField()
+    
+    submissions = models.PositiveIntegerField(default=0)
+    completions = models.PositiveIntegerField(default=0)
+    failures = models.PositiveIntegerField(default=0)
+    audio_seconds = models.BigIntegerField(default=0)
+    
+    # Queue-to-completion latency of the completions
+    latency_sum_seconds = models.FloatField(default=0)
+    latency_histogram = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Completions per latency bucket upper bound in seconds"
+    )
+    
+    class Meta:
+        ordering = ['resolution', 'start']
+        constraints = [
+            models.UniqueConstraint(fields=['resolution', 'start'], name='ops_metrics_bucket_unique'),
+        ]
+        verbose_name = 'Ops Metrics Bucket'
+        verbose_name_plural = 'Ops Metrics'
+    
+    def __str__(self):
+        return f"{self.resolution} {self.start:%Y-%m-%d %H:%M}"
+    
+    @property
+    def failure_rate(self):
+        finished = self.completions + self.failures
+        return round(self.failures / finished, 4) if finished else None
+    
+    @property
+    def avg_latency_seconds(self):
+        return round(self.latency_sum_seconds / self.completions, 2) if self.completions else None
 
 
 class TranscriptionSettings(models.Model):
@@ -129,6 +310,21 @@ class TranscriptionSettings(models.Model):
         default=True,
         help_text="Send email when transcription is complete"
     )
+    NOTIFICATION_MODE_CHOICES = [
+        ('immediate', 'One email per transcription'),
+        ('digest', 'Digest of completed transcriptions'),
+    ]
+    notification_mode = models.CharField(
+        max_length=20,
+        choices=NOTIFICATION_MODE_CHOICES,
+        default='immediate',
+        help_text="How completion emails are delivered"
+    )
+    digest_window_minutes = models.PositiveIntegerField(
+        default=15,
+        validators=[MinValueValidator(1), MaxValueValidator(24 * 60)],
+        help_text="Completions within this window are combined into one digest"
+    )
     auto_delete_audio = models.BooleanField(
         default=False,
         help_text="Automatically delete audio file after transcription"
@@ -144,3 +340,125 @@ class TranscriptionSettings(models.Model):
     
     def __str__(self):
         return f"Settings for {self.user.email}"
+
+
+class TaskOutbox(models.Model):
+    """Celery task message written in the same transaction as the domain change.
+
+    Rows are published to the broker by the outbox relay after commit, so
+    workers never see ids of uncommitted rows and a broker outage does not
+    lose messages.
+    """
+    
+    task_name = models.CharField(max_length=255)
+    task_id = models.CharField(
+        max_length=36,
+        unique=True,
+        help_text="Celery task id used when publishing (idempotent re-sends)"
+    )
+    args = models.JSONField(default=list, blank=True)
+    kwargs = models.JSONField(default=dict, blank=True)
+    queue = models.CharField(max_length=100, blank=True)
+    
+    # Delivery state
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['sent_at', 'id']),
+        ]
+        verbose_name = 'Task Outbox Entry'
+        verbose_name_plural = 'Task Outbox'
+    
+    def __str__(self):
+        state = 'sent' if self.sent_at else 'pending'
+        return f"{self.task_name} [{self.task_id}] ({state})"
+    
+    @property
+    def is_sent(self):
+        return self.sent_at is not None
+
+
+class EmailOutbox(models.Model):
+    """Outgoing email persisted for asynchronous delivery by the mail queue."""
+    
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('sent', 'Sent'),
+        ('failed', 'Failed'),
+    ]
+    
+    # Message
+    subject = models.TextField(blank=True)
+    body = models.TextField(blank=True)
+    from_email = models.CharField(max_length=255, blank=True)
+    to = models.JSONField(default=list, blank=True)
+    cc = models.JSONField(default=list, blank=True)
+    bcc = models.JSONField(default=list, blank=True)
+    reply_to = models.JSONField(default=list, blank=True)
+    headers = models.JSONField(default=dict, blank=True)
+    alternatives = models.JSONField(
+        default=list,
+        blank=True,
+        help_text="List of [content, mimetype] pairs"
+    )
+    attachments = models.JSONField(
+        default=list,
+        blank=True,
+        help_text="List of {filename, content (base64), mimetype} objects"
+    )
+    
+    # Delivery state
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default='pending'
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+        verbose_name = 'Email Outbox Entry'
+        verbose_name_plural = 'Email Outbox'
+    
+    def __str__(self):
+        return f"{self.subject[:50]} -> {', '.join(self.to)} ({self.status})"
+
+
+class MaintenanceCheckpoint(models.Model):
+    """Resumable progress marker for long-running maintenance jobs."""
+    
+    job = models.CharField(max_length=100, unique=True)
+    state = models.JSONField(default=dict, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = 'Maintenance Checkpoint'
+        verbose_name_plural = 'Maintenance Checkpoints'
+    
+    def __str__(self):
+        return f"{self.job}: {self.state}"
+    
+    @classmethod
+    def load(cls, job):
+        obj, _ = cls.objects.get_or_create(job=job)
+        return obj
+    
+    def save_state(self, **state):
+        self.state = state
+        self.save(update_fields=['state', 'updated_at'])
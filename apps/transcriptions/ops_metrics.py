@@ -0,0 +1,203 @@
+"""
+Platform-wide operational metrics in minute, hour and day buckets.
+
+Job transitions (see signals.py) increment the current minute bucket:
+submissions, completions, failures, audio seconds and a histogram of the
+queue-to-completion latency. ``rollup`` rebuilds the recent hour and day
+buckets from the finer ones and prunes old minutes and hours, so a query
+over any range reads at most a few hundred bucket rows instead of
+aggregating the ``Transcription`` table.
+"""
+import logging
+from datetime import datetime, timedelta
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from .models import MaintenanceCheckpoint, OpsMetricsBucket
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_CHECKPOINT = 'ops_metrics_rollup'
+
+RESOLUTIONS = {
+    'minute': timedelta(minutes=1),
+    'hour': timedelta(hours=1),
+    'day': timedelta(days=1),
+}
+# Histogram bucket upper bounds in seconds; 'inf' takes the rest
+LATENCY_BOUNDS = (10, 30, 60, 120, 300, 600, 1800, 3600)
+COUNTERS = ('submissions', 'completions', 'failures', 'audio_seconds', 'latency_sum_seconds')
+
+
+def floor(value, resolution):
+    value = value.astimezone(timezone.get_default_timezone())
+    if resolution == 'minute':
+        return value.replace(second=0, microsecond=0)
+    if resolution == 'hour':
+        return value.replace(minute=0, second=0, microsecond=0)
+    return value.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def latency_bucket(seconds):
+    for bound in LATENCY_BOUNDS:
+        if seconds <= bound:
+            return str(bound)
+    return 'inf'
+
+
+def merge_histograms(histograms):
+    merged = {}
+    for histogram in histograms:
+        for bound, count in histogram.items():
+            merged[bound] = merged.get(bound, 0) + count
+    return merged
+
+
+def record(at=None, submissions=0, completions=0, failures=0, audio_seconds=0, latency=None):
+    """Add to the minute bucket containing ``at`` (default now)."""
+    start = floor(at or timezone.now(), 'minute')
+    with transaction.atomic():
+        bucket = OpsMetricsBucket.objects.select_for_update().filter(resolution='minute', start=start).first()
+        if bucket is None:
+            try:
+                with transaction.atomic():
+                    bucket = OpsMetricsBucket.objects.create(resolution='minute', start=start)
+            except IntegrityError:
+                # Created concurrently
+                bucket = OpsMetricsBucket.objects.select_for_update().get(resolution='minute', start=start)
+        bucket.submissions += submissions
+        bucket.completions += completions
+        bucket.failures += failures
+        bucket.audio_seconds += audio_seconds
+        if latency is not None:
+            bucket.latency_sum_seconds += latency
+            bound = latency_bucket(latency)
+            bucket.latency_histogram[bound] = bucket.latency_histogram.get(bound, 0) + 1
+        bucket.save()
+
+
+def record_transition(transcription, previous_status, status, created):
+    """Count a submission, completion or failure after commit."""
+    if created:
+        events = {'submissions': 1}
+    elif status == previous_status:
+        return
+    elif status == 'completed':
+        finished_at = transcription.completed_at or timezone.now()
+        events = {
+            'completions': 1,
+            'audio_seconds': transcription.duration_seconds or 0,
+            'latency': max((finished_at - transcription.created_at).total_seconds(), 0),
+        }
+    elif status == 'failed':
+        events = {'failures': 1}
+    else:
+        return
+
+    def write():
+        try:
+            record(**events)
+        except Exception as e:
+            # Metrics must never fail a job transition
+            logger.warning(f"Recording ops metrics failed: {e}")
+
+    transaction.on_commit(write)
+
+
+def rebuild(resolution, start):
+    """Recompute one hour or day bucket from the next finer resolution."""
+    finer = 'minute' if resolution == 'hour' else 'hour'
+    parts = list(OpsMetricsBucket.objects.filter(
+        resolution=finer, start__gte=start, start__lt=start + RESOLUTIONS[resolution],
+    ))
+    values = {name: sum(getattr(part, name) for part in parts) for name in COUNTERS}
+    values['latency_histogram'] = merge_histograms(part.latency_histogram for part in parts)
+    OpsMetricsBucket.objects.update_or_create(resolution=resolution, start=start, defaults=values)
+
+
+def rollup(now=None):
+    """
+    Rebuild the hour and day buckets touched since the last run, prune old rows.
+
+    Rebuilding is idempotent, so runs may overlap or be skipped.
+
+    Returns:
+        dict: Counts of rebuilt and pruned buckets
+    """
+    now = now or timezone.now()
+    checkpoint = MaintenanceCheckpoint.load(ROLLUP_CHECKPOINT)
+    since = now - RESOLUTIONS['hour']
+    if checkpoint.state.get('last_run'):
+        last_run = datetime.fromisoformat(checkpoint.state['last_run'])
+        # Older minutes are pruned, so they cannot be rebuilt from anyway
+        since = max(min(last_run, since), now - settings.OPS_METRICS_MINUTE_RETENTION)
+
+    rebuilt = 0
+    for resolution in ('hour', 'day'):
+        start = floor(since, resolution)
+        while start <= now:
+            rebuild(resolution, start)
+            rebuilt += 1
+            start = floor(start + RESOLUTIONS[resolution], resolution)
+
+    pruned = 0
+    for resolution, retention in (
+        ('minute', settings.OPS_METRICS_MINUTE_RETENTION),
+        ('hour', settings.OPS_METRICS_HOUR_RETENTION),
+    ):
+        deleted, _ = OpsMetricsBucket.objects.filter(
+            resolution=resolution, start__lt=now - retention,
+        ).delete()
+        pruned += deleted
+    checkpoint.save_state(last_run=now.isoformat())
+    return {'rebuilt': rebuilt, 'pruned': pruned}
+
+
+def pick_resolution(start, end):
+    """Coarsest resolution that still gives useful detail, within retention."""
+    now = timezone.now()
+    span = end - start
+    if span <= timedelta(hours=6) and start >= now - settings.OPS_METRICS_MINUTE_RETENTION:
+        return 'minute'
+    if span <= timedelta(days=14) and start >= now - settings.OPS_METRICS_HOUR_RETENTION:
+        return 'hour'
+    return 'day'
+
+
+def summarize(buckets):
+    completions = sum(bucket['completions'] for bucket in buckets)
+    failures = sum(bucket['failures'] for bucket in buckets)
+    latency_sum = sum(bucket['latency_sum_seconds'] for bucket in buckets)
+    return {
+        'submissions': sum(bucket['submissions'] for bucket in buckets),
+        'completions': completions,
+        'failures': failures,
+        'failure_rate': round(failures / (completions + failures), 4) if completions + failures else None,
+        'audio_seconds': sum(bucket['audio_seconds'] for bucket in buckets),
+        'avg_latency_seconds': round(latency_sum / completions, 2) if completions else None,
+        'latency_histogram': merge_histograms(bucket['latency_histogram'] for bucket in buckets),
+    }
+
+
+def query(start, end, resolution=None):
+    """
+    Buckets and totals between ``start`` and ``end``.
+
+    Returns:
+        dict: ``resolution``, ``buckets`` (oldest first) and ``totals``
+    """
+    resolution = resolution or pick_resolution(start, end)
+    rows = OpsMetricsBucket.objects.filter(
+        resolution=resolution, start__gte=floor(start, resolution), start__lt=end,
+    ).order_by('start').values('start', *COUNTERS, 'latency_histogram')
+    buckets = []
+    for row in rows:
+        finished = row['completions'] + row['failures']
+        buckets.append({
+            **row,
+            'failure_rate': round(row['failures'] / finished, 4) if finished else None,
+            'avg_latency_seconds': (
+                round(row['latency_sum_seconds'] / row['completions'], 2) if row['completions'] else None
+            ),
+        })
+    return {'resolution': resolution, 'buckets': buckets, 'totals': summarize(buckets)}
@@ -0,0 +1,140 @@
+"""
+Transactional outbox for Celery tasks.
+
+Tasks are written to ``TaskOutbox`` inside the caller's transaction and only
+published to the broker once that transaction has committed. A relay drains
+pending rows in bulk over a single producer connection and marks them sent.
+"""
+import logging
+import time
+import uuid
+from celery import current_app
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from .models import TaskOutbox
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_task(task, *args, queue='', **kwargs):
+    """
+    Record a Celery task in the outbox as part of the current transaction.
+
+    Args:
+        task: Celery task object or registered task name
+        *args, **kwargs: Arguments passed to the task (must be JSON-serializable)
+        queue (str): Optional target queue
+
+    Returns:
+        TaskOutbox: The pending outbox entry
+    """
+    task_name = task if isinstance(task, str) else task.name
+    entry = TaskOutbox.objects.create(
+        task_name=task_name,
+        task_id=str(uuid.uuid4()),
+        args=list(args),
+        kwargs=kwargs,
+        queue=queue,
+    )
+
+    # Fast path: publish right after commit. If the broker is unavailable the
+    # row stays pending and the periodic relay picks it up.
+    transaction.on_commit(lambda: _publish_after_commit(entry.id))
+    return entry
+
+
+def _publish_after_commit(entry_id):
+    try:
+        relay_pending(ids=[entry_id])
+    except Exception as e:
+        logger.warning(f"Immediate outbox publish for entry {entry_id} failed: {e}")
+
+
+def relay_pending(batch_size=None, ids=None):
+    """
+    Publish pending outbox rows to the broker and mark them as sent.
+
+    Rows are locked with SKIP LOCKED so concurrent relays never publish the
+    same row twice. Delivery is still at least once: a crash or failed
+    commit after ``send_task`` leaves the row pending and it is published
+    again (with the same task id, which Celery does not deduplicate). Tasks
+    must therefore be idempotent; ``process_transcription`` only claims a
+    job that is still pending.
+
+    Args:
+        batch_size (int): Maximum number of rows to publish in one pass
+        ids (list): Restrict the pass to these outbox ids
+
+    Returns:
+        dict: Counts of published/failed rows plus latency/throughput metrics
+    """
+    batch_size = batch_size or settings.TASK_OUTBOX_BATCH_SIZE
+    started = time.monotonic()
+    published, failed = [], []
+    lags = []
+
+    with transaction.atomic():
+        pending = TaskOutbox.objects.select_for_update(skip_locked=True).filter(
+            sent_at__isnull=True
+        )
+        if ids is not None:
+            pending = pending.filter(id__in=ids)
+        entries = list(pending.order_by('id')[:batch_size])
+        if not entries:
+            return {'published': 0, 'failed': 0}
+
+        now = timezone.now()
+        with current_app.producer_or_acquire() as producer:
+            for entry in entries:
+                options = {'task_id': entry.task_id, 'producer': producer}
+                if entry.queue:
+                    options['queue'] = entry.queue
+                try:
+                    current_app.send_task(
+                        entry.task_name,
+                        args=entry.args,
+                        kwargs=entry.kwargs,
+                        **options
+                    )
+                except Exception as e:
+                    entry.attempts += 1
+                    entry.last_error = str(e)[:500]
+                    failed.append(entry)
+                    continue
+                published.append(entry.id)
+                lags.append((now - entry.created_at).total_seconds())
+
+        sent_at = timezone.now()
+        if published:
+            TaskOutbox.objects.filter(id__in=published).update(sent_at=sent_at)
+        if failed:
+            TaskOutbox.objects.bulk_update(failed, ['attempts', 'last_error'])
+
+    elapsed = time.monotonic() - started
+    result = {
+        'published': len(published),
+        'failed': len(failed),
+        'duration_ms': round(elapsed * 1000, 2),
+        'throughput_per_sec': round(len(published) / elapsed, 2) if elapsed else 0,
+        'max_lag_seconds': round(max(lags), 3) if lags else 0,
+        'avg_lag_seconds': round(sum(lags) / len(lags), 3) if lags else 0,
+    }
+    log = logger.warning if failed else logger.info
+    log(
+        f"Outbox relay published {result['published']} task(s), "
+        f"{result['failed']} failed in {result['duration_ms']}ms "
+        f"({result['throughput_per_sec']}/s, max lag {result['max_lag_seconds']}s)"
+    )
+    return result
+
+
+def purge_sent(older_than=None):
+    """Delete outbox rows that were published before ``older_than``."""
+    if older_than is None:
+        older_than = timezone.now() - settings.TASK_OUTBOX_RETENTION
+    deleted, _ = TaskOutbox.objects.filter(
+        sent_at__isnull=False,
+        sent_at__lt=older_than,
+    ).delete()
+    return deleted
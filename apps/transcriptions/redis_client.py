@@ -0,0 +1,38 @@
+"""
+Shared Redis connection for the status cache and job events.
+
+The Django cache API has no hashes, sets or pub/sub, so these features talk
+to Redis directly through one lazily created, process-wide client.
+"""
+import redis
+import redis.asyncio
+from django.conf import settings
+
+_client = None
+
+
+def get_redis():
+    """Return the process-wide Redis client (str responses)."""
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        )
+    return _client
+
+
+def create_async_redis():
+    """
+    Return a new asyncio Redis client.
+
+    Async clients are bound to the event loop they are used on, so callers
+    keep one per loop instead of sharing a module-level instance.
+    """
+    return redis.asyncio.Redis.from_url(
+        settings.REDIS_URL,
+        decode_responses=True,
+        socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+    )
@@ -0,0 +1,341 @@
+"""
+Incrementally maintained statistics rollups.
+
+``TranscriptionStats`` holds one row per user with the totals and the
+per-status/language/model counts of the stats endpoint. Saves and deletes
+apply the difference between a transcription's old and new contribution
+under a row lock (see signals.py), so reading the stats is a primary key
+lookup instead of six passes over the user's history.
+
+``TranscriptionDailyStats`` holds per-user, per-day counts and durations
+(days in ``TIME_ZONE``) for the timeline, bumped with ``F()`` updates.
+
+Changes that bypass ``save()`` (``QuerySet.update()``, raw SQL) and lost
+races are corrected by ``reconcile``, run periodically by Celery.
+"""
+import logging
+from collections import defaultdict
+from datetime import timedelta
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from .models import Transcription, TranscriptionDailyStats, TranscriptionStats
+
+logger = logging.getLogger(__name__)
+
+# Columns a transcription contributes to its owner's stats
+STATS_FIELDS = ('status', 'language', 'model_name', 'duration_seconds', 'file_size', 'created_at')
+
+COUNT_MAPS = {
+    'status': 'status_counts',
+    'language': 'language_counts',
+    'model_name': 'model_counts',
+}
+
+
+def contribution(values):
+    """Stats contribution of a STATS_FIELDS tuple."""
+    return dict(zip(STATS_FIELDS, values))
+
+
+def current_contribution(instance):
+    """Contribution of an instance, or None if a stats column is deferred."""
+    if any(name not in instance.__dict__ for name in STATS_FIELDS):
+        return None
+    return contribution(getattr(instance, name) for name in STATS_FIELDS)
+
+
+def stored_contribution(pk):
+    row = Transcription.objects.filter(pk=pk).values_list(*STATS_FIELDS).first()
+    return contribution(row) if row else None
+
+
+def compute(user_id):
+    """Stats of one user, aggregated from their transcriptions."""
+    return compute_many([user_id]).get(user_id) or empty_stats()
+
+
+def empty_stats():
+    return {
+        'total_transcriptions': 0,
+        'total_duration_seconds': 0,
+        'total_file_size_bytes': 0,
+        'status_counts': {},
+        'language_counts': {},
+        'model_counts': {},
+    }
+
+
+def compute_many(user_ids):
+    """``{user_id: stats}`` for users with transcriptions, in four grouped queries."""
+    queryset = Transcription.objects.filter(user_id__in=user_ids)
+    result = {}
+    totals = queryset.values_list('user_id').annotate(
+        count=Count('id'),
+        duration=Sum('duration_seconds'),
+        size=Sum('file_size'),
+    )
+    for user_id, count, duration, size in totals:
+        stats = result[user_id] = empty_stats()
+        stats['total_transcriptions'] = count
+        stats['total_duration_seconds'] = duration or 0
+        stats['total_file_size_bytes'] = size or 0
+    for column, key in COUNT_MAPS.items():
+        counts = queryset.values_list('user_id', column).annotate(count=Count('id')).order_by()
+        for user_id, value, count in counts:
+            result[user_id][key][value] = count
+    return result
+
+
+def apply_delta(user_id, old=None, new=None):
+    """
+    Move a transcription's contribution from ``old`` to ``new``.
+
+    ``old`` is None for a created row, ``new`` for a deleted one. A missing
+    rollup row is built from scratch instead, which already includes the
+    change.
+    """
+    if old == new:
+        return
+    with transaction.atomic():
+        apply_daily_delta(user_id, old, new)
+        stats = TranscriptionStats.objects.select_for_update().filter(user_id=user_id).first()
+        if stats is None:
+            recalculate(user_id)
+            return
+        for values, sign in ((old, -1), (new, 1)):
+            if values is None:
+                continue
+            stats.total_transcriptions += sign
+            stats.total_duration_seconds += sign * (values['duration_seconds'] or 0)
+            stats.total_file_size_bytes += sign * (values['file_size'] or 0)
+            for column, key in COUNT_MAPS.items():
+                counts = getattr(stats, key)
+                value = values[column]
+                counts[value] = counts.get(value, 0) + sign
+                if counts[value] <= 0:
+                    del counts[value]
+        stats.save()
+
+
+def recalculate(user_id):
+    """Rebuild a user's rollup rows from their transcriptions."""
+    with transaction.atomic():
+        stats, _ = TranscriptionStats.objects.update_or_create(
+            user_id=user_id,
+            defaults={**compute(user_id), 'reconciled_at': timezone.now()},
+        )
+        sync_daily([user_id])
+    return stats
+
+
+def local_date(value):
+    """Rollup day of a created_at timestamp."""
+    return timezone.localdate(value, timezone.get_default_timezone())
+
+
+def apply_daily_delta(user_id, old=None, new=None):
+    changes = defaultdict(lambda: [0, 0])
+    for values, sign in ((old, -1), (new, 1)):
+        if values is None:
+            continue
+        change = changes[local_date(values['created_at'])]
+        change[0] += sign
+        change[1] += sign * (values['duration_seconds'] or 0)
+    for day, (count, duration) in changes.items():
+        if count or duration:
+            bump_day(user_id, day, count, duration)
+
+
+def bump_day(user_id, day, count, duration):
+    rows = TranscriptionDailyStats.objects.filter(user_id=user_id, date=day)
+    bump = {'count': F('count') + count, 'total_duration': F('total_duration') + duration}
+    if rows.update(**bump):
+        return
+    try:
+        with transaction.atomic():
+            TranscriptionDailyStats.objects.create(
+                user_id=user_id, date=day, count=count, total_duration=duration,
+            )
+    except IntegrityError:
+        # Created concurrently
+        rows.update(**bump)
+
+
+def compute_daily_many(user_ids):
+    """``{(user_id, date): (count, total_duration)}`` from the transcriptions."""
+    days = (
+        Transcription.objects
+        .filter(user_id__in=user_ids)
+        .annotate(day=TruncDate('created_at', tzinfo=timezone.get_default_timezone()))
+        .values_list('user_id', 'day')
+        .annotate(count=Count('id'), total_duration=Sum('duration_seconds'))
+        .order_by()
+    )
+    return {
+        (user_id, day): (count, total_duration or 0)
+        for user_id, day, count, total_duration in days
+    }
+
+
+def sync_daily(user_ids):
+    """Make the users' daily rows match their transcriptions; returns rows fixed."""
+    expected = compute_daily_many(user_ids)
+    existing = {
+        (row.user_id, row.date): row
+        for row in TranscriptionDailyStats.objects.select_for_update().filter(user_id__in=user_ids)
+    }
+    created, updated, stale = [], [], []
+    for key, row in existing.items():
+        values = expected.get(key)
+        if values is None:
+            if row.count or row.total_duration:
+                stale.append(row.pk)
+        elif (row.count, row.total_duration) != values:
+            row.count, row.total_duration = values
+            updated.append(row)
+    for (user_id, day), (count, duration) in expected.items():
+        if (user_id, day) not in existing:
+            created.append(TranscriptionDailyStats(
+                user_id=user_id, date=day, count=count, total_duration=duration,
+            ))
+    TranscriptionDailyStats.objects.filter(pk__in=stale).delete()
+    TranscriptionDailyStats.objects.bulk_update(updated, ['count', 'total_duration'])
+    TranscriptionDailyStats.objects.bulk_create(created, ignore_conflicts=True)
+    return len(created) + len(updated) + len(stale)
+
+
+def bucket_start(day, granularity):
+    if granularity == 'week':
+        return day - timedelta(days=day.weekday())
+    if granularity == 'month':
+        return day.replace(day=1)
+    return day
+
+
+def next_bucket(day, granularity):
+    if granularity == 'week':
+        return day + timedelta(days=7)
+    if granularity == 'month':
+        return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return day + timedelta(days=1)
+
+
+def timeline(user_id, days, granularity='day', tz=None):
+    """
+    Transcriptions created per day, week or month over the last ``days`` days.
+
+    Days in the default time zone are read from the daily rollup; other time
+    zones aggregate the transcriptions on the fly. Either way buckets are
+    summed into a dict and gaps filled in one pass, O(days + rows).
+
+    Args:
+        user_id (int): Owner of the transcriptions
+        days (int): Number of days up to and including today
+        granularity (str): ``day``, ``week`` (starting Monday) or ``month``
+        tz (tzinfo): Time zone of the days, default ``TIME_ZONE``
+
+    Returns:
+        list: ``{'date', 'count', 'total_duration'}`` per bucket, oldest first
+    """
+    default_tz = timezone.get_default_timezone()
+    tz = tz or default_tz
+    end_date = timezone.localdate(timezone.now(), tz)
+    start_date = end_date - timedelta(days=days - 1)
+
+    if str(tz) == str(default_tz):
+        rows = TranscriptionDailyStats.objects.filter(
+            user_id=user_id, date__gte=start_date, date__lte=end_date,
+        ).values_list('date', 'count', 'total_duration')
+    else:
+        rows = (
+            Transcription.objects
+            .filter(user_id=user_id, created_at__date__gte=start_date, created_at__date__lte=end_date)
+            .annotate(day=TruncDate('created_at', tzinfo=tz))
+            .values_list('day')
+            .annotate(count=Count('id'), total_duration=Sum('duration_seconds'))
+            .order_by()
+        )
+        with timezone.override(tz):
+            rows = list(rows)
+
+    buckets = defaultdict(lambda: [0, 0])
+    for day, count, duration in rows:
+        bucket = buckets[bucket_start(day, granularity)]
+        bucket[0] += count
+        bucket[1] += duration or 0
+
+    result = []
+    day = bucket_start(start_date, granularity)
+    while day <= end_date:
+        count, duration = buckets.get(day, (0, 0))
+        result.append({'date': day, 'count': count, 'total_duration': duration})
+        day = next_bucket(day, granularity)
+    return result
+
+
+def get_stats(user_id):
+    """The user's rollup row, built on first use."""
+    stats = TranscriptionStats.objects.filter(user_id=user_id).first()
+    if stats is None:
+        stats = recalculate(user_id)
+    return stats
+
+
+def reconcile(batch_size=500):
+    """
+    Recompute every rollup row and fix those that drifted.
+
+    Returns:
+        dict: Counts of checked and corrected rows
+    """
+    User = get_user_model()
+    totals = {'checked': 0, 'corrected': 0, 'daily_corrected': 0}
+    now = timezone.now()
+    fields = list(empty_stats())
+    last_id = 0
+    while True:
+        user_ids = list(
+            User.objects.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:batch_size]
+        )
+        if not user_ids:
+            break
+
+        with transaction.atomic():
+            existing = {
+                stats.user_id: stats
+                for stats in TranscriptionStats.objects.select_for_update().filter(user_id__in=user_ids)
+            }
+            # Aggregated under the row locks: a concurrent save either
+            # committed before, or applies its delta after this transaction
+            computed = compute_many(user_ids)
+            created, updated = [], []
+            for user_id in user_ids:
+                expected = computed.get(user_id)
+                stats = existing.get(user_id)
+                if stats is None:
+                    # Rows of users without transcriptions are built on first use
+                    if expected:
+                        created.append(TranscriptionStats(user_id=user_id, reconciled_at=now, **expected))
+                    continue
+                expected = expected or empty_stats()
+                totals['checked'] += 1
+                if any(getattr(stats, name) != expected[name] for name in fields):
+                    logger.warning(f"Transcription stats of user {user_id} drifted; corrected")
+                    totals['corrected'] += 1
+                    for name in fields:
+                        setattr(stats, name, expected[name])
+                stats.reconciled_at = now
+                updated.append(stats)
+            TranscriptionStats.objects.bulk_create(created, ignore_conflicts=True)
+            TranscriptionStats.objects.bulk_update(updated, fields + ['reconciled_at'])
+            totals['daily_corrected'] += sync_daily(user_ids)
+        last_id = user_ids[-1]
+
+    logger.info(
+        f"Reconciled {totals['checked']} transcription stats row(s), "
+        f"{totals['corrected']} corrected, {totals['daily_corrected']} daily row(s) corrected"
+    )
+    return totals
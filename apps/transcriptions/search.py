@@ -0,0 +1,252 @@
+"""
+Full-text search over a user's transcripts.
+
+On PostgreSQL every row keeps a stored ``search_vector`` (title weighted
+above the text), built with the text search configuration of its language
+and indexed with GIN; archived rows are indexed from their archived text,
+not the preview left in the row (``index_archived`` catches up rows
+archived before they had a vector). ``search`` matches it with
+``websearch_to_tsquery``, orders by ``ts_rank`` and renders ``ts_headline``
+snippets only for the returned rows, since headlines re-parse the whole
+document.
+
+``autocomplete`` completes partially typed titles from a trigram GIN
+index on ``UPPER(title)``: substring matches (prefixes first) plus titles
+with a similar word, for typos.
+
+Other databases (SQLite in tests) fall back to substring matches ordered
+by recency, with a snippet around the first occurrence.
+"""
+import logging
+import re
+from django.conf import settings
+from django.contrib.postgres.lookups import TrigramWordSimilar
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramWordSimilarity,
+)
+from django.db import connection
+from django.db.models import Case, CharField, F, IntegerField, Q, Value, When
+from django.db.models.functions import Upper
+from . import fastpath
+from .models import Transcription
+from .serializers import TranscriptionListSerializer
+
+logger = logging.getLogger(__name__)
+
+# Transcription.language prefix -> PostgreSQL text search configuration
+CONFIGS = {
+    'de': 'german',
+    'en': 'english',
+}
+DEFAULT_CONFIG = 'simple'
+
+# Columns the vector is built from; saves touching them rebuild it
+SEARCH_FIELDS = frozenset(('title', 'transcribed_text', 'language'))
+
+AUTOCOMPLETE_FIELDS = ('id', 'title', 'status', 'created_at')
+
+START_SEL = '<mark>'
+STOP_SEL = '</mark>'
+SNIPPET_CHARS = 200
+
+
+def supported():
+    return connection.vendor == 'postgresql'
+
+
+def language_config():
+    """Per-row text search configuration as an SQL expression."""
+    return Case(
+        *[When(language__istartswith=code, then=Value(config)) for code, config in CONFIGS.items()],
+        default=Value(DEFAULT_CONFIG),
+        output_field=CharField(),
+    )
+
+
+def build_vector(text=None):
+    """
+    Vector expression of the title and ``text``, by default the stored
+    ``transcribed_text`` column.
+    """
+    config = language_config()
+    body = 'transcribed_text' if text is None else Value(text)
+    return (
+        SearchVector('title', weight='A', config=config)
+        + SearchVector(body, weight='B', config=config)
+    )
+
+
+def affects_vector(update_fields):
+    return update_fields is None or bool(SEARCH_FIELDS & set(update_fields))
+
+
+def update_vector(pk):
+    """
+    Rebuild the stored vector of one transcription (no-op off PostgreSQL).
+
+    Archived rows only keep a preview in ``transcribed_text``, so their
+    vector is built from the archived text; if that cannot be read, the
+    previous vector is kept.
+
+    Returns:
+        bool: Whether the vector was rebuilt
+    """
+    if not supported():
+        return False
+    transcription = Transcription.objects.filter(pk=pk).only('id', 'text_archive_key').first()
+    if transcription is None:
+        return False
+    text = None
+    if transcription.text_archive_key:
+        try:
+            text = transcription.full_text
+        except Exception as e:
+            logger.warning(f"Indexing archived transcription {pk} failed: {e}")
+            return False
+    # update() leaves updated_at alone: the row did not change for clients
+    return Transcription.objects.filter(pk=pk).update(search_vector=build_vector(text)) > 0
+
+
+def index_archived(limit=None):
+    """
+    Index archived rows that have no vector yet.
+
+    The search migration only backfills rows stored in the database;
+    reading every archived object belongs in a task, not in ``migrate``.
+    Unreadable objects stay pending for the next run.
+
+    Returns:
+        int: Number of rows indexed
+    """
+    if not supported():
+        return 0
+    limit = limit or settings.TRANSCRIPT_ARCHIVE_MAX_ROWS
+    pending = list(
+        Transcription.objects.exclude(text_archive_key='')
+        .filter(search_vector__isnull=True)
+        .values_list('id', flat=True)[:limit]
+    )
+    indexed = sum(update_vector(pk) for pk in pending)
+    logger.info(f"Indexed {indexed} of {len(pending)} archived transcription(s)")
+    return indexed
+
+
+def build_query(text):
+    """Match ``text`` under every configuration a row may have been indexed with."""
+    query = SearchQuery(text, config=DEFAULT_CONFIG, search_type='websearch')
+    for config in CONFIGS.values():
+        query |= SearchQuery(text, config=config, search_type='websearch')
+    return query
+
+
+def normalize(text):
+    """Collapse whitespace and case so keystrokes share cache entries."""
+    return ' '.join(text.split()).lower()
+
+
+def snippet(text, term):
+    """Fallback headline: the text around the first occurrence of ``term``."""
+    match = re.search(re.escape(term), text, re.IGNORECASE)
+    if match is None:
+        return text[:SNIPPET_CHARS]
+    start = max(match.start() - SNIPPET_CHARS // 2, 0)
+    end = min(start + SNIPPET_CHARS, len(text))
+    return (
+        ('…' if start else '')
+        + text[start:match.start()] + START_SEL + match.group() + STOP_SEL + text[match.end():end]
+        + ('…' if end < len(text) else '')
+    )
+
+
+def search(user, text, limit=None):
+    """
+    Search ``user``'s transcriptions.
+
+    Args:
+        user: Owner of the transcriptions
+        text (str): Search terms (web search syntax on PostgreSQL)
+        limit (int): Most results
+
+    Returns:
+        list: Rows in the list representation plus ``rank`` (None off
+        PostgreSQL) and ``headline``, an unescaped text excerpt with
+        matches wrapped in ``<mark>``, best match first
+    """
+    limit = limit or settings.SEARCH_PAGE_SIZE
+    columns, serialize = fastpath.make_row_serializer(TranscriptionListSerializer.Meta.fields, user=user)
+    owned = Transcription.objects.filter(user=user)
+
+    if not supported():
+        rows = (
+            owned.filter(Q(title__icontains=text) | Q(transcribed_text__icontains=text))
+            .order_by('-created_at', '-id')
+            .values_list(*columns, 'transcribed_text')[:limit]
+        )
+        return [
+            {**serialize(row), 'rank': None, 'headline': snippet(row[-1], text)}
+            for row in rows
+        ]
+
+    query = build_query(text)
+    ranked = list(
+        owned.filter(search_vector=query)
+        .annotate(rank=SearchRank(F('search_vector'), query))
+        .order_by('-rank', '-id')
+        .values_list('id', 'rank')[:limit]
+    )
+    if not ranked:
+        return []
+    headlines = {
+        row[-2]: row for row in
+        Transcription.objects.filter(id__in=[pk for pk, _ in ranked])
+        .annotate(headline=SearchHeadline(
+            'transcribed_text', query, config=language_config(),
+            start_sel=START_SEL, stop_sel=STOP_SEL,
+            max_fragments=2, fragment_delimiter=' … ',
+        ))
+        .values_list(*columns, 'id', 'headline')
+    }
+    return [
+        {**serialize(headlines[pk]), 'rank': round(rank, 4), 'headline': headlines[pk][-1]}
+        for pk, rank in ranked
+    ]
+
+
+def autocomplete(user, text, limit=None):
+    """
+    Complete a partially typed title.
+
+    Args:
+        user: Owner of the transcriptions
+        text (str): Typed so far
+        limit (int): Most results
+
+    Returns:
+        list: ``AUTOCOMPLETE_FIELDS`` of the best matches: titles starting
+        with ``text``, then containing it, then (PostgreSQL only) titles
+        with a word similar to it
+    """
+    limit = limit or settings.AUTOCOMPLETE_LIMIT
+    columns, serialize = fastpath.make_row_serializer(AUTOCOMPLETE_FIELDS, user=user)
+    prefix = Case(
+        When(title__istartswith=text, then=Value(1)),
+        default=Value(0),
+        output_field=IntegerField(),
+    )
+    matches = Transcription.objects.filter(user=user).annotate(prefix=prefix)
+    if supported():
+        # Both sides upper-cased so the operator can use the UPPER(title)
+        # index; trigrams ignore case anyway
+        title, term = Upper('title'), Upper(Value(text))
+        matches = (
+            matches.filter(Q(title__icontains=text) | Q(TrigramWordSimilar(title, term)))
+            .annotate(similarity=TrigramWordSimilarity(term, title))
+            .order_by('-prefix', '-similarity', '-created_at', '-id')
+        )
+    else:
+        matches = matches.filter(title__icontains=text).order_by('-prefix', '-created_at', '-id')
+    return [serialize(row) for row in matches.values_list(*columns)[:limit]]
@@ -1,7 +1,19 @@
 from rest_framework import serializers
 from .models import Transcription, TranscriptionSettings
 
-class TranscriptionSerializer(serializers.ModelSerializer):
+class SparseFieldsetMixin:
+    """Drop fields not selected via the ``fields``/``omit`` serializer context."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        fields = self.context.get('fields')
+        omit = self.context.get('omit') or ()
+        for name in list(self.fields):
+            if (fields is not None and name not in fields) or name in omit:
+                self.fields.pop(name)
+
+
+class TranscriptionSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     user = serializers.StringRelatedField(read_only=True)
     is_processing = serializers.BooleanField(read_only=True)
     is_complete = serializers.BooleanField(read_only=True)
@@ -36,6 +48,40 @@ class TranscriptionSerializer(serializers.ModelSerializer):
             'updated_at',
             'completed_at',
         ]
+    
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        # Archived rows only keep a preview; the detail view asks for the full text
+        if (
+            self.context.get('rehydrate_text')
+            and 'transcribed_text' in data
+            and instance.text_archive_key
+        ):
+            data['transcribed_text'] = instance.full_text
+        return data
+
+
+class TranscriptionListSerializer(TranscriptionSerializer):
+    """Light list representation without transcript text or file references."""
+    
+    user = None
+    
+    class Meta(TranscriptionSerializer.Meta):
+        fields = [
+            'id',
+            'title',
+            'file_size',
+            'duration_seconds',
+            'status',
+            'language',
+            'model_name',
+            'created_at',
+            'updated_at',
+            'completed_at',
+            'is_processing',
+            'is_complete',
+        ]
+
 
 class TranscriptionCreateSerializer(serializers.Serializer):
     """Serializer für Transkriptions-Anfragen"""
@@ -87,6 +133,8 @@ class TranscriptionSettingsSerializer(serializers.ModelSerializer):
             'default_language',
             'default_model',
             'notifications_enabled',
+            'notification_mode',
+            'digest_window_minutes',
             'auto_delete_audio',
             'updated_at',
         ]
@@ -103,18 +151,6 @@ class HealthCheckSerializer(serializers.Serializer):
     have_key = serializers.BooleanField(required=False)
 
 
-class TranscriptionStatsSerializer(serializers.Serializer):
-    """Serializer für Transkriptions-Statistiken"""
-    
-    total_transcriptions = serializers.IntegerField()
-    total_duration_seconds = serializers.IntegerField()
-    total_file_size_bytes = serializers.IntegerField()
-    status_counts = serializers.DictField(child=serializers.IntegerField())
-    language_counts = serializers.DictField(child=serializers.IntegerField())
-    model_counts = serializers.DictField(child=serializers.IntegerField())
-    recent_transcriptions = serializers.ListField(child=serializers.DictField())
-
-
 class TranscriptionTimelineSerializer(serializers.Serializer):
     """Serializer für Zeitreihendaten"""
     
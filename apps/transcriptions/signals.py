@@ -0,0 +1,90 @@
+from django.db import transaction
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import (
+    archive,
+    conditional,
+    dashboard_cache,
+    events,
+    ops_metrics,
+    rollups,
+    search,
+    status_cache,
+    subtitles,
+    sync,
+)
+from .models import Transcription
+
+
+def deleted_by_user_cascade(origin):
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return origin_model is not Transcription
+
+
+@receiver(pre_save, sender=Transcription)
+def transcription_saving(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if update_fields is not None and not set(update_fields) & set(rollups.STATS_FIELDS):
+        return
+    # Contribution to the stats rollup before this save (None: new row)
+    if instance._state.adding:
+        instance._stats_previous = None
+    else:
+        instance._stats_previous = rollups.stored_contribution(instance.pk)
+
+
+@receiver(post_save, sender=Transcription)
+def transcription_saved(sender, instance, created, update_fields=None, **kwargs):
+    conditional.record_version(instance)
+    if '_stats_previous' in instance.__dict__:
+        previous = instance.__dict__.pop('_stats_previous')
+        if update_fields is not None and previous is not None:
+            saved = set(update_fields) & set(rollups.STATS_FIELDS)
+            current = {**previous, **{name: getattr(instance, name) for name in saved}}
+        else:
+            current = rollups.current_contribution(instance) or rollups.stored_contribution(instance.pk)
+        rollups.apply_delta(instance.user_id, previous, current)
+        ops_metrics.record_transition(
+            instance, previous and previous['status'], current['status'], created
+        )
+    if dashboard_cache.affects_dashboard(update_fields):
+        dashboard_cache.bump([instance.user_id])
+    if search.affects_vector(update_fields):
+        search.update_vector(instance.pk)
+
+    if status_cache.enabled() or events.enabled():
+        row, user_id = status_cache.status_row(instance), instance.user_id
+
+        def write_through():
+            status_cache.write(row, user_id)
+            events.publish_status(row, user_id)
+
+        transaction.on_commit(write_through)
+
+
+@receiver(post_delete, sender=Transcription)
+def transcription_deleted(sender, instance, origin=None, **kwargs):
+    # Deleting the user cascades here; their sync state and stats go with them
+    if not deleted_by_user_cascade(origin):
+        sync.record_tombstone(instance)
+        previous = rollups.current_contribution(instance)
+        if previous is None:
+            rollups.recalculate(instance.user_id)
+        else:
+            rollups.apply_delta(instance.user_id, previous, None)
+    conditional.invalidate(pks=[instance.pk], user_ids=[instance.user_id])
+    dashboard_cache.bump([instance.user_id])
+    pk, user_id = instance.pk, instance.user_id
+    transaction.on_commit(lambda: status_cache.forget([pk], user_id))
+    loaded = not {'segments', 'text_archive_key'} & instance.get_deferred_fields()
+    if loaded and (instance.segments or instance.text_archive_key):
+        # Only transcriptions with segments (possibly archived) can have cached subtitles
+        directory = subtitles.cache_dir(instance)
+        transaction.on_commit(lambda: subtitles.forget(directory))
+    if 'text_archive_key' not in instance.get_deferred_fields() and instance.text_archive_key:
+        # Nothing else references the archived text and segments
+        key = instance.text_archive_key
+        transaction.on_commit(lambda: archive.forget(key))
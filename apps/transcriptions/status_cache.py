@@ -0,0 +1,167 @@
+"""
+Redis status cache for transcription polling.
+
+Each transcription's status payload lives in a small hash
+(``transcription-status:<id>``) that is rewritten after every committed save,
+i.e. on each transition ``process_transcription`` makes (write-through, see
+signals.py). Ownership is checked against a per-user set of ids
+(``transcription-user-ids:<user>``), so a poll is answered with one Redis
+round trip. Misses and Redis errors fall back to the database.
+"""
+import logging
+from datetime import datetime
+import redis
+from django.conf import settings
+from .fastpath import STATUS_COLUMNS
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+STATUS_KEY = 'transcription-status:{pk}'
+USER_IDS_KEY = 'transcription-user-ids:{user_id}'
+DATETIME_COLUMNS = ('created_at', 'updated_at', 'completed_at')
+
+
+def enabled():
+    return settings.STATUS_CACHE_ENABLED
+
+
+def encode(row):
+    """Hash mapping for a STATUS_COLUMNS row."""
+    mapping = {}
+    for column, value in zip(STATUS_COLUMNS, row):
+        if value is None:
+            value = ''
+        elif column in DATETIME_COLUMNS:
+            value = value.isoformat()
+        mapping[column] = value
+    return mapping
+
+
+def decode(mapping):
+    """STATUS_COLUMNS row from a hash mapping."""
+    row = []
+    for column in STATUS_COLUMNS:
+        value = mapping.get(column, '')
+        if column == 'id':
+            value = int(value)
+        elif column in DATETIME_COLUMNS:
+            value = datetime.fromisoformat(value) if value else None
+        row.append(value)
+    return tuple(row)
+
+
+def status_row(transcription):
+    return tuple(getattr(transcription, column) for column in STATUS_COLUMNS)
+
+
+def write(row, user_id):
+    """Write-through: store a status row and register its owner."""
+    if not enabled():
+        return
+    pk = row[0]
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        pipe.hset(STATUS_KEY.format(pk=pk), mapping=encode(row))
+        pipe.expire(STATUS_KEY.format(pk=pk), settings.STATUS_CACHE_TIMEOUT)
+        pipe.sadd(USER_IDS_KEY.format(user_id=user_id), pk)
+        pipe.expire(USER_IDS_KEY.format(user_id=user_id), settings.STATUS_CACHE_TIMEOUT)
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Status cache write for transcription {pk} failed: {e}")
+
+
+def fill(row, user_id):
+    """Store a row read from the database after a miss (see fill_many)."""
+    fill_many([row], user_id)
+
+
+def fill_many(rows, user_id):
+    """
+    Store rows read from the database after misses.
+
+    Fields are written with HSETNX: a hash that a concurrent write-through
+    created in the meantime already has every field, so this older read
+    never overwrites a newer status.
+    """
+    if not enabled() or not rows:
+        return
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        for row in rows:
+            key = STATUS_KEY.format(pk=row[0])
+            for field, value in encode(row).items():
+                pipe.hsetnx(key, field, value)
+            pipe.expire(key, settings.STATUS_CACHE_TIMEOUT)
+        pipe.sadd(USER_IDS_KEY.format(user_id=user_id), *[row[0] for row in rows])
+        pipe.expire(USER_IDS_KEY.format(user_id=user_id), settings.STATUS_CACHE_TIMEOUT)
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Status cache fill failed: {e}")
+
+
+def read(pk, user_id):
+    """
+    Return the cached STATUS_COLUMNS row of a transcription owned by user_id.
+
+    Returns None on a miss, for ids not in the user's set and on Redis
+    errors; the caller then reads the database.
+    """
+    if not enabled():
+        return None
+    try:
+        pk = int(pk)
+    except (TypeError, ValueError):
+        return None
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        pipe.sismember(USER_IDS_KEY.format(user_id=user_id), pk)
+        pipe.hgetall(STATUS_KEY.format(pk=pk))
+        is_member, mapping = pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Status cache read for transcription {pk} failed: {e}")
+        return None
+    if not is_member or not mapping:
+        return None
+    return decode(mapping)
+
+
+def read_many(pks, user_id):
+    """
+    Return ``{id: row}`` for the cached, owned transcriptions among ``pks``.
+
+    One pipelined round trip; ids missing from the result are read from the
+    database by the caller.
+    """
+    pks = list(pks)
+    if not enabled() or not pks:
+        return {}
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        pipe.smismember(USER_IDS_KEY.format(user_id=user_id), pks)
+        for pk in pks:
+            pipe.hgetall(STATUS_KEY.format(pk=pk))
+        membership, *mappings = pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Status cache read failed: {e}")
+        return {}
+    return {
+        pk: decode(mapping)
+        for pk, is_member, mapping in zip(pks, membership, mappings)
+        if is_member and mapping
+    }
+
+
+def forget(pks, user_id=None):
+    """Drop cached rows, e.g. after deletes or bulk updates."""
+    pks = list(pks)
+    if not enabled() or not pks:
+        return
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        pipe.delete(*[STATUS_KEY.format(pk=pk) for pk in pks])
+        if user_id is not None:
+            pipe.srem(USER_IDS_KEY.format(user_id=user_id), *pks)
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Status cache invalidation failed: {e}")
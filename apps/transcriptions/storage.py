@@ -0,0 +1,122 @@
+"""
+Bulk helpers for the audio storage backend (MinIO/S3 or local).
+"""
+import logging
+from django.core.files.storage import default_storage
+
+logger = logging.getLogger(__name__)
+
+# S3 DeleteObjects accepts at most 1000 keys per request
+S3_DELETE_BATCH_SIZE = 1000
+
+
+def is_s3_storage(storage=None):
+    """Return True if the storage exposes a boto3 bucket (django-storages S3)."""
+    storage = storage or default_storage
+    return hasattr(storage, 'bucket') and hasattr(storage, '_normalize_name')
+
+
+def delete_objects(names, storage=None):
+    """
+    Delete many stored files with as few backend calls as possible.
+
+    On S3 this issues one DeleteObjects request per 1000 keys; other
+    backends fall back to deleting one file at a time.
+
+    Args:
+        names (iterable): Storage names as saved in FileField values
+
+    Returns:
+        tuple: (deleted names, dict of failed name -> error message)
+    """
+    storage = storage or default_storage
+    names = [name for name in names if name]
+    deleted, failed = [], {}
+
+    if not is_s3_storage(storage):
+        for name in names:
+            try:
+                storage.delete(name)
+                deleted.append(name)
+            except Exception as e:
+                failed[name] = str(e)
+        return deleted, failed
+
+    for start in range(0, len(names), S3_DELETE_BATCH_SIZE):
+        chunk = names[start:start + S3_DELETE_BATCH_SIZE]
+        keys = {storage._normalize_name(name): name for name in chunk}
+        try:
+            response = storage.bucket.delete_objects(Delete={
+                'Objects': [{'Key': key} for key in keys],
+                'Quiet': True,
+            })
+        except Exception as e:
+            logger.error(f"DeleteObjects failed for {len(chunk)} key(s): {e}")
+            failed.update({name: str(e) for name in chunk})
+            continue
+        errors = {
+            keys[error['Key']]: error.get('Message', error.get('Code', ''))
+            for error in response.get('Errors', [])
+            if error.get('Key') in keys
+        }
+        failed.update(errors)
+        deleted.extend(name for name in chunk if name not in errors)
+
+    return deleted, failed
+
+
+def _s3_name(storage, key):
+    location = (getattr(storage, 'location', '') or '').strip('/')
+    if location and key.startswith(f"{location}/"):
+        return key[len(location) + 1:]
+    return key
+
+
+def iter_object_pages(prefix, storage=None, start_after='', page_size=1000):
+    """
+    Yield pages of stored objects below ``prefix``.
+
+    On S3 this follows ListObjectsV2 continuation tokens; other backends walk
+    the directory tree. Pages are ordered by key so ``start_after`` can resume
+    an interrupted listing.
+
+    Yields:
+        list: (name, size in bytes, last modified datetime) tuples
+    """
+    storage = storage or default_storage
+
+    if is_s3_storage(storage):
+        client = storage.connection.meta.client
+        paginator = client.get_paginator('list_objects_v2')
+        params = {
+            'Bucket': storage.bucket_name,
+            'Prefix': storage._normalize_name(prefix),
+            'PaginationConfig': {'PageSize': page_size},
+        }
+        if start_after:
+            params['StartAfter'] = storage._normalize_name(start_after)
+        for page in paginator.paginate(**params):
+            objects = [
+                (_s3_name(storage, obj['Key']), obj['Size'], obj['LastModified'])
+                for obj in page.get('Contents', [])
+            ]
+            if objects:
+                yield objects
+        return
+
+    names = []
+    pending = [prefix.rstrip('/')]
+    while pending:
+        directory = pending.pop()
+        try:
+            dirs, files = storage.listdir(directory)
+        except FileNotFoundError:
+            continue
+        pending.extend(f"{directory}/{d}" for d in dirs)
+        names.extend(f"{directory}/{f}" for f in files)
+    names = sorted(name for name in names if name > start_after)
+    for start in range(0, len(names), page_size):
+        yield [
+            (name, storage.size(name), storage.get_modified_time(name))
+            for name in names[start:start + page_size]
+        ]
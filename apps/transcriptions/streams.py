@@ -0,0 +1,255 @@
+"""
+Server-Sent Events stream of a user's transcription jobs (ASGI), and
+``iterate_async`` for serving sync-built downloads under ASGI.
+
+``GET /rest/api/v1/transcribe/events/`` keeps one connection per browser
+and streams ``status``, ``progress`` and ``completion`` events for all of
+the user's jobs. Events come from Redis pub/sub (see events.py).
+
+Each process holds a single pub/sub connection (``EventHub``) and fans
+messages out to in-memory queues, subscribing to a user's channel while at
+least one of their streams is open. An idle stream is a suspended
+coroutine: no worker thread, no database connection, no Redis connection
+of its own.
+"""
+import asyncio
+import json
+import logging
+import weakref
+import redis
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connection, transaction
+from django.http import HttpResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.exceptions import AuthenticationFailed
+from . import events
+from .fastpath import STATUS_COLUMNS, serialize_status
+from .models import Transcription
+from .redis_client import create_async_redis
+from .status_cache import decode
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = ('pending', 'processing')
+FINISHED_STATUSES = ('completed', 'failed')
+
+# Queue markers
+RESYNC = object()
+CLOSED = object()
+
+
+class EventHub:
+    """One pub/sub connection per event loop, fanned out to stream queues."""
+
+    def __init__(self):
+        self.redis = create_async_redis()
+        self.pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        self.queues = {}
+        self.lock = asyncio.Lock()
+        self.reader = None
+
+    async def subscribe(self, user_id):
+        queue = asyncio.Queue(maxsize=settings.SSE_QUEUE_SIZE)
+        name = events.channel(user_id)
+        async with self.lock:
+            if name not in self.queues:
+                await self.pubsub.subscribe(name)
+                self.queues[name] = set()
+            self.queues[name].add(queue)
+            if self.reader is None or self.reader.done():
+                self.reader = asyncio.create_task(self.read())
+        return queue
+
+    async def unsubscribe(self, user_id, queue):
+        name = events.channel(user_id)
+        async with self.lock:
+            queues = self.queues.get(name)
+            if queues is None:
+                return
+            queues.discard(queue)
+            if not queues:
+                del self.queues[name]
+                await self.pubsub.unsubscribe(name)
+
+    async def read(self):
+        try:
+            while self.queues:
+                message = await self.pubsub.get_message(timeout=1.0)
+                if message is None:
+                    continue
+                for queue in list(self.queues.get(message['channel'], ())):
+                    self.deliver(queue, message['data'])
+        except redis.RedisError as e:
+            logger.warning(f"Job event subscription failed: {e}")
+            # Streams end and EventSource reconnects with a fresh snapshot
+            for queues in self.queues.values():
+                for queue in queues:
+                    self.deliver(queue, CLOSED)
+
+    @staticmethod
+    def deliver(queue, item):
+        try:
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            # Slow client: drop the backlog and send a fresh snapshot instead
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(CLOSED if item is CLOSED else RESYNC)
+
+
+_hubs = weakref.WeakKeyDictionary()
+
+
+def get_hub():
+    loop = asyncio.get_running_loop()
+    hub = _hubs.get(loop)
+    if hub is None:
+        hub = _hubs[loop] = EventHub()
+    return hub
+
+
+def format_event(event, data, event_id=None):
+    lines = [f"event: {event}"]
+    if event_id:
+        lines.append(f"id: {event_id}")
+    lines.append(f"data: {json.dumps(data, default=str, separators=(',', ':'))}")
+    return "\n".join(lines) + "\n\n"
+
+
+def status_event(row):
+    """SSE frame for a STATUS_COLUMNS row."""
+    data = serialize_status(row)
+    name = 'completion' if data['status'] in FINISHED_STATUSES else 'status'
+    updated_at = data['updated_at']
+    event_id = f"{data['id']}:{updated_at.timestamp()}" if updated_at else None
+    return format_event(name, data, event_id)
+
+
+def message_event(payload):
+    """SSE frame for a published job event, or None for unknown types."""
+    try:
+        event = json.loads(payload)
+    except (TypeError, ValueError):
+        return None
+    kind = event.pop('type', None)
+    if kind == 'status':
+        return status_event(decode(event))
+    if kind == 'progress':
+        return format_event('progress', event)
+    return None
+
+
+def release_connection():
+    # A stream outlives the request's DB work; do not keep the connection
+    if not connection.in_atomic_block:
+        connection.close()
+
+
+def _step(iterator, done):
+    try:
+        return next(iterator, done)
+    finally:
+        release_connection()
+
+
+async def iterate_async(iterator):
+    """
+    Drive a sync iterator from the event loop, one ``next()`` per call.
+
+    Under ASGI, Django serves a sync iterator by collecting it in a thread
+    first, so a large download would be built in memory before its first
+    byte is sent. Each step runs in a worker thread of its own instead
+    (``thread_sensitive=False``) and the response streams as parts are
+    produced. The iterator must not hold a database cursor between steps;
+    the step's connection is released after every call.
+    """
+    iterator = iter(iterator)
+    done = object()
+    step = sync_to_async(_step, thread_sensitive=False)
+    try:
+        while (part := await step(iterator, done)) is not done:
+            yield part
+    finally:
+        close = getattr(iterator, 'close', None)
+        if close is not None:
+            await sync_to_async(close, thread_sensitive=False)()
+
+
+def load_snapshot(user_id):
+    """Current rows of the user's unfinished jobs."""
+    try:
+        return list(
+            Transcription.objects
+            .filter(user_id=user_id, status__in=ACTIVE_STATUSES)
+            .order_by('-created_at')
+            .values_list(*STATUS_COLUMNS)[:settings.SSE_SNAPSHOT_LIMIT]
+        )
+    finally:
+        release_connection()
+
+
+def authenticate(request):
+    """Return the session or token user, or None."""
+    try:
+        if request.user.is_authenticated:
+            return request.user
+        result = TokenAuthentication().authenticate(request)
+        return result[0] if result else None
+    except AuthenticationFailed:
+        return None
+    finally:
+        release_connection()
+
+
+async def stream_events(user_id):
+    hub = get_hub()
+    queue = await hub.subscribe(user_id)
+    try:
+        yield f"retry: {settings.SSE_RETRY_MS}\n\n"
+        # Subscribed before the snapshot, so no transition falls in between
+        for row in await sync_to_async(load_snapshot)(user_id):
+            yield status_event(row)
+
+        while True:
+            try:
+                item = await asyncio.wait_for(queue.get(), settings.SSE_HEARTBEAT_SECONDS)
+            except TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if item is CLOSED:
+                break
+            if item is RESYNC:
+                for row in await sync_to_async(load_snapshot)(user_id):
+                    yield status_event(row)
+                continue
+            frame = message_event(item)
+            if frame:
+                yield frame
+    finally:
+        await hub.unsubscribe(user_id, queue)
+
+
+@transaction.non_atomic_requests
+@require_GET
+async def job_events(request):
+    """
+    SSE stream of the authenticated user's job events.
+
+    GET /rest/api/v1/transcribe/events/
+
+    Authenticates with the session cookie (EventSource) or an
+    ``Authorization: Token`` header (fetch-based clients).
+    """
+    if not events.enabled():
+        return HttpResponse('Job events are disabled', status=503)
+    user = await sync_to_async(authenticate)(request)
+    if user is None:
+        return HttpResponse('Authentication required', status=401)
+
+    response = StreamingHttpResponse(stream_events(user.id), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Tell nginx-style proxies not to buffer the stream
+    response['X-Accel-Buffering'] = 'no'
+    return response
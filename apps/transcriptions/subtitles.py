@@ -0,0 +1,161 @@
+"""
+SRT and WebVTT subtitles rendered from the stored timestamped segments.
+
+Segments from the transcription backend are split into cues that respect
+``SUBTITLE_MAX_LINE_CHARS`` per line, ``SUBTITLE_MAX_LINES`` per cue and
+``SUBTITLE_MAX_CUE_SECONDS`` per cue; time inside a segment is shared out
+in proportion to the characters of each cue. ``render`` is a generator;
+the view streams it while cues are produced (stepped from worker threads
+under ASGI, see ``streams.iterate_async``).
+
+Rendered files are cached in the default storage under a name derived from
+the transcription's ``updated_at``: any change to the row produces a new
+name, so cached files never have to be invalidated, only cleaned up.
+"""
+import logging
+import math
+import textwrap
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from .storage import delete_objects
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = 'subtitles'
+
+FORMATS = {
+    'srt': 'application/x-subrip; charset=utf-8',
+    'vtt': 'text/vtt; charset=utf-8',
+}
+
+
+def normalize_segments(segments):
+    """Keep ``{'start', 'end', 'text'}`` of well-formed backend segments."""
+    normalized = []
+    for segment in segments or []:
+        try:
+            start, end = float(segment['start']), float(segment['end'])
+            text = ' '.join(str(segment.get('text') or '').split())
+        except (KeyError, TypeError, ValueError):
+            continue
+        if text and math.isfinite(start) and math.isfinite(end) and end >= start >= 0:
+            normalized.append({'start': round(start, 3), 'end': round(end, 3), 'text': text})
+    return normalized
+
+
+def wrap(text):
+    return textwrap.wrap(text, width=settings.SUBTITLE_MAX_LINE_CHARS, break_long_words=False)
+
+
+def split_segment(start, end, text):
+    """
+    Split one segment into cues of at most SUBTITLE_MAX_LINES wrapped lines
+    and SUBTITLE_MAX_CUE_SECONDS each.
+
+    Yields:
+        tuple: (start, end, lines)
+    """
+    words = text.split()
+    per_char = (end - start) / max(len(text), 1)
+    cue, offset = [], 0
+    for word in words:
+        candidate = ' '.join(cue + [word])
+        too_long = (
+            len(wrap(candidate)) > settings.SUBTITLE_MAX_LINES
+            or len(candidate) * per_char > settings.SUBTITLE_MAX_CUE_SECONDS
+        )
+        if cue and too_long:
+            chunk = ' '.join(cue)
+            yield start + offset * per_char, start + (offset + len(chunk)) * per_char, wrap(chunk)
+            # The separating space belongs to the previous cue
+            offset += len(chunk) + 1
+            cue = []
+        cue.append(word)
+    if cue:
+        yield start + offset * per_char, end, wrap(' '.join(cue))
+
+
+def cues(segments):
+    for segment in segments:
+        yield from split_segment(segment['start'], segment['end'], segment['text'])
+
+
+def format_timestamp(seconds, separator):
+    millis = round(max(seconds, 0) * 1000)
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    seconds, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}{separator}{millis:03d}"
+
+
+def render(segments, file_format):
+    """Yield the subtitle file for ``segments`` cue by cue."""
+    if file_format == 'vtt':
+        yield 'WEBVTT\n\n'
+        separator = '.'
+    else:
+        separator = ','
+    for number, (start, end, lines) in enumerate(cues(segments), start=1):
+        timing = f"{format_timestamp(start, separator)} --> {format_timestamp(end, separator)}"
+        text = '\n'.join(lines)
+        if file_format == 'vtt':
+            yield f"{timing}\n{text}\n\n"
+        else:
+            yield f"{number}\n{timing}\n{text}\n\n"
+
+
+def cache_dir(transcription):
+    return f"{CACHE_PREFIX}/{transcription.user_id}/{transcription.id}"
+
+
+def cache_name(transcription, file_format):
+    return f"{cache_dir(transcription)}/{transcription.updated_at:%Y%m%d%H%M%S%f}.{file_format}"
+
+
+def open_cached(transcription, file_format):
+    """Cached rendering as an open storage file, None on a miss."""
+    name = cache_name(transcription, file_format)
+    try:
+        if default_storage.exists(name):
+            return default_storage.open(name, 'rb')
+    except Exception as e:
+        logger.warning(f"Reading cached subtitles {name} failed: {e}")
+    return None
+
+
+def render_cached(transcription, segments, file_format):
+    """
+    Stream a fresh rendering and store it once complete.
+
+    Versions for an older ``updated_at`` are deleted after the save; an
+    interrupted download stores nothing.
+    """
+    parts = []
+    for part in render(segments, file_format):
+        parts.append(part)
+        yield part
+
+    name = cache_name(transcription, file_format)
+    try:
+        if not default_storage.exists(name):
+            default_storage.save(name, ContentFile(''.join(parts).encode('utf-8')))
+        _, files = default_storage.listdir(cache_dir(transcription))
+        current = name.rsplit('/', 1)[1].split('.')[0]
+        delete_objects(
+            f"{cache_dir(transcription)}/{file}" for file in files if not file.startswith(current)
+        )
+    except Exception as e:
+        logger.warning(f"Caching subtitles {name} failed: {e}")
+
+
+def forget(directory):
+    """Delete all cached renderings in ``cache_dir(transcription)``."""
+    try:
+        _, files = default_storage.listdir(directory)
+    except (FileNotFoundError, NotADirectoryError):
+        return
+    except Exception as e:
+        logger.warning(f"Listing cached subtitles in {directory} failed: {e}")
+        return
+    delete_objects(f"{directory}/{file}" for file in files)
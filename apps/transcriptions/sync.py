@@ -0,0 +1,139 @@
+"""
+Delta sync for clients that keep a local copy of the transcription list.
+
+``GET /transcriptions/changes/?since=<token>`` returns the rows created or
+updated and the ids deleted after an opaque watermark. The token carries
+two keyset positions: ``(updated_at, id)`` on the ``(user, updated_at, id)``
+index for rows, and ``(deleted_at, id)`` on the tombstones. Each call is
+therefore a bounded index range scan, O(changes) rather than O(rows).
+
+Once a client has caught up, the positions are held back to
+``now - CHANGES_SETTLE_SECONDS``: a transaction can commit after a later
+one, with an earlier ``updated_at``. Changes inside that window may be
+delivered twice; clients apply them as upserts.
+"""
+import base64
+import json
+from datetime import datetime, timedelta
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from . import fastpath
+from .models import Transcription, TranscriptionTombstone
+from .serializers import TranscriptionListSerializer
+
+
+class InvalidToken(ValueError):
+    pass
+
+
+class ExpiredToken(ValueError):
+    """Tombstones after the watermark may have been purged; resync fully."""
+
+
+def encode_token(rows_position, deleted_position):
+    data = json.dumps({
+        'u': [rows_position[0].isoformat(), rows_position[1]] if rows_position else None,
+        'd': [deleted_position[0].isoformat(), deleted_position[1]],
+    })
+    return base64.urlsafe_b64encode(data.encode('ascii')).decode('ascii')
+
+
+def decode_token(token):
+    """Return the (rows position or None, tombstone position) of a token."""
+    try:
+        data = json.loads(base64.urlsafe_b64decode(token.encode('ascii')))
+        positions = [
+            (datetime.fromisoformat(value[0]), int(value[1])) if value else None
+            for value in (data['u'], data['d'])
+        ]
+    except (TypeError, ValueError, KeyError, IndexError, UnicodeError):
+        raise InvalidToken('Invalid sync token')
+    if positions[1] is None or any(p and timezone.is_naive(p[0]) for p in positions):
+        raise InvalidToken('Invalid sync token')
+    return positions
+
+
+def after(queryset, field, position):
+    """Rows after a (timestamp, id) keyset position, in position order."""
+    if position is not None:
+        value, pk = position
+        # "field >= value" bounds the index range; the OR only filters rows
+        # sharing the boundary timestamp
+        queryset = queryset.filter(
+            Q(**{f'{field}__gte': value}),
+            Q(**{f'{field}__gt': value}) | Q(id__gt=pk),
+        )
+    return queryset.order_by(field, 'id')
+
+
+def get_changes(user, since=None, limit=None):
+    """
+    Collect changes of ``user``'s transcriptions after a sync token.
+
+    Args:
+        user: Owner of the transcriptions
+        since (str): Token from a previous call, None for a full sync
+        limit (int): Most rows and most tombstones per call
+
+    Returns:
+        dict: ``changed`` rows (list representation), ``deleted`` ids, the
+            ``next`` token and ``has_more`` while a limit cut the result
+
+    Raises:
+        InvalidToken: ``since`` is malformed
+        ExpiredToken: ``since`` is older than the tombstone retention
+    """
+    limit = limit or settings.CHANGES_PAGE_SIZE
+    now = timezone.now()
+    horizon = (now - timedelta(seconds=settings.CHANGES_SETTLE_SECONDS), 0)
+    if since:
+        rows_position, deleted_position = decode_token(since)
+        if deleted_position[0] < now - settings.TRANSCRIPTION_TOMBSTONE_RETENTION:
+            raise ExpiredToken('Sync token expired')
+    else:
+        # Deletions before a full sync are already reflected in its rows
+        rows_position, deleted_position = None, horizon
+
+    columns, serialize = fastpath.make_row_serializer(TranscriptionListSerializer.Meta.fields)
+    rows = list(
+        after(Transcription.objects.filter(user=user), 'updated_at', rows_position)
+        .values_list(*columns, 'updated_at', 'id')[:limit + 1]
+    )
+    tombstones = list(
+        after(TranscriptionTombstone.objects.filter(user=user), 'deleted_at', deleted_position)
+        .values_list('transcription_id', 'deleted_at', 'id')[:limit + 1]
+    )
+    has_more = len(rows) > limit or len(tombstones) > limit
+    rows, tombstones = rows[:limit], tombstones[:limit]
+
+    if rows:
+        rows_position = (rows[-1][-2], rows[-1][-1])
+    if tombstones:
+        deleted_position = tombstones[-1][1:]
+    if not has_more:
+        # Caught up: re-read the settle window next time
+        rows_position = min(rows_position, horizon) if rows_position else horizon
+        deleted_position = min(deleted_position, horizon)
+
+    return {
+        'changed': [serialize(row) for row in rows],
+        'deleted': [transcription_id for transcription_id, _, _ in tombstones],
+        'next': encode_token(rows_position, deleted_position),
+        'has_more': has_more,
+    }
+
+
+def record_tombstone(transcription):
+    TranscriptionTombstone.objects.create(
+        user_id=transcription.user_id,
+        transcription_id=transcription.pk,
+    )
+
+
+def purge_tombstones(older_than=None):
+    """Delete tombstones past the retention period."""
+    if older_than is None:
+        older_than = timezone.now() - settings.TRANSCRIPTION_TOMBSTONE_RETENTION
+    deleted, _ = TranscriptionTombstone.objects.filter(deleted_at__lt=older_than).delete()
+    return deleted
@@ -2,11 +2,25 @@
 import logging
 import os
 import requests
+from datetime import timedelta
 from celery import shared_task
+from django.db import transaction
+from django.db.models import Max, Min
 from django.utils import timezone
-from django.core.mail import send_mail
+from django.core.cache import cache
+from django.core.mail import EmailMessage, get_connection, send_mail
 from django.conf import settings
+from . import events
+from .archive import archive_transcripts
+from .lifecycle import collect_orphaned_audio, purge_audio
+from .mail import DRAIN_SCHEDULED_KEY, deliver_pending
 from .models import Transcription
+from .ops_metrics import rollup as rollup_ops_metrics
+from .outbox import purge_sent, relay_pending
+from .rollups import reconcile
+from .search import index_archived
+from .subtitles import normalize_segments
+from .sync import purge_tombstones
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +40,38 @@ def get_content_type(filename):
     return content_types.get(ext, 'audio/mpeg')
 
 
+def claim_transcription(transcription_id, retrying=False):
+    """
+    Move a transcription to 'processing' unless another delivery owns it.
+    
+    The outbox publishes at least once (see outbox.relay_pending), so a job
+    can arrive twice. Only 'pending' rows are claimed, plus 'processing'
+    rows older than the task time limit (their worker is gone) and, on a
+    retry, the row the earlier attempt left behind.
+    
+    Returns:
+        Transcription: The claimed row, None for a duplicate delivery
+    """
+    stale = timezone.now() - timedelta(seconds=settings.CELERY_TASK_TIME_LIMIT)
+    with transaction.atomic():
+        transcription = (
+            Transcription.objects
+            .select_for_update(of=('self',))
+            .select_related('user')
+            .get(id=transcription_id)
+        )
+        claimable = (
+            transcription.status == 'pending'
+            or (retrying and transcription.status in ('processing', 'failed'))
+            or (transcription.status == 'processing' and transcription.updated_at < stale)
+        )
+        if not claimable:
+            return None
+        transcription.status = 'processing'
+        transcription.save(update_fields=['status', 'updated_at'])
+    return transcription
+
+
 @shared_task(bind=True, max_retries=3)
 def process_transcription(self, transcription_id):
     """
@@ -38,17 +84,17 @@ def process_transcription(self, transcription_id):
         dict: Result with transcription_id, status, text_length
     """
     try:
-        transcription = Transcription.objects.select_related('user').get(id=transcription_id)
+        # Update status to processing, unless another delivery owns the job
+        transcription = claim_transcription(transcription_id, retrying=self.request.retries > 0)
+        if transcription is None:
+            logger.info(f"Transcription {transcription_id} already claimed; ignoring duplicate delivery")
+            return {'transcription_id': transcription_id, 'status': 'duplicate'}
         
         logger.info(
             f"Starting Voxtral transcription {transcription_id} "
             f"for user {transcription.user.email}"
         )
         
-        # Update status to processing
-        transcription.status = 'processing'
-        transcription.save(update_fields=['status', 'updated_at'])
-        
         # Get language (use user settings or model default)
         try:
             user_settings = transcription.user.transcription_settings
@@ -80,6 +126,7 @@ def process_transcription(self, transcription_id):
             }
             
             logger.info(f"Calling Voxtral API for transcription {transcription_id}")
+            events.publish_progress(transcription.id, transcription.user_id, 'transcribing')
             
             # Call Voxtral API (may take minutes for long audio)
             response = requests.post(
@@ -93,6 +140,8 @@ def process_transcription(self, transcription_id):
             response.raise_for_status()
             result = response.json()
         
+        events.publish_progress(transcription.id, transcription.user_id, 'finalizing')
+        
         # Extract transcription text
         if result.get('status') != 'ok':
             raise Exception(f"Voxtral API error: {result}")
@@ -103,6 +152,7 @@ def process_transcription(self, transcription_id):
         
         # Update transcription with result
         transcription.transcribed_text = transcribed_text
+        transcription.segments = normalize_segments(segments)
         transcription.status = 'completed'
         transcription.completed_at = timezone.now()
         
@@ -112,6 +162,7 @@ def process_transcription(self, transcription_id):
         
         transcription.save(update_fields=[
             'transcribed_text',
+            'segments',
             'status',
             'completed_at',
             'language',
@@ -123,11 +174,16 @@ def process_transcription(self, transcription_id):
             f"({len(transcribed_text)} chars, {len(segments)} segments)"
         )
         
-        # Send notification if enabled
+        # Send notification if enabled (digest users are picked up later)
         try:
             user_settings = transcription.user.transcription_settings
             if user_settings and user_settings.notifications_enabled:
-                send_completion_email(transcription)
+                if user_settings.notification_mode == 'digest':
+                    Transcription.objects.filter(id=transcription.id).update(
+                        notification_pending=True
+                    )
+                else:
+                    send_completion_email(transcription)
         except Exception as e:
             logger.warning(f"Failed to send notification: {e}")
         
@@ -247,4 +303,180 @@ Transcription Platform
         )
         logger.info(f"Sent completion email to {transcription.user.email}")
     except Exception as e:
-        logger.error(f"Failed to send email: {e}")
\ No newline at end of file
+        logger.error(f"Failed to send email: {e}")
+
+
+def build_completion_digest(user, transcriptions):
+    """Build one email summarizing several completed transcriptions."""
+    count = len(transcriptions)
+    subject = f'{count} Transcription{"s" if count != 1 else ""} Complete'
+    
+    lines = [
+        f"- {t['title'] or 'Untitled'} "
+        f"({t['language'] or 'auto-detected'}, "
+        f"completed {t['completed_at'].strftime('%Y-%m-%d %H:%M')}): "
+        f"[YOUR_FRONTEND_URL]/transcriptions/{t['id']}"
+        for t in transcriptions
+    ]
+    message = "\n".join([
+        f"Hello {user.email},",
+        "",
+        f"{count} of your transcriptions are now complete:",
+        "",
+        *lines,
+        "",
+        "Best regards,",
+        "Transcription Platform",
+    ])
+    return EmailMessage(
+        subject=subject,
+        body=message,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[user.email],
+    )
+
+
+@shared_task(ignore_result=True)
+def send_completion_digests():
+    """
+    Send one digest email per user whose digest window has elapsed.
+
+    A user's window starts with their oldest pending completion; everything
+    completed until it closes is collected into a single message.
+    """
+    now = timezone.now()
+    pending = (
+        Transcription.objects
+        .filter(notification_pending=True)
+        .values('user')
+        .annotate(
+            first_completed=Min('completed_at'),
+            window=Max('user__transcription_settings__digest_window_minutes'),
+        )
+    )
+    due_users = [
+        row['user'] for row in pending
+        if row['first_completed'] is None
+        or row['first_completed'] <= now - timedelta(minutes=row['window'] or 0)
+    ]
+    if not due_users:
+        return 0
+    
+    rows = (
+        Transcription.objects
+        .filter(user__in=due_users, notification_pending=True)
+        .select_related('user', 'user__transcription_settings')
+        .only(
+            'id', 'title', 'language', 'completed_at',
+            'user__email',
+            'user__transcription_settings__notifications_enabled',
+        )
+        .order_by('user', 'completed_at')
+    )
+    by_user = {}
+    for t in rows:
+        by_user.setdefault(t.user, []).append(t)
+    
+    messages, handled = [], []
+    for user, transcriptions in by_user.items():
+        handled.extend(t.id for t in transcriptions)
+        user_settings = getattr(user, 'transcription_settings', None)
+        if not user.email or not (user_settings and user_settings.notifications_enabled):
+            continue
+        messages.append(build_completion_digest(user, [
+            {
+                'id': t.id,
+                'title': t.title,
+                'language': t.language,
+                'completed_at': t.completed_at or now,
+            }
+            for t in transcriptions
+        ]))
+    
+    if messages:
+        get_connection().send_messages(messages)
+    Transcription.objects.filter(id__in=handled).update(notification_pending=False)
+    
+    logger.info(
+        f"Sent {len(messages)} completion digest(s) covering "
+        f"{len(handled)} transcription(s)"
+    )
+    return len(messages)
+
+
+@shared_task(ignore_result=True)
+def relay_task_outbox():
+    """Publish pending TaskOutbox rows to the broker (periodic sweep)."""
+    return relay_pending()
+
+
+@shared_task(ignore_result=True)
+def purge_task_outbox():
+    """Delete published TaskOutbox rows past the retention period."""
+    deleted = purge_sent()
+    logger.info(f"Purged {deleted} sent outbox entries")
+    return deleted
+
+
+@shared_task(ignore_result=True)
+def purge_transcription_tombstones():
+    """Delete delta-sync tombstones past the retention period."""
+    deleted = purge_tombstones()
+    logger.info(f"Purged {deleted} transcription tombstones")
+    return deleted
+
+
+@shared_task(ignore_result=True)
+def reconcile_transcription_stats():
+    """Correct drift of the per-user stats rollups."""
+    return reconcile(batch_size=settings.TRANSCRIPTION_STATS_RECONCILE_BATCH_SIZE)
+
+
+@shared_task(ignore_result=True)
+def rollup_ops_metrics_buckets():
+    """Roll minute ops metrics up into hours and days; prune old buckets."""
+    return rollup_ops_metrics()
+
+
+@shared_task(ignore_result=True)
+def send_queued_emails():
+    """
+    Drain the email outbox on the dedicated mail queue.
+
+    Keeps delivering batches while full batches come back, up to
+    EMAIL_OUTBOX_MAX_BATCHES per run; the periodic sweep handles the rest.
+    """
+    # Allow new mail to schedule another drain while this one runs
+    cache.delete(DRAIN_SCHEDULED_KEY)
+    totals = {'sent': 0, 'failed': 0}
+    for _ in range(settings.EMAIL_OUTBOX_MAX_BATCHES):
+        result = deliver_pending()
+        totals['sent'] += result['sent']
+        totals['failed'] += result['failed']
+        if result['claimed'] < settings.EMAIL_OUTBOX_BATCH_SIZE:
+            break
+    return totals
+
+
+@shared_task(ignore_result=True)
+def purge_completed_audio():
+    """Delete audio of completed transcriptions per user opt-in and retention."""
+    return purge_audio()
+
+
+@shared_task(ignore_result=True)
+def collect_orphaned_audio_objects(dry_run=False):
+    """Reconcile stored audio against the database and delete orphans."""
+    return collect_orphaned_audio(dry_run=dry_run)
+
+
+@shared_task(ignore_result=True)
+def archive_old_transcripts():
+    """Move old transcript text to compressed cold storage."""
+    return archive_transcripts()
+
+
+@shared_task(ignore_result=True)
+def index_archived_transcripts():
+    """Index archived transcripts that have no search vector yet."""
+    return index_archived()
@@ -218,7 +218,7 @@ class TranscriptionViewSetIntegrationTests(APITestCase):
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIsInstance(response.data, list)
+        self.assertIsInstance(response.data['results'], list)
     
     def test_health_endpoint(self):
         """Testet dass Health-Endpunkt weiterhin funktioniert"""
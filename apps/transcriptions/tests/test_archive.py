@@ -0,0 +1,111 @@
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+from django.utils import timezone
+from rest_framework.test import APIClient
+from apps.transcriptions.archive import archive_transcripts, load_archive
+from apps.transcriptions.models import Transcription
+
+User = get_user_model()
+
+LONG_TEXT = "Guten Tag, dies ist ein langes Transkript. " * 100
+
+
+@pytest.fixture(autouse=True)
+def _archive_settings(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.TRANSCRIPT_ARCHIVE_AFTER_DAYS = 30
+    settings.TRANSCRIPT_PREVIEW_CHARS = 50
+    load_archive.cache_clear()
+
+
+@pytest.fixture
+def owner():
+    return User.objects.create_user(
+        username="archiver",
+        email="archiver@example.com",
+        password="password123",
+    )
+
+
+def _completed(user, days_ago, text=LONG_TEXT):
+    return Transcription.objects.create(
+        user=user,
+        title="Old",
+        status="completed",
+        transcribed_text=text,
+        completed_at=timezone.now() - timedelta(days=days_ago),
+    )
+
+
+@pytest.mark.django_db
+class TestTranscriptArchive:
+    """Tests for cold-tier archival of transcript text."""
+
+    def test_archives_old_text_and_keeps_preview(self, owner):
+        old = _completed(owner, days_ago=60)
+        recent = _completed(owner, days_ago=1)
+        short = _completed(owner, days_ago=60, text="kurz")
+
+        result = archive_transcripts()
+
+        assert result["archived"] == 1
+        assert result["stored_bytes"] < result["raw_bytes"]
+        old.refresh_from_db()
+        assert old.is_text_archived
+        assert len(old.transcribed_text) <= 51
+        assert LONG_TEXT.startswith(old.transcribed_text.rstrip("…"))
+        assert default_storage.exists(old.text_archive_key)
+        assert old.full_text == LONG_TEXT
+        recent.refresh_from_db()
+        short.refresh_from_db()
+        assert not recent.is_text_archived
+        assert not short.is_text_archived
+
+    def test_detail_rehydrates_list_keeps_preview(self, owner):
+        old = _completed(owner, days_ago=60)
+        archive_transcripts()
+        client = APIClient()
+        client.force_authenticate(user=owner)
+        base = "/rest/api/v1/transcribe/transcriptions/"
+
+        detail = client.get(f"{base}{old.id}/")
+        assert detail.data["transcribed_text"] == LONG_TEXT
+
+        listing = client.get(base)
+        results = listing.data["results"] if isinstance(listing.data, dict) else listing.data
+        assert results[0].get("transcribed_text", "") != LONG_TEXT
+
+    def test_rehydration_is_cached(self, owner):
+        old = _completed(owner, days_ago=60)
+        archive_transcripts()
+        old.refresh_from_db()
+
+        old.full_text
+        old.full_text
+        assert load_archive.cache_info().hits == 1
+
+    def test_delete_removes_archive_object(self, owner, django_capture_on_commit_callbacks):
+        old = _completed(owner, days_ago=60)
+        archive_transcripts()
+        old.refresh_from_db()
+        client = APIClient()
+        client.force_authenticate(user=owner)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = client.delete(f"/rest/api/v1/transcribe/transcriptions/{old.id}/")
+
+        assert response.status_code == 204
+        assert not default_storage.exists(old.text_archive_key)
+
+    def test_deleting_the_user_removes_archive_objects(self, owner, django_capture_on_commit_callbacks):
+        old = _completed(owner, days_ago=60)
+        archive_transcripts()
+        old.refresh_from_db()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            owner.delete()
+
+        assert not default_storage.exists(old.text_archive_key)
@@ -0,0 +1,79 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+from apps.transcriptions.models import Transcription
+
+User = get_user_model()
+
+URL = "/rest/api/v1/transcribe/transcriptions/autocomplete/"
+
+
+@pytest.fixture
+def owner_client():
+    user = User.objects.create_user(
+        username="typist",
+        email="typist@example.com",
+        password="password123",
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client, user
+
+
+def _titles(response):
+    return [r["title"] for r in response.data["results"]]
+
+
+@pytest.mark.django_db
+class TestAutocomplete:
+    """Tests for the title autocomplete endpoint."""
+
+    def test_prefix_matches_come_first(self, owner_client):
+        client, user = owner_client
+        Transcription.objects.create(user=user, title="Board meeting")
+        Transcription.objects.create(user=user, title="Meeting notes")
+        Transcription.objects.create(user=user, title="Interview")
+
+        response = client.get(URL, {"q": "  MEET "})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert _titles(response) == ["Meeting notes", "Board meeting"]
+        assert set(response.data["results"][0]) == {"id", "title", "status", "created_at"}
+
+    def test_short_input_returns_nothing(self, owner_client):
+        client, user = owner_client
+        Transcription.objects.create(user=user, title="Meeting")
+        assert _titles(client.get(URL, {"q": "m"})) == []
+
+    def test_only_own_titles(self, owner_client):
+        client, _ = owner_client
+        other = User.objects.create_user(username="other", email="other@example.com", password="x")
+        Transcription.objects.create(user=other, title="Meeting")
+        assert _titles(client.get(URL, {"q": "meet"})) == []
+
+    def test_invalid_limit(self, owner_client):
+        client, _ = owner_client
+        assert client.get(URL, {"q": "meet", "limit": "x"}).status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_keystrokes_are_cached_until_titles_change(
+        self, owner_client, settings, django_capture_on_commit_callbacks
+    ):
+        settings.DASHBOARD_CACHE_ENABLED = True
+        cache.clear()
+        client, user = owner_client
+        with django_capture_on_commit_callbacks(execute=True):
+            t = Transcription.objects.create(user=user, title="Meeting")
+
+        assert _titles(client.get(URL, {"q": "meet"})) == ["Meeting"]
+        with CaptureQueriesContext(connection) as ctx:
+            assert _titles(client.get(URL, {"q": "Meet"})) == ["Meeting"]
+        assert not [q for q in ctx.captured_queries if "transcriptions_transcription" in q["sql"]]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            t.title = "Retro"
+            t.save(update_fields=["title", "updated_at"])
+        assert _titles(client.get(URL, {"q": "meet"})) == []
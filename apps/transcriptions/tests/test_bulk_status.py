@@ -0,0 +1,99 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+from apps.transcriptions import redis_client
+from apps.transcriptions.models import Transcription
+
+User = get_user_model()
+
+URL = "/rest/api/v1/transcribe/transcriptions/status/"
+
+
+@pytest.fixture
+def fake_redis(settings, monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    settings.STATUS_CACHE_ENABLED = True
+    client = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(redis_client, "_client", client)
+    return client
+
+
+@pytest.fixture
+def owner_client():
+    user = User.objects.create_user(
+        username="dashboard",
+        email="dashboard@example.com",
+        password="password123",
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client, user
+
+
+def _bulk(client, ids):
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(URL, {"ids": ",".join(str(pk) for pk in ids)})
+    queries = [q for q in ctx.captured_queries if "transcriptions_transcription" in q["sql"]]
+    return response, queries
+
+
+@pytest.mark.django_db
+class TestBulkStatus:
+    """Tests for GET /transcriptions/status/?ids=."""
+
+    def test_returns_status_map_in_one_query(self, owner_client):
+        client, user = owner_client
+        done = Transcription.objects.create(user=user, title="A", status="completed")
+        running = [Transcription.objects.create(user=user, title=f"T{i}", status="processing") for i in range(20)]
+
+        response, queries = _bulk(client, [done.id] + [t.id for t in running])
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(queries) == 1
+        assert len(response.data) == 21
+        assert response.data[str(done.id)]["is_complete"] is True
+        assert response.data[str(running[0].id)]["status"] == "processing"
+        assert "id" not in response.data[str(done.id)]
+
+    def test_foreign_and_unknown_ids_are_left_out(self, owner_client):
+        client, user = owner_client
+        other = User.objects.create_user(username="other", email="o@example.com", password="x")
+        mine = Transcription.objects.create(user=user, title="A")
+        theirs = Transcription.objects.create(user=other, title="Secret")
+
+        response, _ = _bulk(client, [mine.id, theirs.id, 999999])
+
+        assert list(response.data) == [str(mine.id)]
+
+    def test_served_from_status_cache(self, fake_redis, owner_client, django_capture_on_commit_callbacks):
+        client, user = owner_client
+        with django_capture_on_commit_callbacks(execute=True):
+            cached = Transcription.objects.create(user=user, title="A", status="failed", error_message="boom")
+        uncached = Transcription.objects.create(user=user, title="B")
+
+        response, queries = _bulk(client, [cached.id, uncached.id])
+        assert response.data[str(cached.id)]["error_message"] == "boom"
+        assert response.data[str(uncached.id)]["status"] == "pending"
+        # The miss went to the database and is cached now
+        assert len(queries) == 1
+
+        response, queries = _bulk(client, [cached.id, uncached.id])
+        assert queries == []
+        assert len(response.data) == 2
+
+    def test_cache_does_not_serve_other_users_ids(self, fake_redis, owner_client, django_capture_on_commit_callbacks):
+        client, _ = owner_client
+        other = User.objects.create_user(username="other", email="o@example.com", password="x")
+        with django_capture_on_commit_callbacks(execute=True):
+            t = Transcription.objects.create(user=other, title="Secret")
+
+        response, _ = _bulk(client, [t.id])
+        assert response.data == {}
+
+    @pytest.mark.parametrize("ids", ["", "1,abc", ",".join(str(i) for i in range(1, 502))])
+    def test_rejects_invalid_ids(self, owner_client, ids):
+        client, _ = owner_client
+        assert client.get(URL, {"ids": ids}).status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,153 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.test import APIClient
+from apps.transcriptions import conditional
+from apps.transcriptions.models import Transcription
+
+User = get_user_model()
+
+URL = "/rest/api/v1/transcribe/transcriptions/"
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+
+
+@pytest.fixture
+def owner_client():
+    user = User.objects.create_user(
+        username="etag",
+        email="etag@example.com",
+        password="password123",
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client, user
+
+
+def _transcription_queries(client, url, **headers):
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(url, **headers)
+    return response, [q for q in ctx.captured_queries if "transcriptions_transcription" in q["sql"]]
+
+
+@pytest.mark.django_db
+class TestConditionalGet:
+    """Tests for ETag / Last-Modified handling on detail, status and list."""
+
+    @pytest.mark.parametrize("suffix", ["", "status/"])
+    def test_matching_etag_returns_304_without_row_fetch(self, owner_client, suffix):
+        client, user = owner_client
+        t = Transcription.objects.create(user=user, title="A")
+        url = f"{URL}{t.id}/{suffix}"
+
+        first = client.get(url)
+        assert first.status_code == status.HTTP_200_OK
+        assert first["Last-Modified"] == http_date(t.updated_at.timestamp())
+        assert "no-cache" in first["Cache-Control"]
+
+        # Warm the version cache, then repeat
+        client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        response, queries = _transcription_queries(client, url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == first["ETag"]
+        assert queries == []
+
+    def test_weak_etag_from_compression_matches(self, owner_client):
+        client, user = owner_client
+        t = Transcription.objects.create(user=user, title="A")
+        etag = client.get(f"{URL}{t.id}/")["ETag"]
+
+        response = client.get(f"{URL}{t.id}/", HTTP_IF_NONE_MATCH=f"W/{etag}")
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_update_changes_etag(self, owner_client, django_capture_on_commit_callbacks):
+        client, user = owner_client
+        t = Transcription.objects.create(user=user, title="A", status="processing")
+        etag = client.get(f"{URL}{t.id}/status/")["ETag"]
+        client.get(f"{URL}{t.id}/status/", HTTP_IF_NONE_MATCH=etag)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            t.status = "completed"
+            t.save(update_fields=["status", "updated_at"])
+
+        response = client.get(f"{URL}{t.id}/status/", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["status"] == "completed"
+        assert response["ETag"] != etag
+
+    def test_if_modified_since(self, owner_client):
+        client, user = owner_client
+        t = Transcription.objects.create(user=user, title="A")
+        last_modified = client.get(f"{URL}{t.id}/status/")["Last-Modified"]
+
+        response = client.get(f"{URL}{t.id}/status/", HTTP_IF_MODIFIED_SINCE=last_modified)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_other_users_transcription_is_not_found(self, owner_client):
+        client, _ = owner_client
+        other = User.objects.create_user(username="other", email="o@example.com", password="x")
+        t = Transcription.objects.create(user=other, title="Secret")
+
+        response = client.get(f"{URL}{t.id}/", HTTP_IF_NONE_MATCH="*")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_representation_is_part_of_etag(self, owner_client):
+        client, user = owner_client
+        t = Transcription.objects.create(user=user, title="A")
+        etag = client.get(f"{URL}{t.id}/")["ETag"]
+
+        response = client.get(f"{URL}{t.id}/?fields=id,title", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_list_etag_changes_with_new_transcription(self, owner_client, django_capture_on_commit_callbacks):
+        client, user = owner_client
+        Transcription.objects.create(user=user, title="A")
+        first = client.get(URL)
+        assert client.get(URL, HTTP_IF_NONE_MATCH=first["ETag"]).status_code == status.HTTP_304_NOT_MODIFIED
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Transcription.objects.create(user=user, title="B")
+
+        response = client.get(URL, HTTP_IF_NONE_MATCH=first["ETag"])
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["results"]) == 2
+
+    def test_list_etag_changes_on_delete(self, owner_client, django_capture_on_commit_callbacks):
+        client, user = owner_client
+        t = Transcription.objects.create(user=user, title="A")
+        etag = client.get(URL)["ETag"]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            t.delete()
+
+        assert client.get(URL, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_200_OK
+
+    def test_metrics_report_hit_rate(self, owner_client):
+        client, user = owner_client
+        t = Transcription.objects.create(user=user, title="A")
+        etag = client.get(f"{URL}{t.id}/status/")["ETag"]
+        client.get(f"{URL}{t.id}/status/", HTTP_IF_NONE_MATCH=etag)
+        client.get(f"{URL}{t.id}/status/", HTTP_IF_NONE_MATCH='"stale"')
+
+        assert conditional.metrics()["status"] == {
+            "requests": 3,
+            "conditional": 2,
+            "not_modified": 1,
+            "hit_rate": 0.5,
+        }
+
+        staff = APIClient()
+        staff.force_authenticate(user=User.objects.create_user(
+            username="staff", email="s@example.com", password="x", is_staff=True,
+        ))
+        response = staff.get("/rest/api/v1/transcribe/metrics/conditional-get/")
+        assert response.data["status"]["hit_rate"] == 0.5
+        assert client.get("/rest/api/v1/transcribe/metrics/conditional-get/").status_code == 403
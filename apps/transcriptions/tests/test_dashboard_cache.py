@@ -0,0 +1,116 @@
+import threading
+import time
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from apps.transcriptions import dashboard_cache
+from apps.transcriptions.models import Transcription
+
+User = get_user_model()
+
+URL = "/rest/api/v1/transcribe/transcriptions/"
+
+
+@pytest.fixture(autouse=True)
+def enabled(settings):
+    settings.DASHBOARD_CACHE_ENABLED = True
+    cache.clear()
+
+
+@pytest.fixture
+def owner_client():
+    user = User.objects.create_user(
+        username="dashboard",
+        email="dashboard@example.com",
+        password="password123",
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client, user
+
+
+def _queries(client, url, params=None):
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(url, params)
+    return response, [q for q in ctx.captured_queries if "transcriptions_transcription" in q["sql"]]
+
+
+@pytest.mark.django_db
+class TestDashboardCache:
+    """Tests for the versioned stats/timeline response cache."""
+
+    @pytest.mark.parametrize("endpoint", ["stats/", "timeline/"])
+    def test_repeat_requests_are_served_from_cache(self, owner_client, endpoint):
+        client, user = owner_client
+        Transcription.objects.create(user=user, title="A", duration_seconds=10)
+
+        first, queries = _queries(client, URL + endpoint)
+        assert queries
+        second, queries = _queries(client, URL + endpoint)
+        assert queries == []
+        assert second.data == first.data
+
+    def test_parameters_are_part_of_the_key(self, owner_client):
+        client, user = owner_client
+        assert len(client.get(URL + "timeline/", {"days": 7}).data) == 7
+        assert len(client.get(URL + "timeline/", {"days": 3}).data) == 3
+
+    def test_changes_bump_the_version(self, owner_client, django_capture_on_commit_callbacks):
+        client, user = owner_client
+        assert client.get(URL + "stats/").data["total_transcriptions"] == 0
+
+        with django_capture_on_commit_callbacks(execute=True):
+            t = Transcription.objects.create(user=user, title="A")
+        assert client.get(URL + "stats/").data["total_transcriptions"] == 1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            t.status = "completed"
+            t.save(update_fields=["status", "updated_at"])
+        assert client.get(URL + "stats/").data["status_counts"] == {"completed": 1}
+
+        with django_capture_on_commit_callbacks(execute=True):
+            t.delete()
+        assert client.get(URL + "stats/").data["total_transcriptions"] == 0
+
+    def test_unrelated_saves_keep_the_version(self, owner_client, django_capture_on_commit_callbacks):
+        _, user = owner_client
+        t = Transcription.objects.create(user=user, title="A")
+        version = dashboard_cache.get_version(user.id)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            t.error_message = "ignored"
+            t.save(update_fields=["error_message", "updated_at"])
+        assert dashboard_cache.get_version(user.id) == version
+
+    def test_concurrent_misses_compute_once(self, settings):
+        settings.DASHBOARD_CACHE_POLL_INTERVAL = 0.01
+        calls, results = [], []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.2)
+            return {"value": 42}
+
+        def request():
+            results.append(dashboard_cache.get_or_compute("stats", 1, {}, compute))
+
+        threads = [threading.Thread(target=request) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == [{"value": 42}] * 5
+
+    def test_failed_computation_releases_the_lock(self):
+        def broken():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            dashboard_cache.get_or_compute("stats", 1, {}, broken)
+        assert dashboard_cache.get_or_compute("stats", 1, {}, lambda: "ok") == "ok"
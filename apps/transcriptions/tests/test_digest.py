@@ -0,0 +1,73 @@
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.utils import timezone
+from apps.transcriptions.models import Transcription, TranscriptionSettings
+from apps.transcriptions.tasks import send_completion_digests
+
+User = get_user_model()
+
+
+@pytest.fixture
+def digest_user():
+    user = User.objects.create_user(
+        username="digestuser",
+        email="digest@example.com",
+        password="password123",
+    )
+    TranscriptionSettings.objects.create(
+        user=user,
+        notification_mode="digest",
+        digest_window_minutes=10,
+    )
+    return user
+
+
+def _completed(user, title, minutes_ago):
+    return Transcription.objects.create(
+        user=user,
+        title=title,
+        status="completed",
+        completed_at=timezone.now() - timedelta(minutes=minutes_ago),
+        notification_pending=True,
+    )
+
+
+@pytest.mark.django_db
+class TestCompletionDigest:
+    """Tests for digest completion notifications."""
+
+    def test_burst_collapses_into_one_email(self, digest_user):
+        """All pending completions are sent as a single message."""
+        for i in range(5):
+            _completed(digest_user, f"Recording {i}", minutes_ago=15 - i)
+
+        assert send_completion_digests() == 1
+
+        assert len(mail.outbox) == 1
+        assert mail.outbox[0].to == ["digest@example.com"]
+        assert "5 Transcriptions Complete" in mail.outbox[0].subject
+        for i in range(5):
+            assert f"Recording {i}" in mail.outbox[0].body
+        assert not Transcription.objects.filter(notification_pending=True).exists()
+
+    def test_waits_for_window_to_close(self, digest_user):
+        """Nothing is sent while the oldest completion is inside the window."""
+        _completed(digest_user, "Fresh", minutes_ago=2)
+
+        assert send_completion_digests() == 0
+        assert len(mail.outbox) == 0
+        assert Transcription.objects.filter(notification_pending=True).count() == 1
+
+    def test_disabled_notifications_clear_pending(self, digest_user):
+        """Users who turned notifications off get no digest."""
+        TranscriptionSettings.objects.filter(user=digest_user).update(
+            notifications_enabled=False
+        )
+        _completed(digest_user, "Muted", minutes_ago=30)
+
+        assert send_completion_digests() == 0
+        assert len(mail.outbox) == 0
+        assert not Transcription.objects.filter(notification_pending=True).exists()
@@ -0,0 +1,153 @@
+import json
+import threading
+import time
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import AsyncClient
+from django.urls import resolve
+from rest_framework import status
+from rest_framework.test import APIClient
+from apps.transcriptions import events, redis_client
+from apps.transcriptions.models import Transcription
+
+User = get_user_model()
+
+URL = "/rest/api/v1/transcribe/transcriptions/"
+
+
+@pytest.fixture
+def fake_redis(settings, monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    settings.STATUS_CACHE_ENABLED = True
+    settings.STATUS_EVENTS_ENABLED = True
+    client = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(redis_client, "_client", client)
+    return client
+
+
+@pytest.fixture
+def owner_client():
+    user = User.objects.create_user(
+        username="longpoll",
+        email="longpoll@example.com",
+        password="password123",
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client, user
+
+
+def _long_poll(user, url, etag):
+    """GET ``url`` through the ASGI handler, where long polls may block."""
+    client = AsyncClient()
+    client.force_login(user)
+
+    async def get():
+        return await client.get(url, headers={"If-None-Match": etag})
+
+    return async_to_sync(get)()
+
+
+def _publish_later(transcription, delay, **changes):
+    row = (
+        transcription.id,
+        changes.get("status", transcription.status),
+        transcription.created_at,
+        changes.get("updated_at", transcription.updated_at),
+        changes.get("completed_at"),
+        "",
+    )
+    timer = threading.Timer(delay, events.publish_status, args=(row, transcription.user_id))
+    timer.start()
+    return timer
+
+
+@pytest.mark.django_db
+class TestStatusEvents:
+    """Tests for pub/sub status events and the long-poll status endpoint."""
+
+    def test_transition_is_published(self, fake_redis, owner_client, django_capture_on_commit_callbacks):
+        _, user = owner_client
+        pubsub = fake_redis.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(events.channel(user.id))
+
+        with django_capture_on_commit_callbacks(execute=True):
+            t = Transcription.objects.create(user=user, title="A", status="processing")
+
+        message = None
+        for _ in range(10):
+            message = message or pubsub.get_message(timeout=0.1)
+        assert json.loads(message["data"]) == {
+            "type": "status",
+            "id": t.id,
+            "status": "processing",
+            "created_at": t.created_at.isoformat(),
+            "updated_at": t.updated_at.isoformat(),
+            "completed_at": "",
+            "error_message": "",
+        }
+
+    def test_stale_etag_returns_immediately(self, fake_redis, owner_client):
+        client, user = owner_client
+        t = Transcription.objects.create(user=user, title="A")
+
+        started = time.monotonic()
+        response = _long_poll(user, f"{URL}{t.id}/status/?wait=5", '"old"')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert time.monotonic() - started < 1
+
+    def test_blocks_until_transition(self, fake_redis, owner_client):
+        client, user = owner_client
+        t = Transcription.objects.create(user=user, title="A", status="processing")
+        etag = client.get(f"{URL}{t.id}/status/")["ETag"]
+
+        timer = _publish_later(t, 0.3, status="completed", updated_at=t.updated_at.replace(year=2100))
+        started = time.monotonic()
+        response = _long_poll(user, f"{URL}{t.id}/status/?wait=5", etag)
+        timer.join()
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["status"] == "completed"
+        assert response.data["is_complete"] is True
+        assert 0.2 < time.monotonic() - started < 4
+
+    def test_ignores_other_transcriptions(self, fake_redis, owner_client):
+        client, user = owner_client
+        t = Transcription.objects.create(user=user, title="A")
+        other = Transcription.objects.create(user=user, title="B")
+        etag = client.get(f"{URL}{t.id}/status/")["ETag"]
+
+        timer = _publish_later(other, 0.1, status="completed")
+        response = _long_poll(user, f"{URL}{t.id}/status/?wait=1", etag)
+        timer.join()
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+
+    def test_wait_requires_if_none_match(self, fake_redis, owner_client):
+        client, user = owner_client
+        t = Transcription.objects.create(user=user, title="A")
+
+        started = time.monotonic()
+        assert client.get(f"{URL}{t.id}/status/?wait=5").status_code == status.HTTP_200_OK
+        assert time.monotonic() - started < 1
+
+    def test_wsgi_request_does_not_block(self, fake_redis, owner_client):
+        cache.clear()
+        client, user = owner_client
+        t = Transcription.objects.create(user=user, title="A")
+        etag = client.get(f"{URL}{t.id}/status/")["ETag"]
+
+        started = time.monotonic()
+        response = client.get(f"{URL}{t.id}/status/?wait=5", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert time.monotonic() - started < 1
+
+    def test_status_route_is_not_atomic(self):
+        match = resolve(f"{URL}1/status/")
+        assert match.func._non_atomic_requests == {"default"}
@@ -0,0 +1,157 @@
+import io
+import json
+import tracemalloc
+import warnings
+import zipfile
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.test import AsyncClient
+from rest_framework import status
+from rest_framework.test import APIClient
+from apps.transcriptions import export
+from apps.transcriptions.models import Transcription
+
+User = get_user_model()
+
+URL = "/rest/api/v1/transcribe/transcriptions/export/"
+
+
+@pytest.fixture
+def owner_client():
+    user = User.objects.create_user(
+        username="exporter",
+        email="exporter@example.com",
+        password="password123",
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client, user
+
+
+def _archive(response):
+    assert response.status_code == status.HTTP_200_OK
+    assert response.streaming
+    assert response["Content-Type"] == "application/zip"
+    return zipfile.ZipFile(io.BytesIO(b"".join(response.streaming_content)))
+
+
+@pytest.mark.django_db
+class TestExport:
+    """Tests for the streaming ZIP export."""
+
+    def test_txt_archive_of_selected_ids(self, owner_client):
+        client, user = owner_client
+        a = Transcription.objects.create(user=user, title="Team Sync", transcribed_text="Hallo Welt")
+        b = Transcription.objects.create(user=user, title="", transcribed_text="Second")
+        Transcription.objects.create(user=user, title="Not selected")
+        other = User.objects.create_user(username="other", email="other@example.com", password="x")
+        foreign = Transcription.objects.create(user=other, title="Foreign")
+
+        archive = _archive(client.get(URL, {"ids": f"{a.id},{b.id},{foreign.id}"}))
+
+        assert sorted(archive.namelist()) == sorted([f"{a.id}-team-sync.txt", f"{b.id}-untitled.txt"])
+        assert archive.read(f"{a.id}-team-sync.txt").decode() == "Hallo Welt"
+        assert archive.testzip() is None
+
+    def test_json_and_srt_with_filters(self, owner_client):
+        client, user = owner_client
+        done = Transcription.objects.create(
+            user=user, title="Done", status="completed", duration_seconds=3725, transcribed_text="Text"
+        )
+        Transcription.objects.create(user=user, title="Pending")
+
+        archive = _archive(client.get(URL, {"file_format": "json", "status": "completed"}))
+        data = json.loads(archive.read(f"{done.id}-done.json"))
+        assert archive.namelist() == [f"{done.id}-done.json"]
+        assert data["text"] == "Text"
+        assert data["duration_seconds"] == 3725
+
+        archive = _archive(client.get(URL, {"file_format": "srt", "status": "completed"}))
+        assert archive.read(f"{done.id}-done.srt").decode() == "1\n00:00:00,000 --> 01:02:05,000\nText\n\n"
+
+    def test_unreadable_transcripts_are_reported(self, owner_client, monkeypatch):
+        client, user = owner_client
+        ok = Transcription.objects.create(user=user, title="Ok", transcribed_text="fine")
+        broken = Transcription.objects.create(user=user, title="Broken", text_archive_key="missing.zst")
+
+        def load(key):
+            raise OSError("gone")
+
+        monkeypatch.setattr("apps.transcriptions.archive.load_archived_text", load)
+        archive = _archive(client.get(URL))
+
+        assert f"{ok.id}-ok.txt" in archive.namelist()
+        assert f"{broken.id}" in archive.read("errors.txt").decode()
+
+    @pytest.mark.parametrize("params", [
+        {"file_format": "pdf"},
+        {"ids": "1,x"},
+        {"created_after": "yesterday"},
+        {"created_after": "2026-01-01T00:00:00"},
+    ])
+    def test_invalid_parameters(self, owner_client, params):
+        client, _ = owner_client
+        assert client.get(URL, params).status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_too_many_files(self, owner_client, settings):
+        settings.EXPORT_MAX_FILES = 1
+        client, user = owner_client
+        Transcription.objects.create(user=user, title="A")
+        Transcription.objects.create(user=user, title="B")
+        assert client.get(URL).status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_memory_does_not_grow_with_archive_size(self, owner_client, settings):
+        settings.EXPORT_CHUNK_SIZE = 50
+        _, user = owner_client
+        text = "lorem ipsum " * 2000
+        Transcription.objects.bulk_create(
+            Transcription(user=user, title=f"T{i}", transcribed_text=text) for i in range(400)
+        )
+        ids = list(Transcription.objects.filter(user=user).order_by("id").values_list("id", flat=True))
+
+        def peak(limit):
+            queryset = Transcription.objects.filter(id__in=ids[:limit])
+            tracemalloc.start()
+            size = sum(len(chunk) for chunk in export.stream_archive(queryset, "txt"))
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return size, peak
+
+        small_size, small_peak = peak(50)
+        large_size, large_peak = peak(400)
+        assert large_size > 6 * small_size
+        # Bounded by one fetch chunk, not by the archive
+        assert large_peak < 2 * small_peak
+
+
+@pytest.mark.django_db(transaction=True)
+def test_streams_chunk_by_chunk_under_asgi(settings, monkeypatch):
+    settings.EXPORT_CHUNK_SIZE = 2
+    user = User.objects.create_user(username="asgi", email="asgi@example.com", password="password123")
+    Transcription.objects.bulk_create(
+        Transcription(user=user, title=f"T{i}", transcribed_text=f"Text {i}") for i in range(5)
+    )
+    rendered = []
+    monkeypatch.setitem(export.FORMATS, "txt", lambda t: rendered.append(t.id) or t.full_text)
+    client = AsyncClient()
+    client.force_login(user)
+
+    async def download():
+        response = await client.get(URL)
+        chunks = []
+        # Iterated like the ASGI handler does
+        async for chunk in response:
+            chunks.append((chunk, len(rendered)))
+        return response, chunks
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings("error", message="StreamingHttpResponse must consume")
+        response, chunks = async_to_sync(download)()
+
+    assert response.is_async
+    # One chunk per file, each sent before the next file was rendered
+    assert [count for _, count in chunks[:5]] == [1, 2, 3, 4, 5]
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(chunk for chunk, _ in chunks)))
+    assert len(archive.namelist()) == 5
@@ -0,0 +1,134 @@
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.test import APIClient
+from apps.transcriptions import fastpath
+from apps.transcriptions.models import Transcription
+from apps.transcriptions.serializers import TranscriptionListSerializer, TranscriptionSerializer
+
+User = get_user_model()
+
+URL = "/rest/api/v1/transcribe/transcriptions/"
+FAST_FIELDS = [f for f in TranscriptionSerializer.Meta.fields if f != "audio_file"]
+
+
+@pytest.fixture
+def owner():
+    return User.objects.create_user(
+        username="fast",
+        email="fast@example.com",
+        password="password123",
+    )
+
+
+def _seed(user, count):
+    now = timezone.now()
+    statuses = ["pending", "processing", "completed", "failed"]
+    Transcription.objects.bulk_create([
+        Transcription(
+            user=user,
+            title=f"Recording {i}",
+            status=statuses[i % 4],
+            language="de" if i % 2 else "en",
+            duration_seconds=None if i % 5 == 0 else i,
+            file_size=i * 1000,
+            transcribed_text="Text " * (i % 7),
+            error_message="boom" if i % 4 == 3 else "",
+            completed_at=now - timedelta(minutes=i) if i % 4 == 2 else None,
+        )
+        for i in range(count)
+    ])
+
+
+def _fast(user, fields):
+    columns, serialize = fastpath.make_row_serializer(fields, user=user)
+    rows = Transcription.objects.filter(user=user).order_by("-id").values_list(*columns)
+    return [serialize(row) for row in rows]
+
+
+def _drf(user, serializer_class, fields):
+    queryset = Transcription.objects.filter(user=user).order_by("-id")
+    data = serializer_class(queryset, many=True, context={"fields": set(fields)}).data
+    return [dict(row) for row in data]
+
+
+@pytest.mark.django_db
+class TestFastPathParity:
+    """The fast path must render exactly what TranscriptionSerializer renders."""
+
+    def test_full_field_set_matches_serializer(self, owner):
+        _seed(owner, 20)
+        assert _fast(owner, FAST_FIELDS) == _drf(owner, TranscriptionSerializer, FAST_FIELDS)
+
+    def test_list_representation_matches_serializer(self, owner):
+        _seed(owner, 20)
+        fields = TranscriptionListSerializer.Meta.fields
+        assert _fast(owner, fields) == _drf(owner, TranscriptionListSerializer, fields)
+
+    def test_list_endpoint_uses_fast_path(self, owner):
+        _seed(owner, 3)
+        client = APIClient()
+        client.force_authenticate(user=owner)
+
+        response = client.get(f"{URL}?fields=id,user,status,created_at")
+        expected = _drf(owner, TranscriptionSerializer, ["id", "user", "status", "created_at"])
+        assert response.data["results"] == expected
+
+    def test_audio_file_falls_back_to_serializer(self, owner):
+        _seed(owner, 2)
+        client = APIClient()
+        client.force_authenticate(user=owner)
+
+        response = client.get(f"{URL}?fields=id,audio_file")
+        assert [set(row) for row in response.data["results"]] == [{"id", "audio_file"}] * 2
+
+    def test_status_endpoint(self, owner):
+        _seed(owner, 4)
+        client = APIClient()
+        client.force_authenticate(user=owner)
+        t = Transcription.objects.filter(user=owner, status="failed").first()
+
+        response = client.get(f"{URL}{t.id}/status/")
+
+        assert response.data == {
+            "id": t.id,
+            "status": "failed",
+            "created_at": t.created_at,
+            "updated_at": t.updated_at,
+            "completed_at": None,
+            "error_message": "boom",
+            "is_processing": False,
+            "is_complete": False,
+        }
+
+    def test_status_endpoint_non_numeric_id(self, owner, settings):
+        settings.STATUS_CACHE_ENABLED = True
+        client = APIClient()
+        client.force_authenticate(user=owner)
+
+        response = client.get(f"{URL}abc/status/")
+
+        assert response.status_code == 404
+
+
+@pytest.mark.slow
+@pytest.mark.django_db
+@pytest.mark.parametrize("rows", [1_000, 10_000])
+@pytest.mark.parametrize("path", ["drf", "fast"])
+def test_benchmark_list_serialization(benchmark, owner, rows, path):
+    """pytest-benchmark: DRF serializer vs values_list() fast path."""
+    pytest.importorskip("pytest_benchmark")
+    _seed(owner, rows)
+    fields = TranscriptionListSerializer.Meta.fields
+
+    if path == "drf":
+        def run():
+            return _drf(owner, TranscriptionListSerializer, fields)
+    else:
+        def run():
+            return _fast(owner, fields)
+
+    result = benchmark.pedantic(run, rounds=3, iterations=1)
+    assert len(result) == rows
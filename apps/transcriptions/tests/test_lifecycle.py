@@ -0,0 +1,152 @@
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.utils import timezone
+from apps.transcriptions.lifecycle import (
+    ORPHAN_GC_CHECKPOINT,
+    PURGE_CHECKPOINT,
+    collect_orphaned_audio,
+    purge_audio,
+)
+from apps.transcriptions.models import (
+    MaintenanceCheckpoint,
+    Transcription,
+    TranscriptionSettings,
+)
+from apps.transcriptions.storage import delete_objects
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def _media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+
+
+def _make_user(username, auto_delete):
+    user = User.objects.create_user(
+        username=username,
+        email=f"{username}@example.com",
+        password="password123",
+    )
+    TranscriptionSettings.objects.create(user=user, auto_delete_audio=auto_delete)
+    return user
+
+
+def _with_audio(user, status="completed", days_ago=0):
+    transcription = Transcription.objects.create(
+        user=user,
+        status=status,
+        completed_at=timezone.now() - timedelta(days=days_ago),
+    )
+    transcription.audio_file.save(f"{user.username}.mp3", ContentFile(b"audio"))
+    return transcription
+
+
+@pytest.mark.django_db
+class TestAudioPurge:
+    """Tests for the auto_delete_audio lifecycle worker."""
+
+    def test_purges_only_opted_in_completed_audio(self, settings):
+        settings.AUDIO_RETENTION_DAYS = 0
+        opted_in = _make_user("optin", auto_delete=True)
+        kept = _make_user("keep", auto_delete=False)
+        purged = _with_audio(opted_in)
+        processing = _with_audio(opted_in, status="processing")
+        other = _with_audio(kept)
+        purged_name = purged.audio_file.name
+
+        result = purge_audio()
+
+        assert result == {"deleted": 1, "failed": 0, "finished": True}
+        purged.refresh_from_db()
+        assert not purged.audio_file
+        assert not default_storage.exists(purged_name)
+        processing.refresh_from_db()
+        other.refresh_from_db()
+        assert processing.audio_file
+        assert other.audio_file
+
+    def test_global_retention_applies_to_everyone(self, settings):
+        settings.AUDIO_RETENTION_DAYS = 30
+        user = _make_user("retention", auto_delete=False)
+        old = _with_audio(user, days_ago=40)
+        recent = _with_audio(user, days_ago=1)
+
+        purge_audio()
+
+        old.refresh_from_db()
+        recent.refresh_from_db()
+        assert not old.audio_file
+        assert recent.audio_file
+
+    def test_checkpoint_resumes_interrupted_pass(self):
+        user = _make_user("batches", auto_delete=True)
+        items = [_with_audio(user) for _ in range(3)]
+
+        result = purge_audio(batch_size=2, max_batches=1)
+        assert result["finished"] is False
+        state = MaintenanceCheckpoint.objects.get(job=PURGE_CHECKPOINT).state
+        assert state["last_id"] == items[1].id
+
+        result = purge_audio(batch_size=2, max_batches=1)
+        assert result == {"deleted": 1, "failed": 0, "finished": True}
+        assert MaintenanceCheckpoint.objects.get(job=PURGE_CHECKPOINT).state["last_id"] == 0
+        assert not Transcription.objects.exclude(audio_file=None).exists()
+
+
+def test_delete_objects_uses_delete_objects_batches():
+    """S3 keys are deleted with one DeleteObjects call per 1000 keys."""
+    storage = mock.Mock()
+    storage._normalize_name.side_effect = lambda name: f"media/{name}"
+    storage.bucket.delete_objects.return_value = {
+        "Errors": [{"Key": "media/audio/5.mp3", "Message": "AccessDenied"}],
+    }
+    names = [f"audio/{i}.mp3" for i in range(2500)]
+
+    deleted, failed = delete_objects(names, storage=storage)
+
+    calls = storage.bucket.delete_objects.call_args_list
+    assert [len(c.kwargs["Delete"]["Objects"]) for c in calls] == [1000, 1000, 500]
+    assert failed == {"audio/5.mp3": "AccessDenied"}
+    assert len(deleted) == 2499
+
+
+@pytest.mark.django_db
+class TestOrphanedAudioCollector:
+    """Tests for reconciling stored audio against the database."""
+
+    def _store(self, name, content=b"orphan"):
+        return default_storage.save(name, ContentFile(content))
+
+    def test_deletes_only_old_unreferenced_objects(self):
+        user = _make_user("gc", auto_delete=False)
+        referenced = _with_audio(user)
+        orphan = self._store("audio/2025/01/orphan.mp3", b"x" * 100)
+
+        # Fresh orphans are protected by the grace period
+        report = collect_orphaned_audio()
+        assert report["scanned"] == 2
+        assert report["deleted"] == 0
+        assert default_storage.exists(orphan)
+
+        report = collect_orphaned_audio(grace=timedelta(0))
+        assert report["deleted"] == 1
+        assert report["bytes_reclaimed"] == 100
+        assert not default_storage.exists(orphan)
+        assert default_storage.exists(referenced.audio_file.name)
+        checkpoint = MaintenanceCheckpoint.objects.get(job=ORPHAN_GC_CHECKPOINT)
+        assert checkpoint.state["last_report"]["bytes_reclaimed"] == 100
+
+    def test_dry_run_reports_without_deleting(self):
+        orphan = self._store("audio/2025/02/orphan.mp3", b"y" * 10)
+
+        report = collect_orphaned_audio(grace=timedelta(0), dry_run=True)
+
+        assert report["orphaned"] == 1
+        assert report["bytes_reclaimed"] == 10
+        assert default_storage.exists(orphan)
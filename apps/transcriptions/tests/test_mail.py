@@ -0,0 +1,109 @@
+from unittest import mock
+
+import pytest
+from django.core import mail
+from django.core.mail import EmailMultiAlternatives, get_connection, send_mail
+from django.utils import timezone
+from apps.transcriptions.mail import deliver_pending
+from apps.transcriptions.models import EmailOutbox, TaskOutbox
+
+
+@pytest.fixture
+def outbox_backend(settings):
+    settings.EMAIL_BACKEND = "apps.transcriptions.mail.OutboxEmailBackend"
+    settings.EMAIL_DELIVERY_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+
+
+@pytest.mark.django_db
+class TestEmailOutbox:
+    """Tests for the asynchronous email outbox."""
+
+    def test_send_mail_only_queues(self, outbox_backend):
+        """send_mail writes an outbox row and schedules a drain, no SMTP."""
+        send_mail("Hello", "Body", "from@example.com", ["to@example.com"])
+
+        assert len(mail.outbox) == 0
+        entry = EmailOutbox.objects.get()
+        assert entry.status == "pending"
+        assert entry.to == ["to@example.com"]
+        assert TaskOutbox.objects.filter(
+            task_name="apps.transcriptions.tasks.send_queued_emails",
+            queue="mail",
+        ).exists()
+
+    def test_deliver_pending_sends_batch_over_one_connection(self, outbox_backend):
+        """Queued messages round-trip with alternatives and attachments."""
+        message = EmailMultiAlternatives(
+            "Report", "Text", "from@example.com", ["a@example.com"],
+        )
+        message.attach_alternative("<p>Text</p>", "text/html")
+        message.attach("notes.txt", "hello", "text/plain")
+        message.send()
+        send_mail("Second", "Body", "from@example.com", ["b@example.com"])
+
+        real_get_connection = get_connection
+        with mock.patch(
+            "apps.transcriptions.mail.get_connection",
+            side_effect=real_get_connection,
+        ) as get_conn:
+            result = deliver_pending()
+
+        assert get_conn.call_count == 1
+        assert result == {"claimed": 2, "sent": 2, "failed": 0}
+        assert [m.subject for m in mail.outbox] == ["Report", "Second"]
+        assert mail.outbox[0].alternatives[0][1] == "text/html"
+        assert mail.outbox[0].attachments[0][0] == "notes.txt"
+        assert not EmailOutbox.objects.filter(status="pending").exists()
+
+    def test_failed_delivery_backs_off(self, outbox_backend, settings):
+        """Failures are rescheduled and eventually marked failed."""
+        settings.EMAIL_OUTBOX_MAX_ATTEMPTS = 2
+        send_mail("Hello", "Body", "from@example.com", ["to@example.com"])
+
+        with mock.patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            side_effect=OSError("smtp down"),
+        ):
+            result = deliver_pending()
+            assert result["failed"] == 1
+            entry = EmailOutbox.objects.get()
+            assert entry.attempts == 1
+            assert entry.next_attempt_at > timezone.now()
+
+            # Not due yet
+            assert deliver_pending()["claimed"] == 0
+
+            EmailOutbox.objects.update(next_attempt_at=timezone.now())
+            deliver_pending()
+
+        entry.refresh_from_db()
+        assert entry.status == "failed"
+        assert "smtp down" in entry.last_error
+
+    def test_rows_are_leased_while_sending(self, outbox_backend):
+        """A concurrent drain skips rows another worker is sending."""
+        send_mail("Hello", "Body", "from@example.com", ["to@example.com"])
+        concurrent = []
+        real_send = mail.backends.locmem.EmailBackend.send_messages
+
+        def send(backend, messages):
+            concurrent.append(deliver_pending())
+            return real_send(backend, messages)
+
+        with mock.patch("django.core.mail.backends.locmem.EmailBackend.send_messages", send):
+            result = deliver_pending()
+
+        assert concurrent == [{"claimed": 0, "sent": 0, "failed": 0}]
+        assert result == {"claimed": 1, "sent": 1, "failed": 0}
+        assert EmailOutbox.objects.get().status == "sent"
+
+    def test_expired_lease_is_retried(self, outbox_backend, settings):
+        """Rows of a worker that died mid-batch are sent once the lease expires."""
+        send_mail("Hello", "Body", "from@example.com", ["to@example.com"])
+        with mock.patch("apps.transcriptions.mail.get_connection", side_effect=SystemExit):
+            with pytest.raises(SystemExit):
+                deliver_pending()
+
+        assert deliver_pending()["claimed"] == 0
+        EmailOutbox.objects.update(next_attempt_at=timezone.now())
+        assert deliver_pending()["sent"] == 1
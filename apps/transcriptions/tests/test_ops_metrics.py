@@ -0,0 +1,136 @@
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from apps.transcriptions import ops_metrics
+from apps.transcriptions.models import OpsMetricsBucket, Transcription
+
+User = get_user_model()
+
+URL = "/rest/api/v1/transcribe/metrics/ops/"
+
+
+@pytest.fixture
+def owner():
+    return User.objects.create_user(
+        username="ops",
+        email="ops@example.com",
+        password="password123",
+    )
+
+
+@pytest.fixture
+def staff():
+    return User.objects.create_user(
+        username="staff",
+        email="staff@example.com",
+        password="password123",
+        is_staff=True,
+        is_superuser=True,
+    )
+
+
+def _minutes():
+    return OpsMetricsBucket.objects.filter(resolution="minute")
+
+
+@pytest.mark.django_db
+class TestOpsMetrics:
+    """Tests for the platform-wide ops metric buckets."""
+
+    def test_transitions_are_counted(self, owner, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            done = Transcription.objects.create(user=owner, title="A", duration_seconds=90)
+            failed = Transcription.objects.create(user=owner, title="B")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            done.status = "processing"
+            done.save(update_fields=["status", "updated_at"])
+            done.status = "completed"
+            done.completed_at = done.created_at + timedelta(seconds=45)
+            done.save(update_fields=["status", "completed_at", "updated_at"])
+            failed.status = "failed"
+            failed.save(update_fields=["status", "updated_at"])
+            # Not a transition
+            failed.title = "Renamed"
+            failed.save()
+
+        totals = ops_metrics.summarize(list(_minutes().values(*ops_metrics.COUNTERS, "latency_histogram")))
+        assert totals["submissions"] == 2
+        assert totals["completions"] == 1
+        assert totals["failures"] == 1
+        assert totals["failure_rate"] == 0.5
+        assert totals["audio_seconds"] == 90
+        assert totals["avg_latency_seconds"] == 45
+        assert totals["latency_histogram"] == {"60": 1}
+
+    def test_rollup_builds_hours_and_days(self):
+        now = timezone.now().replace(minute=30)
+        ops_metrics.record(at=now - timedelta(minutes=10), submissions=2)
+        ops_metrics.record(at=now - timedelta(minutes=1), completions=1, latency=700)
+
+        ops_metrics.rollup(now=now)
+
+        hour = OpsMetricsBucket.objects.get(resolution="hour", start=ops_metrics.floor(now, "hour"))
+        day = OpsMetricsBucket.objects.get(resolution="day", start=ops_metrics.floor(now, "day"))
+        for bucket in (hour, day):
+            assert (bucket.submissions, bucket.completions) == (2, 1)
+            assert bucket.latency_histogram == {"1800": 1}
+
+        # Idempotent
+        ops_metrics.rollup(now=now)
+        hour.refresh_from_db()
+        assert hour.submissions == 2
+
+    def test_rollup_prunes_old_minutes(self, settings):
+        now = timezone.now()
+        ops_metrics.record(at=now - settings.OPS_METRICS_MINUTE_RETENTION - timedelta(hours=1), submissions=1)
+        ops_metrics.record(at=now, submissions=1)
+
+        ops_metrics.rollup(now=now)
+        assert _minutes().count() == 1
+
+    def test_query_picks_resolution(self):
+        now = timezone.now()
+        assert ops_metrics.query(now - timedelta(hours=1), now)["resolution"] == "minute"
+        assert ops_metrics.query(now - timedelta(days=7), now)["resolution"] == "hour"
+        assert ops_metrics.query(now - timedelta(days=90), now)["resolution"] == "day"
+
+    def test_endpoint_is_staff_only(self, owner, staff):
+        ops_metrics.record(submissions=3)
+
+        client = APIClient()
+        client.force_authenticate(user=owner)
+        assert client.get(URL).status_code == status.HTTP_403_FORBIDDEN
+
+        client.force_authenticate(user=staff)
+        response = client.get(URL, {"start": (timezone.now() - timedelta(hours=1)).isoformat().replace("+00:00", "Z")})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["resolution"] == "minute"
+        assert response.data["totals"]["submissions"] == 3
+        assert client.get(URL, {"resolution": "week"}).status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.parametrize("params", [
+        {"start": "garbage"},
+        {"end": ""},
+        {"start": "2026-13-01T00:00:00Z"},
+        {"start": "2026-01-01T00:00:00"},
+        {"start": "2026-01-02T00:00:00Z", "end": "2026-01-01T00:00:00Z"},
+    ])
+    def test_invalid_range_is_rejected(self, staff, params):
+        client = APIClient()
+        client.force_authenticate(user=staff)
+        assert client.get(URL, params).status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_admin_dashboard(self, staff):
+        ops_metrics.record(submissions=1)
+        client = Client()
+        client.force_login(staff)
+        response = client.get(reverse("admin:transcriptions_opsmetricsbucket_changelist"))
+        assert response.status_code == 200
+        assert b"Platform operations" in response.content
@@ -0,0 +1,114 @@
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from apps.transcriptions.models import TaskOutbox, Transcription
+from apps.transcriptions.outbox import enqueue_task, relay_pending
+from apps.transcriptions.tasks import claim_transcription, process_transcription
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def _media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+
+
+@pytest.fixture
+def authenticated_client():
+    user = User.objects.create_user(
+        username="outboxuser",
+        email="outbox@example.com",
+        password="password123",
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client, user
+
+
+@pytest.mark.django_db
+class TestTaskOutbox:
+    """Tests for the transactional task outbox."""
+
+    def test_create_writes_outbox_instead_of_publishing(self, authenticated_client):
+        """POST stores a pending outbox row; nothing is sent before commit."""
+        client, user = authenticated_client
+        audio_file = SimpleUploadedFile("a.mp3", b"fake", content_type="audio/mpeg")
+        with mock.patch("celery.app.base.Celery.send_task") as send_task:
+            response = client.post(
+                "/rest/api/v1/transcribe/transcriptions/",
+                {"title": "Outbox", "audio_file": audio_file},
+                format="multipart",
+            )
+        assert response.status_code == status.HTTP_201_CREATED
+        send_task.assert_not_called()
+
+        entry = TaskOutbox.objects.get()
+        assert entry.task_name == process_transcription.name
+        assert entry.args == [response.data["id"]]
+        assert entry.sent_at is None
+
+    def test_publishes_after_commit(self, authenticated_client, django_capture_on_commit_callbacks):
+        """The on-commit hook publishes the row with its pre-assigned task id."""
+        _, user = authenticated_client
+        transcription = Transcription.objects.create(user=user, title="x")
+        with mock.patch("celery.app.base.Celery.send_task") as send_task:
+            with django_capture_on_commit_callbacks(execute=True):
+                entry = enqueue_task(process_transcription, transcription.id)
+
+        send_task.assert_called_once()
+        assert send_task.call_args.kwargs["task_id"] == entry.task_id
+        entry.refresh_from_db()
+        assert entry.is_sent
+
+    def test_relay_publishes_pending_in_bulk(self):
+        """The relay drains pending rows and leaves failed rows for retry."""
+        for i in range(3):
+            enqueue_task("apps.transcriptions.tasks.process_transcription", i)
+
+        def fake_send(name, args=None, kwargs=None, **options):
+            if args == [1]:
+                raise ConnectionError("broker down")
+
+        with mock.patch("celery.app.base.Celery.send_task", side_effect=fake_send):
+            result = relay_pending()
+
+        assert result["published"] == 2
+        assert result["failed"] == 1
+        failed = TaskOutbox.objects.get(sent_at__isnull=True)
+        assert failed.args == [1]
+        assert failed.attempts == 1
+        assert "broker down" in failed.last_error
+
+        with mock.patch("celery.app.base.Celery.send_task"):
+            assert relay_pending()["published"] == 1
+        assert not TaskOutbox.objects.filter(sent_at__isnull=True).exists()
+
+    def test_duplicate_delivery_is_ignored(self, authenticated_client, monkeypatch):
+        """A re-published task does not process a job another delivery owns."""
+        _, user = authenticated_client
+        transcription = Transcription.objects.create(user=user, title="x", status="processing")
+        post = mock.Mock()
+        monkeypatch.setattr("apps.transcriptions.tasks.requests.post", post)
+
+        result = process_transcription.run(transcription.id)
+
+        assert result["status"] == "duplicate"
+        post.assert_not_called()
+        transcription.refresh_from_db()
+        assert transcription.status == "processing"
+
+    def test_stale_processing_job_is_reclaimed(self, authenticated_client):
+        """A job whose worker died past the time limit can be claimed again."""
+        _, user = authenticated_client
+        transcription = Transcription.objects.create(user=user, title="x", status="processing")
+        assert claim_transcription(transcription.id) is None
+        Transcription.objects.filter(id=transcription.id).update(
+            updated_at=timezone.now() - timedelta(hours=1)
+        )
+        assert claim_transcription(transcription.id).status == "processing"
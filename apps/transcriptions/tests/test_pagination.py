@@ -0,0 +1,96 @@
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from apps.transcriptions.models import Transcription
+
+User = get_user_model()
+
+URL = "/rest/api/v1/transcribe/transcriptions/"
+
+
+@pytest.fixture
+def owner_client():
+    user = User.objects.create_user(
+        username="pager",
+        email="pager@example.com",
+        password="password123",
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client, user
+
+
+def _seed(user, count):
+    now = timezone.now()
+    rows = Transcription.objects.bulk_create([
+        Transcription(user=user, title=f"T{i}") for i in range(count)
+    ])
+    # Several rows share a timestamp to exercise the id tie-breaker
+    for i, row in enumerate(rows):
+        Transcription.objects.filter(id=row.id).update(
+            created_at=now - timedelta(minutes=i // 3)
+        )
+    return list(
+        Transcription.objects.filter(user=user)
+        .order_by("-created_at", "-id")
+        .values_list("id", flat=True)
+    )
+
+
+@pytest.mark.django_db
+class TestKeysetPagination:
+    """Tests for cursor pagination of the transcription list."""
+
+    def test_walks_all_pages_in_stable_order(self, owner_client):
+        client, user = owner_client
+        expected = _seed(user, 25)
+
+        seen, url = [], f"{URL}?page_size=10"
+        while url:
+            response = client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            seen.extend(row["id"] for row in response.data["results"])
+            url = response.data["next"]
+
+        assert seen == expected
+
+    def test_previous_link_returns_prior_page(self, owner_client):
+        client, user = owner_client
+        expected = _seed(user, 12)
+
+        first = client.get(f"{URL}?page_size=5")
+        second = client.get(first.data["next"])
+        assert [r["id"] for r in second.data["results"]] == expected[5:10]
+
+        back = client.get(second.data["previous"])
+        assert [r["id"] for r in back.data["results"]] == expected[:5]
+        assert first.data["previous"] is None
+
+    def test_page_size_is_capped(self, owner_client, settings):
+        settings.TRANSCRIPTION_MAX_PAGE_SIZE = 3
+        client, user = owner_client
+        _seed(user, 5)
+
+        response = client.get(f"{URL}?page_size=1000")
+        assert len(response.data["results"]) == 3
+
+    def test_seek_query_uses_no_offset(self, owner_client):
+        client, user = owner_client
+        _seed(user, 6)
+        first = client.get(f"{URL}?page_size=2")
+
+        with CaptureQueriesContext(connection) as ctx:
+            client.get(first.data["next"])
+        sql = " ".join(q["sql"] for q in ctx.captured_queries).upper()
+        assert "OFFSET" not in sql
+
+    def test_invalid_cursor(self, owner_client):
+        client, _ = owner_client
+        response = client.get(f"{URL}?cursor=not-a-cursor")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,105 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from apps.transcriptions import rollups
+from apps.transcriptions.models import Transcription, TranscriptionStats
+
+User = get_user_model()
+
+URL = "/rest/api/v1/transcribe/transcriptions/stats/"
+
+
+@pytest.fixture
+def owner_client():
+    user = User.objects.create_user(
+        username="stats",
+        email="stats@example.com",
+        password="password123",
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client, user
+
+
+def _rollup(user):
+    stats = TranscriptionStats.objects.get(user=user)
+    return {name: getattr(stats, name) for name in rollups.empty_stats()}
+
+
+@pytest.mark.django_db
+class TestStatsRollup:
+    """Tests for the incrementally maintained per-user stats."""
+
+    def test_rollup_follows_create_update_delete(self, owner_client):
+        _, user = owner_client
+        a = Transcription.objects.create(user=user, title="A", duration_seconds=60, file_size=1000)
+        b = Transcription.objects.create(user=user, title="B", duration_seconds=30, language="en")
+
+        a.status = "completed"
+        a.save(update_fields=["status", "updated_at"])
+        b.model_name = "voxtral-mini"
+        b.duration_seconds = 45
+        b.save()
+        a.delete()
+
+        assert _rollup(user) == rollups.compute(user.id) == {
+            "total_transcriptions": 1,
+            "total_duration_seconds": 45,
+            "total_file_size_bytes": 0,
+            "status_counts": {"pending": 1},
+            "language_counts": {"en": 1},
+            "model_counts": {"voxtral-mini": 1},
+        }
+
+    def test_unrelated_update_fields_skip_rollup(self, owner_client):
+        _, user = owner_client
+        t = Transcription.objects.create(user=user, title="A")
+        t.title = "Renamed"
+        with CaptureQueriesContext(connection) as ctx:
+            t.save(update_fields=["title", "updated_at"])
+        assert not any("transcriptionstats" in q["sql"] for q in ctx.captured_queries)
+
+    def test_stats_endpoint_reads_rollup_row(self, owner_client):
+        client, user = owner_client
+        for i in range(3):
+            Transcription.objects.create(user=user, title=str(i), duration_seconds=10, status="completed")
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(URL)
+        queries = [q for q in ctx.captured_queries if "transcriptions_transcription" in q["sql"]]
+
+        assert response.data["total_transcriptions"] == 3
+        assert response.data["total_duration_seconds"] == 30
+        assert response.data["status_counts"] == {"completed": 3}
+        assert len(response.data["recent_transcriptions"]) == 3
+        # Rollup row plus the recent-5 range scan
+        assert len(queries) == 2
+
+    def test_missing_rollup_is_built_on_read(self, owner_client):
+        client, user = owner_client
+        Transcription.objects.create(user=user, title="A", duration_seconds=10)
+        TranscriptionStats.objects.all().delete()
+
+        assert client.get(URL).data["total_duration_seconds"] == 10
+        assert TranscriptionStats.objects.filter(user=user).exists()
+
+    def test_reconcile_corrects_drift(self, owner_client):
+        _, user = owner_client
+        t = Transcription.objects.create(user=user, title="A", duration_seconds=10)
+        # Bypasses save(), so the rollup drifts
+        Transcription.objects.filter(id=t.id).update(duration_seconds=99, status="failed")
+        other = User.objects.create_user(username="other", email="o@example.com", password="x")
+        Transcription.objects.create(user=other, title="B")
+        TranscriptionStats.objects.filter(user=other).delete()
+
+        assert rollups.reconcile(batch_size=1) == {"checked": 1, "corrected": 1, "daily_corrected": 1}
+        assert _rollup(user) == rollups.compute(user.id)
+        assert _rollup(other) == rollups.compute(other.id)
+
+    def test_user_deletion_removes_rollup(self, owner_client):
+        _, user = owner_client
+        Transcription.objects.create(user=user, title="A")
+        user.delete()
+        assert not TranscriptionStats.objects.exists()
@@ -0,0 +1,153 @@
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import Value
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from apps.transcriptions import search
+from apps.transcriptions.archive import archive_transcripts, load_archive
+from apps.transcriptions.models import Transcription
+
+User = get_user_model()
+
+URL = "/rest/api/v1/transcribe/transcriptions/search/"
+
+postgres_only = pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="Full-text search needs PostgreSQL"
+)
+
+
+@pytest.fixture
+def owner_client():
+    user = User.objects.create_user(
+        username="searcher",
+        email="searcher@example.com",
+        password="password123",
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client, user
+
+
+@pytest.fixture
+def archived(owner_client, settings, tmp_path):
+    """A transcription whose only mention of "Nadelöhr" is past the archived preview."""
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.TRANSCRIPT_PREVIEW_CHARS = 50
+    load_archive.cache_clear()
+    _, user = owner_client
+    transcription = Transcription.objects.create(
+        user=user,
+        title="Verkehr",
+        language="de",
+        status="completed",
+        transcribed_text="Der Bericht beginnt mit dem Wetter. " * 5 + "Die Brücke ist ein Nadelöhr.",
+        completed_at=timezone.now() - timedelta(days=settings.TRANSCRIPT_ARCHIVE_AFTER_DAYS + 1),
+    )
+    assert archive_transcripts()["archived"] == 1
+    transcription.refresh_from_db()
+    assert "Nadelöhr" not in transcription.transcribed_text
+    return transcription
+
+
+@pytest.mark.django_db
+class TestSearch:
+    """Tests for the transcript search endpoint."""
+
+    def test_finds_own_transcripts_with_headline(self, owner_client):
+        client, user = owner_client
+        other = User.objects.create_user(username="other", email="other@example.com", password="x")
+        Transcription.objects.create(
+            user=user, title="Weekly", transcribed_text="We discussed the quarterly budget today."
+        )
+        Transcription.objects.create(user=user, title="Other", transcribed_text="Nothing relevant")
+        Transcription.objects.create(user=other, title="Foreign", transcribed_text="Budget talk")
+
+        response = client.get(URL, {"q": "budget"})
+
+        assert response.status_code == status.HTTP_200_OK
+        results = response.data["results"]
+        assert [r["title"] for r in results] == ["Weekly"]
+        assert "<mark>budget</mark>" in results[0]["headline"]
+        assert "transcribed_text" not in results[0]
+
+    def test_limit_is_clamped(self, owner_client, settings):
+        settings.SEARCH_MAX_PAGE_SIZE = 2
+        client, user = owner_client
+        for i in range(3):
+            Transcription.objects.create(user=user, title=f"Meeting {i}")
+
+        assert len(client.get(URL, {"q": "meeting", "limit": 50}).data["results"]) == 2
+
+    @pytest.mark.parametrize("params", [{}, {"q": "  "}, {"q": "x" * 201}, {"q": "a", "limit": "many"}])
+    def test_invalid_parameters(self, owner_client, params):
+        client, _ = owner_client
+        assert client.get(URL, params).status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_snippet_marks_first_match(self):
+        text = "a" * 300 + " Budget " + "b" * 300
+        headline = search.snippet(text, "budget")
+        assert "<mark>Budget</mark>" in headline
+        assert headline.startswith("…") and headline.endswith("…")
+        assert len(headline) < 250
+
+    def test_vector_follows_searchable_fields(self):
+        assert search.affects_vector(None)
+        assert search.affects_vector(["transcribed_text", "status"])
+        assert not search.affects_vector(["status", "updated_at"])
+
+    def test_archived_rows_are_indexed_from_archived_text(self, archived, monkeypatch):
+        texts = []
+
+        def build_vector(text=None):
+            texts.append(text)
+            return Value(None)
+
+        monkeypatch.setattr(search, "supported", lambda: True)
+        monkeypatch.setattr(search, "build_vector", build_vector)
+        search.update_vector(archived.pk)
+
+        assert "Nadelöhr" in texts[-1]
+
+    def test_index_archived_catches_up_rows_without_a_vector(self, archived, monkeypatch):
+        Transcription.objects.create(user=archived.user, title="Stored", transcribed_text="Not archived")
+        texts = []
+
+        def build_vector(text=None):
+            texts.append(text)
+            return Value(None)
+
+        monkeypatch.setattr(search, "supported", lambda: True)
+        monkeypatch.setattr(search, "build_vector", build_vector)
+
+        assert search.index_archived() == 1
+        assert len(texts) == 1 and "Nadelöhr" in texts[0]
+
+    @postgres_only
+    def test_finds_terms_past_the_archived_preview(self, owner_client, archived):
+        client, _ = owner_client
+        assert [r["id"] for r in client.get(URL, {"q": "Nadelöhr"}).data["results"]] == [archived.id]
+
+        # Saves that rebuild the vector keep indexing the archived text
+        archived.title = "Verkehrslage"
+        archived.save()
+        assert [r["id"] for r in client.get(URL, {"q": "Nadelöhr"}).data["results"]] == [archived.id]
+
+    @postgres_only
+    def test_ranked_language_aware_search(self, owner_client):
+        client, user = owner_client
+        Transcription.objects.create(
+            user=user, language="de", title="Protokoll", transcribed_text="Die Versammlungen dauerten lange."
+        )
+        Transcription.objects.create(
+            user=user, language="en", title="Running notes", transcribed_text="Running is fun."
+        )
+
+        # Stemmed by the row's configuration
+        assert [r["title"] for r in client.get(URL, {"q": "Versammlung"}).data["results"]] == ["Protokoll"]
+        results = client.get(URL, {"q": "run"}).data["results"]
+        assert [r["title"] for r in results] == ["Running notes"]
+        assert results[0]["rank"] > 0
@@ -0,0 +1,113 @@
+import json
+import time
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from apps.transcriptions.models import Transcription
+
+User = get_user_model()
+
+URL = "/rest/api/v1/transcribe/transcriptions/"
+TEXT = "Das ist ein Satz aus einem langen deutschen Transkript. " * 400
+
+
+@pytest.fixture
+def owner_client():
+    user = User.objects.create_user(
+        username="sparse",
+        email="sparse@example.com",
+        password="password123",
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client, user
+
+
+def _list_sql(client, url):
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(url)
+    sql = [q["sql"] for q in ctx.captured_queries if "transcriptions_transcription" in q["sql"]]
+    return response, sql
+
+
+@pytest.mark.django_db
+class TestSparseFieldsets:
+    """Tests for ?fields= / ?omit= and the light list representation."""
+
+    def test_list_is_light_and_skips_text_column(self, owner_client):
+        client, user = owner_client
+        Transcription.objects.create(user=user, title="A", transcribed_text=TEXT)
+
+        response, sql = _list_sql(client, URL)
+
+        row = response.data["results"][0]
+        assert "transcribed_text" not in row
+        assert row["title"] == "A"
+        assert {"status", "created_at", "is_complete"} <= set(row)
+        assert sql and all("transcribed_text" not in q for q in sql)
+
+    def test_fields_param_selects_columns(self, owner_client):
+        client, user = owner_client
+        Transcription.objects.create(user=user, title="B", transcribed_text=TEXT)
+
+        response, sql = _list_sql(client, f"{URL}?fields=id,title,transcribed_text")
+
+        assert set(response.data["results"][0]) == {"id", "title", "transcribed_text"}
+        assert response.data["results"][0]["transcribed_text"] == TEXT
+        assert "status" not in sql[0].split("FROM")[0]
+
+    def test_omit_on_detail_defers_text(self, owner_client):
+        client, user = owner_client
+        t = Transcription.objects.create(user=user, title="C", transcribed_text=TEXT)
+
+        response, sql = _list_sql(client, f"{URL}{t.id}/?omit=transcribed_text,user")
+
+        assert "transcribed_text" not in response.data
+        assert "user" not in response.data
+        assert response.data["title"] == "C"
+        assert all("transcribed_text" not in q for q in sql)
+
+
+@pytest.mark.slow
+@pytest.mark.django_db
+def test_benchmark_list_payload_and_query_time(owner_client):
+    """Compare the full (before) and light (after) list representation."""
+    client, user = owner_client
+    Transcription.objects.bulk_create([
+        Transcription(user=user, title=f"Recording {i}", transcribed_text=TEXT)
+        for i in range(200)
+    ])
+    full_fields = ",".join([
+        "id", "user", "title", "audio_file", "file_size", "duration_seconds",
+        "transcribed_text", "status", "error_message", "language", "model_name",
+        "created_at", "updated_at", "completed_at", "is_processing", "is_complete",
+    ])
+
+    def measure(url):
+        with CaptureQueriesContext(connection) as ctx:
+            started = time.perf_counter()
+            response = client.get(url)
+            elapsed = time.perf_counter() - started
+        page_sql = next(q["sql"] for q in ctx.captured_queries if "LIMIT" in q["sql"])
+        timings = []
+        # Best of several runs keeps scheduler noise out of the comparison
+        for _ in range(5):
+            started = time.perf_counter()
+            with connection.cursor() as cursor:
+                cursor.execute(page_sql)
+                cursor.fetchall()
+            timings.append(time.perf_counter() - started)
+        return len(json.dumps(response.data, default=str)), elapsed, min(timings)
+
+    before = measure(f"{URL}?page_size=200&fields={full_fields}")
+    after = measure(f"{URL}?page_size=200")
+    summary = (
+        f"list 200 rows: payload {before[0]} -> {after[0]} bytes, "
+        f"request {before[1] * 1000:.1f} -> {after[1] * 1000:.1f} ms, "
+        f"query {before[2] * 1000:.1f} -> {after[2] * 1000:.1f} ms"
+    )
+    assert after[0] * 10 < before[0], summary
+    assert after[2] < before[2], summary
@@ -0,0 +1,150 @@
+import pytest
+import redis
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+from apps.transcriptions import redis_client, status_cache, tasks
+from apps.transcriptions.models import Transcription
+
+User = get_user_model()
+
+URL = "/rest/api/v1/transcribe/transcriptions/"
+
+
+@pytest.fixture
+def fake_redis(settings, monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    settings.STATUS_CACHE_ENABLED = True
+    client = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(redis_client, "_client", client)
+    return client
+
+
+@pytest.fixture
+def owner_client():
+    user = User.objects.create_user(
+        username="poller",
+        email="poller@example.com",
+        password="password123",
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client, user
+
+
+def _status(client, pk):
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(f"{URL}{pk}/status/")
+    queries = [q for q in ctx.captured_queries if "transcriptions_transcription" in q["sql"]]
+    return response, queries
+
+
+@pytest.mark.django_db
+class TestStatusCache:
+    """Tests for the write-through Redis status hash."""
+
+    def test_save_writes_through(self, fake_redis, owner_client, django_capture_on_commit_callbacks):
+        _, user = owner_client
+        with django_capture_on_commit_callbacks(execute=True):
+            t = Transcription.objects.create(user=user, title="A")
+            t.status = "processing"
+            t.save(update_fields=["status", "updated_at"])
+
+        cached = fake_redis.hgetall(f"transcription-status:{t.id}")
+        assert cached["status"] == "processing"
+        assert cached["updated_at"] == t.updated_at.isoformat()
+        assert fake_redis.sismember(f"transcription-user-ids:{user.id}", t.id)
+
+    def test_status_is_served_from_redis(self, fake_redis, owner_client, django_capture_on_commit_callbacks):
+        client, user = owner_client
+        with django_capture_on_commit_callbacks(execute=True):
+            t = Transcription.objects.create(user=user, title="A", status="failed", error_message="boom")
+
+        response, queries = _status(client, t.id)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert queries == []
+        assert response.data["status"] == "failed"
+        assert response.data["error_message"] == "boom"
+        assert response.data["updated_at"] == t.updated_at
+
+    def test_miss_falls_back_to_database_and_fills(self, fake_redis, owner_client):
+        client, user = owner_client
+        t = Transcription.objects.create(user=user, title="A")
+        fake_redis.flushall()
+
+        response, queries = _status(client, t.id)
+        assert response.status_code == status.HTTP_200_OK
+        assert len(queries) == 1
+
+        response, queries = _status(client, t.id)
+        assert queries == []
+
+    def test_other_users_ids_are_not_served(self, fake_redis, owner_client, django_capture_on_commit_callbacks):
+        client, _ = owner_client
+        other = User.objects.create_user(username="other", email="o@example.com", password="x")
+        with django_capture_on_commit_callbacks(execute=True):
+            t = Transcription.objects.create(user=other, title="Secret")
+
+        response = client.get(f"{URL}{t.id}/status/")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_fill_never_overwrites_newer_write(self, fake_redis, owner_client, django_capture_on_commit_callbacks):
+        _, user = owner_client
+        with django_capture_on_commit_callbacks(execute=True):
+            t = Transcription.objects.create(user=user, title="A", status="completed")
+
+        stale = (t.id, "processing", t.created_at, t.updated_at, None, "")
+        status_cache.fill(stale, user.id)
+
+        assert status_cache.read(t.id, user.id)[1] == "completed"
+
+    def test_delete_forgets_entry(self, fake_redis, owner_client, django_capture_on_commit_callbacks):
+        client, user = owner_client
+        with django_capture_on_commit_callbacks(execute=True):
+            t = Transcription.objects.create(user=user, title="A")
+        pk = t.id
+        with django_capture_on_commit_callbacks(execute=True):
+            t.delete()
+
+        assert not fake_redis.exists(f"transcription-status:{pk}")
+        assert client.get(f"{URL}{pk}/status/").status_code == status.HTTP_404_NOT_FOUND
+
+    def test_redis_errors_fall_back_to_database(self, fake_redis, owner_client, monkeypatch):
+        client, user = owner_client
+        t = Transcription.objects.create(user=user, title="A")
+
+        def broken(*args, **kwargs):
+            raise redis.ConnectionError("down")
+
+        monkeypatch.setattr(fake_redis, "pipeline", broken)
+        response = client.get(f"{URL}{t.id}/status/")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["status"] == "pending"
+
+
+@pytest.mark.django_db(transaction=True)
+def test_process_transcription_writes_each_transition(fake_redis, owner_client, monkeypatch, settings, tmp_path):
+    """Autocommit like a worker: every transition is visible as it happens."""
+    settings.MEDIA_ROOT = str(tmp_path)
+    _, user = owner_client
+    t = Transcription.objects.create(user=user, title="A")
+    t.audio_file.save("a.mp3", ContentFile(b"audio"))
+    seen = []
+
+    class FakeResponse:
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            seen.append(status_cache.read(t.id, user.id)[1])
+            return {"status": "ok", "text": "Hallo", "segments": []}
+
+    monkeypatch.setattr(tasks.requests, "post", lambda *args, **kwargs: FakeResponse())
+    tasks.process_transcription.run(t.id)
+
+    assert seen == ["processing"]
+    assert status_cache.read(t.id, user.id)[1] == "completed"
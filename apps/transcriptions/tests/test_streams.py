@@ -0,0 +1,139 @@
+import asyncio
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.test import AsyncClient
+from rest_framework.authtoken.models import Token
+from apps.transcriptions import events, redis_client, streams
+from apps.transcriptions.models import Transcription
+
+User = get_user_model()
+
+URL = "/rest/api/v1/transcribe/events/"
+
+
+@pytest.fixture
+def fake_redis(settings, monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    settings.STATUS_EVENTS_ENABLED = True
+    server = fakeredis.FakeServer()
+    client = fakeredis.FakeRedis(server=server, decode_responses=True)
+    monkeypatch.setattr(redis_client, "_client", client)
+    monkeypatch.setattr(
+        streams, "create_async_redis",
+        lambda: fakeredis.FakeAsyncRedis(server=server, decode_responses=True),
+    )
+    return client
+
+
+@pytest.fixture
+def owner():
+    return User.objects.create_user(
+        username="sse",
+        email="sse@example.com",
+        password="password123",
+    )
+
+
+def _parse(frame):
+    fields = dict(line.split(": ", 1) for line in frame.strip().splitlines())
+    fields["data"] = json.loads(fields["data"])
+    return fields
+
+
+async def _next(chunks):
+    chunk = await asyncio.wait_for(anext(chunks), 5)
+    return chunk.decode() if isinstance(chunk, bytes) else chunk
+
+
+@pytest.mark.django_db
+class TestJobEvents:
+    """Tests for the SSE job event stream."""
+
+    def test_streams_snapshot_progress_and_completion(self, fake_redis, owner):
+        t = Transcription.objects.create(user=owner, title="A", status="processing")
+        Transcription.objects.create(user=owner, title="Done", status="completed")
+
+        async def scenario():
+            client = AsyncClient()
+            await client.aforce_login(owner)
+            response = await client.get(URL)
+            assert response["Content-Type"] == "text/event-stream"
+            chunks = aiter(response.streaming_content)
+            try:
+                assert (await _next(chunks)).startswith("retry:")
+                snapshot = _parse(await _next(chunks))
+                assert snapshot["event"] == "status"
+                assert snapshot["data"]["id"] == t.id
+
+                events.publish_progress(t.id, owner.id, "transcribing")
+                progress = _parse(await _next(chunks))
+                assert progress["event"] == "progress"
+                assert progress["data"] == {"id": t.id, "stage": "transcribing"}
+
+                events.publish_status(
+                    (t.id, "completed", t.created_at, t.updated_at, t.updated_at, ""), owner.id
+                )
+                completion = _parse(await _next(chunks))
+                assert completion["event"] == "completion"
+                assert completion["data"]["is_complete"] is True
+
+                # A client disconnect cancels the pending read; the last
+                # stream of a user unsubscribes the channel
+                pending = asyncio.ensure_future(anext(chunks))
+                await asyncio.sleep(0.05)
+                pending.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await pending
+                assert streams.get_hub().queues == {}
+            finally:
+                await chunks.aclose()
+
+        async_to_sync(scenario)()
+
+    def test_other_users_events_are_not_streamed(self, fake_redis, owner):
+        other = User.objects.create_user(username="other", email="o@example.com", password="x")
+
+        async def scenario():
+            client = AsyncClient()
+            await client.aforce_login(owner)
+            response = await client.get(URL)
+            chunks = aiter(response.streaming_content)
+            try:
+                await _next(chunks)
+                events.publish_progress(99, other.id, "transcribing")
+                events.publish_progress(1, owner.id, "finalizing")
+                assert _parse(await _next(chunks))["data"]["id"] == 1
+            finally:
+                await chunks.aclose()
+
+        async_to_sync(scenario)()
+
+    def test_token_authentication(self, fake_redis, owner):
+        token = Token.objects.create(user=owner)
+
+        async def scenario():
+            response = await AsyncClient().get(URL, headers={"Authorization": f"Token {token.key}"})
+            assert response.status_code == 200
+            chunks = aiter(response.streaming_content)
+            assert (await _next(chunks)).startswith("retry:")
+            await chunks.aclose()
+
+        async_to_sync(scenario)()
+
+    def test_requires_authentication(self, fake_redis):
+        async def scenario():
+            return await AsyncClient().get(URL, headers={"Authorization": "Token invalid"})
+
+        assert async_to_sync(scenario)().status_code == 401
+
+    def test_slow_client_gets_resync(self):
+        async def scenario():
+            queue = asyncio.Queue(maxsize=2)
+            for item in ("a", "b", "c"):
+                streams.EventHub.deliver(queue, item)
+            return [queue.get_nowait() for _ in range(queue.qsize())]
+
+        assert async_to_sync(scenario)() == [streams.RESYNC]
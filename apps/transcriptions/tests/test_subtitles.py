@@ -0,0 +1,179 @@
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+from django.test import AsyncClient
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from apps.transcriptions import subtitles
+from apps.transcriptions.archive import archive_transcripts, load_archive
+from apps.transcriptions.models import Transcription
+
+User = get_user_model()
+
+URL = "/rest/api/v1/transcribe/transcriptions/{pk}/subtitles/{file_format}/"
+
+SEGMENTS = [
+    {"start": 0.0, "end": 2.5, "text": "Guten Morgen zusammen."},
+    {"start": 2.5, "end": 5.0, "text": "Wir beginnen."},
+]
+
+
+@pytest.fixture(autouse=True)
+def _media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+
+
+@pytest.fixture
+def owner_client():
+    user = User.objects.create_user(
+        username="subtitler",
+        email="subtitler@example.com",
+        password="password123",
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client, user
+
+
+def _body(response):
+    if response.streaming:
+        return b"".join(response.streaming_content).decode()
+    return response.content.decode()
+
+
+@pytest.mark.django_db
+class TestSubtitleRendering:
+    """Tests for cue splitting and the SRT/VTT output."""
+
+    def test_srt_and_vtt(self):
+        assert "".join(subtitles.render(SEGMENTS, "srt")) == (
+            "1\n00:00:00,000 --> 00:00:02,500\nGuten Morgen zusammen.\n\n"
+            "2\n00:00:02,500 --> 00:00:05,000\nWir beginnen.\n\n"
+        )
+        assert "".join(subtitles.render(SEGMENTS, "vtt")) == (
+            "WEBVTT\n\n"
+            "00:00:00.000 --> 00:00:02.500\nGuten Morgen zusammen.\n\n"
+            "00:00:02.500 --> 00:00:05.000\nWir beginnen.\n\n"
+        )
+
+    def test_long_segments_are_wrapped_and_split(self, settings):
+        settings.SUBTITLE_MAX_LINE_CHARS = 20
+        settings.SUBTITLE_MAX_LINES = 2
+        text = " ".join(["word"] * 30)
+        cues = list(subtitles.cues([{"start": 10.0, "end": 40.0, "text": text}]))
+
+        assert all(len(lines) <= 2 and all(len(line) <= 20 for line in lines) for _, _, lines in cues)
+        assert all(end - start <= settings.SUBTITLE_MAX_CUE_SECONDS for start, end, _ in cues)
+        assert " ".join(" ".join(lines) for _, _, lines in cues) == text
+        assert cues[0][0] == 10.0 and cues[-1][1] == 40.0
+        # Contiguous, in order
+        assert all(a[1] <= b[0] for a, b in zip(cues, cues[1:]))
+
+    def test_long_cues_are_split_by_duration(self, settings):
+        settings.SUBTITLE_MAX_CUE_SECONDS = 5
+        cues = list(subtitles.cues([{"start": 0, "end": 20, "text": "one two three four five six"}]))
+        assert len(cues) >= 4
+        assert all(end - start <= 5 for start, end, _ in cues)
+
+    def test_normalize_segments_drops_malformed(self):
+        assert subtitles.normalize_segments([
+            {"start": "1.23456", "end": 2, "text": "  Hallo\n Welt "},
+            {"start": 3, "text": "no end"},
+            {"start": 5, "end": 4, "text": "backwards"},
+            {"start": 6, "end": 7, "text": ""},
+            "garbage",
+        ]) == [{"start": 1.235, "end": 2.0, "text": "Hallo Welt"}]
+
+
+@pytest.mark.django_db
+class TestSubtitleEndpoint:
+    """Tests for the cached subtitle download."""
+
+    def test_rendered_once_then_served_from_storage(self, owner_client):
+        client, user = owner_client
+        t = Transcription.objects.create(user=user, title="Standup", status="completed", segments=SEGMENTS)
+        url = URL.format(pk=t.pk, file_format="srt")
+
+        first = client.get(url)
+        assert first.status_code == status.HTTP_200_OK
+        assert first["Content-Type"].startswith("application/x-subrip")
+        assert 'filename="standup.srt"' in first["Content-Disposition"]
+        body = _body(first)
+
+        with mock.patch.object(subtitles, "render", side_effect=AssertionError("re-rendered")):
+            second = client.get(url)
+            assert _body(second) == body
+
+    def test_changes_invalidate_and_clean_up(self, owner_client):
+        client, user = owner_client
+        t = Transcription.objects.create(user=user, title="A", status="completed", segments=SEGMENTS)
+        _body(client.get(URL.format(pk=t.pk, file_format="vtt")))
+        old_name = subtitles.cache_name(t, "vtt")
+        assert default_storage.exists(old_name)
+
+        t.segments = [{"start": 0, "end": 1, "text": "Neu"}]
+        t.save()
+        assert "Neu" in _body(client.get(URL.format(pk=t.pk, file_format="vtt")))
+        assert not default_storage.exists(old_name)
+
+    def test_delete_removes_cached_files(self, owner_client, django_capture_on_commit_callbacks):
+        client, user = owner_client
+        t = Transcription.objects.create(user=user, title="A", status="completed", segments=SEGMENTS)
+        _body(client.get(URL.format(pk=t.pk, file_format="srt")))
+        name = subtitles.cache_name(t, "srt")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            t.delete()
+        assert not default_storage.exists(name)
+
+    def test_unavailable_subtitles(self, owner_client):
+        client, user = owner_client
+        pending = Transcription.objects.create(user=user, title="P", segments=SEGMENTS)
+        legacy = Transcription.objects.create(user=user, title="L", status="completed")
+        other = User.objects.create_user(username="other", email="other@example.com", password="x")
+        foreign = Transcription.objects.create(user=other, status="completed", segments=SEGMENTS)
+
+        assert client.get(URL.format(pk=pending.pk, file_format="srt")).status_code == status.HTTP_409_CONFLICT
+        assert client.get(URL.format(pk=legacy.pk, file_format="srt")).status_code == status.HTTP_404_NOT_FOUND
+        assert client.get(URL.format(pk=foreign.pk, file_format="srt")).status_code == status.HTTP_404_NOT_FOUND
+        assert client.get(URL.format(pk=pending.pk, file_format="ass")).status_code == status.HTTP_404_NOT_FOUND
+        assert client.get(URL.format(pk="abc", file_format="srt")).status_code == status.HTTP_404_NOT_FOUND
+
+    def test_segments_are_archived_with_the_text(self, owner_client, settings):
+        settings.TRANSCRIPT_PREVIEW_CHARS = 10
+        load_archive.cache_clear()
+        client, user = owner_client
+        t = Transcription.objects.create(
+            user=user, title="Alt", status="completed", segments=SEGMENTS,
+            transcribed_text="Guten Morgen zusammen. Wir beginnen.",
+            completed_at=timezone.now() - timedelta(days=settings.TRANSCRIPT_ARCHIVE_AFTER_DAYS + 1),
+        )
+
+        assert archive_transcripts()["archived"] == 1
+        t.refresh_from_db()
+        assert t.segments == []
+        assert t.full_segments == SEGMENTS
+        assert "Wir beginnen." in _body(client.get(URL.format(pk=t.pk, file_format="srt")))
+
+
+@pytest.mark.django_db(transaction=True)
+def test_streams_under_asgi():
+    user = User.objects.create_user(username="asgi", email="asgi@example.com", password="password123")
+    t = Transcription.objects.create(user=user, title="A", status="completed", segments=SEGMENTS)
+    client = AsyncClient()
+    client.force_login(user)
+
+    async def download():
+        response = await client.get(URL.format(pk=t.pk, file_format="vtt"))
+        return response, [chunk async for chunk in response]
+
+    response, chunks = async_to_sync(download)()
+
+    assert response.is_async
+    assert b"".join(chunks).decode().startswith("WEBVTT")
+    assert default_storage.exists(subtitles.cache_name(t, "vtt"))
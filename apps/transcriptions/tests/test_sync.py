@@ -0,0 +1,131 @@
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from apps.transcriptions import sync
+from apps.transcriptions.models import Transcription, TranscriptionTombstone
+
+User = get_user_model()
+
+URL = "/rest/api/v1/transcribe/transcriptions/changes/"
+
+
+@pytest.fixture
+def owner_client():
+    user = User.objects.create_user(
+        username="syncer",
+        email="syncer@example.com",
+        password="password123",
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client, user
+
+
+def _age(*transcriptions, seconds=60):
+    """Move rows out of the settle window, as if written a while ago."""
+    Transcription.objects.filter(id__in=[t.id for t in transcriptions]).update(
+        updated_at=timezone.now() - timedelta(seconds=seconds)
+    )
+
+
+@pytest.mark.django_db
+class TestChanges:
+    """Tests for the delta-sync endpoint."""
+
+    def test_full_sync_then_only_changes(self, owner_client):
+        client, user = owner_client
+        a = Transcription.objects.create(user=user, title="A")
+        b = Transcription.objects.create(user=user, title="B")
+        _age(a, b)
+
+        first = client.get(URL).data
+        assert {row["id"] for row in first["changed"]} == {a.id, b.id}
+        assert first["deleted"] == []
+        assert first["has_more"] is False
+        assert "transcribed_text" not in first["changed"][0]
+
+        # Nothing changed
+        assert client.get(URL, {"since": first["next"]}).data["changed"] == []
+
+        b.status = "completed"
+        b.save()
+        second = client.get(URL, {"since": first["next"]}).data
+        assert [row["id"] for row in second["changed"]] == [b.id]
+        assert second["changed"][0]["is_complete"] is True
+
+    def test_deletions_are_returned_as_tombstones(self, owner_client):
+        client, user = owner_client
+        t = Transcription.objects.create(user=user, title="A")
+        _age(t)
+        token = client.get(URL).data["next"]
+
+        pk = t.id
+        t.delete()
+        data = client.get(URL, {"since": token}).data
+        assert data["deleted"] == [pk]
+        assert data["changed"] == []
+
+    def test_user_deletion_cascades_without_tombstones(self, owner_client):
+        _, user = owner_client
+        Transcription.objects.create(user=user, title="A")
+        user.delete()
+        assert not TranscriptionTombstone.objects.exists()
+
+    def test_pages_until_caught_up(self, owner_client, settings):
+        settings.CHANGES_PAGE_SIZE = 2
+        client, user = owner_client
+        created = [Transcription.objects.create(user=user, title=str(i)) for i in range(5)]
+        _age(*created)
+
+        seen, token, calls = [], None, 0
+        while True:
+            data = client.get(URL, {"since": token} if token else {}).data
+            seen += [row["id"] for row in data["changed"]]
+            token, calls = data["next"], calls + 1
+            if not data["has_more"]:
+                break
+        assert sorted(seen) == [t.id for t in created]
+        assert calls == 3
+
+    def test_recent_changes_are_repeated_within_settle_window(self, owner_client):
+        client, user = owner_client
+        t = Transcription.objects.create(user=user, title="A")
+
+        token = client.get(URL).data["next"]
+        # Still inside the settle window, so delivered again
+        assert [row["id"] for row in client.get(URL, {"since": token}).data["changed"]] == [t.id]
+
+    def test_other_users_changes_are_not_returned(self, owner_client):
+        client, _ = owner_client
+        other = User.objects.create_user(username="other", email="o@example.com", password="x")
+        t = Transcription.objects.create(user=other, title="Secret")
+        t.delete()
+
+        data = client.get(URL).data
+        assert data["changed"] == []
+        assert data["deleted"] == []
+
+    def test_invalid_token(self, owner_client):
+        client, _ = owner_client
+        assert client.get(URL, {"since": "garbage"}).status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_token_older_than_tombstone_retention_is_gone(self, owner_client):
+        client, _ = owner_client
+        old = timezone.now() - timedelta(days=365)
+        token = sync.encode_token((old, 1), (old, 1))
+        assert client.get(URL, {"since": token}).status_code == status.HTTP_410_GONE
+
+    def test_purge_tombstones(self, owner_client, settings):
+        _, user = owner_client
+        TranscriptionTombstone.objects.create(
+            user=user, transcription_id=1,
+            deleted_at=timezone.now() - settings.TRANSCRIPTION_TOMBSTONE_RETENTION - timedelta(days=1),
+        )
+        TranscriptionTombstone.objects.create(user=user, transcription_id=2)
+
+        assert sync.purge_tombstones() == 1
+        assert list(TranscriptionTombstone.objects.values_list("transcription_id", flat=True)) == [2]
@@ -0,0 +1,167 @@
+from datetime import date, timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from apps.transcriptions import rollups
+from apps.transcriptions.models import Transcription, TranscriptionDailyStats
+
+User = get_user_model()
+
+URL = "/rest/api/v1/transcribe/transcriptions/timeline/"
+
+
+@pytest.fixture
+def owner():
+    return User.objects.create_user(
+        username="timeline",
+        email="timeline@example.com",
+        password="password123",
+    )
+
+
+@pytest.fixture
+def owner_client(owner):
+    client = APIClient()
+    client.force_authenticate(user=owner)
+    return client
+
+
+def _create_at(user, created_at, duration=10):
+    t = Transcription.objects.create(user=user, title="T", duration_seconds=duration)
+    # created_at is auto_now_add; callers rebuild the daily rollup after moving it
+    Transcription.objects.filter(id=t.id).update(created_at=created_at)
+    return t
+
+
+def _seed_dense(user, days, per_day):
+    """``per_day`` transcriptions on each of the last ``days`` days."""
+    now = timezone.now()
+    Transcription.objects.bulk_create([
+        Transcription(user=user, title=f"{d}/{i}", duration_seconds=i)
+        for d in range(days)
+        for i in range(per_day)
+    ])
+    ids = list(Transcription.objects.filter(user=user).order_by("id").values_list("id", flat=True))
+    for d in range(days):
+        chunk = ids[d * per_day:(d + 1) * per_day]
+        Transcription.objects.filter(id__in=chunk).update(created_at=now - timedelta(days=d))
+    rollups.sync_daily([user.id])
+
+
+def _legacy_timeline(user, days):
+    """The former on-the-fly timeline: TruncDate per request, next() per day."""
+    end_date = timezone.now().date()
+    start_date = end_date - timedelta(days=days - 1)
+    timeline_data = (
+        Transcription.objects
+        .filter(user=user, created_at__date__gte=start_date, created_at__date__lte=end_date)
+        .annotate(date=TruncDate("created_at"))
+        .values("date")
+        .annotate(count=Count("id"), total_duration=Sum("duration_seconds"))
+        .order_by("date")
+    )
+    result = []
+    current_date = start_date
+    while current_date <= end_date:
+        entry = next(
+            (item for item in timeline_data if item["date"] == current_date),
+            {"date": current_date, "count": 0, "total_duration": 0},
+        )
+        result.append({
+            "date": entry["date"],
+            "count": entry["count"],
+            "total_duration": entry["total_duration"] or 0,
+        })
+        current_date += timedelta(days=1)
+    return result
+
+
+@pytest.mark.django_db
+class TestTimeline:
+    """Tests for the rollup-backed timeline."""
+
+    def test_daily_rollup_follows_create_update_delete(self, owner):
+        today = timezone.localdate()
+        a = Transcription.objects.create(user=owner, title="A", duration_seconds=10)
+        Transcription.objects.create(user=owner, title="B", duration_seconds=5)
+        a.duration_seconds = 30
+        a.save()
+
+        row = TranscriptionDailyStats.objects.get(user=owner, date=today)
+        assert (row.count, row.total_duration) == (2, 35)
+
+        a.delete()
+        row.refresh_from_db()
+        assert (row.count, row.total_duration) == (1, 5)
+
+    def test_matches_legacy_timeline(self, owner, owner_client):
+        now = timezone.now()
+        for offset in (0, 0, 3, 6, 40):
+            _create_at(owner, now - timedelta(days=offset), duration=offset or 7)
+        rollups.sync_daily([owner.id])
+
+        response = owner_client.get(URL, {"days": 30})
+        assert response.status_code == status.HTTP_200_OK
+        expected = _legacy_timeline(owner, 30)
+        assert [(e["date"], e["count"], e["total_duration"]) for e in expected] == [
+            (date.fromisoformat(e["date"]), e["count"], e["total_duration"]) for e in response.data
+        ]
+
+    def test_week_and_month_granularity(self, owner, owner_client):
+        today = timezone.localdate()
+        _create_at(owner, timezone.now())
+        _create_at(owner, timezone.now() - timedelta(days=today.weekday() + 1))
+        rollups.sync_daily([owner.id])
+
+        weeks = owner_client.get(URL, {"days": 14, "granularity": "week"}).data
+        assert weeks[-1]["date"] == (today - timedelta(days=today.weekday())).isoformat()
+        assert weeks[-1]["count"] == 1
+        assert sum(w["count"] for w in weeks) == 2
+
+        months = owner_client.get(URL, {"days": 365, "granularity": "month"}).data
+        assert months[-1]["date"] == today.replace(day=1).isoformat()
+        assert len(months) in (12, 13)
+        assert sum(m["count"] for m in months) == 2
+
+    def test_time_zone_shifts_days(self, owner, owner_client):
+        # 23:30 UTC is already the next day in Berlin
+        late = timezone.now().replace(hour=23, minute=30) - timedelta(days=1)
+        _create_at(owner, late)
+        rollups.sync_daily([owner.id])
+
+        utc = owner_client.get(URL, {"days": 3}).data
+        berlin = owner_client.get(URL, {"days": 3, "tz": "Europe/Berlin"}).data
+        utc_day = late.date().isoformat()
+        berlin_day = (late.date() + timedelta(days=1)).isoformat()
+        assert {e["date"]: e["count"] for e in utc}[utc_day] == 1
+        assert {e["date"]: e["count"] for e in berlin}[berlin_day] == 1
+        assert {e["date"]: e["count"] for e in berlin}.get(utc_day, 0) == 0
+
+    @pytest.mark.parametrize("params", [{"days": "x"}, {"granularity": "year"}, {"tz": "Mars/Base"}])
+    def test_rejects_invalid_parameters(self, owner_client, params):
+        assert owner_client.get(URL, params).status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.slow
+@pytest.mark.django_db
+@pytest.mark.parametrize("path", ["legacy", "rollup"])
+def test_benchmark_timeline_365_days(benchmark, owner, path):
+    """pytest-benchmark: 365 days of dense data, on-the-fly vs rollup timeline."""
+    pytest.importorskip("pytest_benchmark")
+    _seed_dense(owner, days=365, per_day=20)
+
+    if path == "legacy":
+        def run():
+            return _legacy_timeline(owner, 365)
+    else:
+        def run():
+            return rollups.timeline(owner.id, 365)
+
+    result = benchmark.pedantic(run, rounds=3, iterations=1)
+    assert len(result) == 365
+    assert sum(entry["count"] for entry in result) == 365 * 20
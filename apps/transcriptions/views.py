@@ -1,23 +1,46 @@
 import requests
 import logging
-from datetime import datetime, timedelta
+import redis
+import zoneinfo
+from datetime import timedelta
 from django.conf import settings
-from django.db.models import Count, Sum, Q
+from django.core.handlers.asgi import ASGIRequest
+from django.db import connection, transaction
+from django.http import FileResponse, Http404, StreamingHttpResponse
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.text import slugify
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.throttling import UserRateThrottle
+from . import (
+    conditional,
+    dashboard_cache,
+    events,
+    export,
+    fastpath,
+    ops_metrics,
+    rollups,
+    search,
+    status_cache,
+    streams,
+    subtitles,
+    sync,
+)
+from .archive import load_archived_segments
 from .models import Transcription, TranscriptionSettings
 from .serializers import (
     TranscriptionSerializer,
+    TranscriptionListSerializer,
     TranscriptionCreateSerializer,
     TranscriptionSettingsSerializer,
     HealthCheckSerializer,
-    TranscriptionStatsSerializer,
     TranscriptionTimelineSerializer
 )
+from .outbox import enqueue_task
+from .pagination import KeysetCursorPagination
 from .tasks import process_transcription
 from .health import check_database, check_redis, check_storage, check_celery
 
@@ -28,15 +51,75 @@ class TranscriptionRateThrottle(UserRateThrottle):
     scope = "transcription"
 
 
+class ExportRateThrottle(UserRateThrottle):
+    scope = "export"
+
+
 class TranscriptionViewSet(viewsets.ModelViewSet):
     """ViewSet für Transkriptions-Verwaltung"""
     
     permission_classes = [IsAuthenticated]
     serializer_class = TranscriptionSerializer
+    pagination_class = KeysetCursorPagination
+    
+    # Model columns needed to render serializer fields that are not columns
+    # themselves (or need more than their own column)
+    FIELD_COLUMNS = {
+        'is_processing': ['status'],
+        'is_complete': ['status'],
+        'transcribed_text': ['transcribed_text', 'text_archive_key'],
+    }
+    SPARSE_ACTIONS = ('list', 'retrieve')
     
     def get_queryset(self):
         """Nur eigene Transkriptionen anzeigen"""
-        return Transcription.objects.filter(user=self.request.user)
+        queryset = Transcription.objects.filter(user=self.request.user)
+        if self.action in self.SPARSE_ACTIONS:
+            # Only read the columns the response needs; the light list
+            # representation never loads transcribed_text.
+            queryset = queryset.only(*self.get_selected_columns())
+        return queryset
+    
+    def get_serializer_class(self):
+        if self.action == 'list' and self.get_sparse_fields()[0] is None:
+            return TranscriptionListSerializer
+        return super().get_serializer_class()
+    
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['rehydrate_text'] = self.action == 'retrieve'
+        if self.action in self.SPARSE_ACTIONS:
+            context['fields'], context['omit'] = self.get_sparse_fields()
+        return context
+    
+    def get_sparse_fields(self):
+        """Parse ``?fields=a,b`` and ``?omit=c`` into (fields or None, omit)."""
+        if self.request is None:
+            return None, set()
+        params = self.request.query_params
+        fields = params.get('fields')
+        fields = {f.strip() for f in fields.split(',') if f.strip()} if fields else None
+        omit = {f.strip() for f in params.get('omit', '').split(',') if f.strip()}
+        return fields, omit
+    
+    def get_selected_columns(self):
+        """Model columns required by the fields that will be serialized."""
+        fields, omit = self.get_sparse_fields()
+        names = [
+            name for name in self.get_serializer_class().Meta.fields
+            if (fields is None or name in fields) and name not in omit
+        ]
+        model_fields = {f.name for f in Transcription._meta.concrete_fields}
+        # id/created_at back the pagination cursor
+        columns = {'id', 'created_at'}
+        if self.action == 'retrieve':
+            # Compression caching and the ETag/Last-Modified validators
+            columns.update(('status', 'updated_at'))
+        for name in names:
+            for column in self.FIELD_COLUMNS.get(name, [name]):
+                if column in model_fields:
+                    columns.add(column)
+        return sorted(columns)
     
     def perform_create(self, serializer):
         """Create transcription and start async Voxtral processing."""
@@ -45,17 +128,67 @@ class TranscriptionViewSet(viewsets.ModelViewSet):
             status='pending'
         )
         
-        # Start async Voxtral task
-        task = process_transcription.delay(transcription.id)
+        # Queue async Voxtral task; published to the broker after commit
+        task = enqueue_task(process_transcription, transcription.id)
         logger.info(
             f"Submitted transcription {transcription.id} to Voxtral. "
-            f"Task ID: {task.id}"
+            f"Task ID: {task.task_id}"
+        )
+    
+    def list(self, request, *args, **kwargs):
+        """List transcriptions; answers If-None-Match with 304 from the cached list version."""
+        token, last_modified = conditional.get_list_version(request.user.id)
+        etag = conditional.make_etag(request, 'list', request.user.id, token)
+        # If-Modified-Since is not evaluated: deletes can move the newest
+        # updated_at backwards
+        not_modified = conditional.not_modified_response(request, 'list', etag)
+        if not_modified is not None:
+            return not_modified
+        response = self.list_page(request, *args, **kwargs)
+        return conditional.set_validators(response, etag, last_modified)
+    
+    def list_page(self, request, *args, **kwargs):
+        """Serialize a page, from values_list() tuples for supported field sets."""
+        fields, omit = self.get_sparse_fields()
+        names = [
+            name for name in self.get_serializer_class().Meta.fields
+            if (fields is None or name in fields) and name not in omit
+        ]
+        if not fastpath.supports(names):
+            return super().list(request, *args, **kwargs)
+        
+        columns, serialize = fastpath.make_row_serializer(names, user=request.user)
+        # Cursor position columns are appended after the rendered ones
+        rows = self.filter_queryset(self.get_queryset()).values_list(
+            *columns, 'created_at', 'id'
         )
+        paginator = self.paginator
+        if paginator is None:
+            return Response([serialize(row) for row in rows])
+        paginator.get_position = lambda row: (row[-2], row[-1])
+        page = paginator.paginate_queryset(rows, request, view=self)
+        return paginator.get_paginated_response([serialize(row) for row in page])
+    
+    def retrieve(self, request, *args, **kwargs):
+        not_modified = conditional.check_object(request, 'detail', kwargs['pk'])
+        if not_modified is not None:
+            return not_modified
+        
+        instance = self.get_object()
+        serializer = self.get_serializer(instance)
+        response = Response(serializer.data)
+        # Completed transcripts no longer change, so CompressionMiddleware
+        # may keep their compressed body
+        response.cache_compressed = instance.status == 'completed'
+        etag = conditional.make_etag(request, 'detail', instance.pk, instance.updated_at)
+        return conditional.set_validators(response, etag, instance.updated_at)
     
     def get_throttles(self):
-        """Apply custom throttle for create action."""
+        """Apply custom throttles for the create and export actions."""
         if self.action == "create":
             return [TranscriptionRateThrottle()]
+        if self.action == "export":
+            return [ExportRateThrottle()]
         return super().get_throttles()
     
     @action(detail=False, methods=['post'])
@@ -167,6 +300,80 @@ class TranscriptionViewSet(viewsets.ModelViewSet):
                 'detail': 'Transkription fehlgeschlagen'
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
+    @action(detail=False, methods=['get'])
+    def changes(self, request):
+        """
+        Rows created, updated or deleted since a sync token.
+        
+        GET /transcriptions/changes/?since=<token>
+        
+        Without ``since`` all rows are returned (in pages while ``has_more``).
+        Store ``next`` and pass it as ``since`` on the following call.
+        """
+        try:
+            data = sync.get_changes(request.user, request.query_params.get('since'))
+        except sync.InvalidToken as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except sync.ExpiredToken as e:
+            return Response({'error': str(e)}, status=status.HTTP_410_GONE)
+        return Response(data)
+    
+    @action(detail=False, methods=['get'], url_path='search', url_name='search')
+    def search_transcripts(self, request):
+        """
+        Volltextsuche über eigene Transkriptionen.
+        
+        GET /transcriptions/search/?q=<terms>&limit=20
+        
+        Results are ranked best first and carry a ``headline`` excerpt with
+        the matches wrapped in ``<mark>`` (not HTML-escaped).
+        """
+        text = request.query_params.get('q', '').strip()
+        if not text:
+            return Response({'error': 'q is required'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(text) > settings.SEARCH_MAX_QUERY_LENGTH:
+            return Response({'error': f'q must be at most {settings.SEARCH_MAX_QUERY_LENGTH} characters'},
+                            status=status.HTTP_400_BAD_REQUEST)
+        limit = self.get_limit(request, settings.SEARCH_PAGE_SIZE, settings.SEARCH_MAX_PAGE_SIZE)
+        if limit is None:
+            return Response({'error': 'limit must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({'results': search.search(request.user, text, limit)})
+    
+    @action(detail=False, methods=['get'])
+    def autocomplete(self, request):
+        """
+        Title suggestions while typing.
+        
+        GET /transcriptions/autocomplete/?q=<typed>&limit=10
+        
+        Prefix matches come first, then substring and (PostgreSQL) fuzzy
+        matches. Results are cached per user for a few seconds, so repeated
+        keystrokes and concurrent identical requests run one query.
+        """
+        text = search.normalize(request.query_params.get('q', ''))
+        if len(text) > settings.SEARCH_MAX_QUERY_LENGTH:
+            return Response({'error': f'q must be at most {settings.SEARCH_MAX_QUERY_LENGTH} characters'},
+                            status=status.HTTP_400_BAD_REQUEST)
+        limit = self.get_limit(request, settings.AUTOCOMPLETE_LIMIT, settings.AUTOCOMPLETE_MAX_LIMIT)
+        if limit is None:
+            return Response({'error': 'limit must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(text) < settings.AUTOCOMPLETE_MIN_LENGTH:
+            return Response({'results': []})
+        results = dashboard_cache.get_or_compute(
+            'autocomplete', request.user.id, {'q': text, 'limit': limit},
+            lambda: search.autocomplete(request.user, text, limit),
+            timeout=settings.AUTOCOMPLETE_CACHE_TIMEOUT,
+        )
+        return Response({'results': results})
+    
+    def get_limit(self, request, default, maximum):
+        """``?limit=`` clamped to 1..maximum, None if not an integer."""
+        try:
+            limit = int(request.query_params.get('limit', default))
+        except ValueError:
+            return None
+        return max(1, min(limit, maximum))
+    
     @action(detail=False, methods=['get'])
     def health(self, request):
         """
@@ -228,60 +435,32 @@ class TranscriptionViewSet(viewsets.ModelViewSet):
         
         GET /rest/api/v1/transcribe/transcriptions/stats/
         """
-        user = request.user
-        queryset = Transcription.objects.filter(user=user)
-        
-        # Gesamtstatistiken
-        total_transcriptions = queryset.count()
-        total_duration = queryset.aggregate(
-            total=Sum('duration_seconds')
-        )['total'] or 0
-        total_file_size = queryset.aggregate(
-            total=Sum('file_size')
-        )['total'] or 0
-        
-        # Status-Zählungen
-        status_counts = dict(
-            queryset.values_list('status').annotate(count=Count('status'))
-        )
-        
-        # Sprache-Zählungen
-        language_counts = dict(
-            queryset.values_list('language').annotate(count=Count('language'))
-        )
-        
-        # Modell-Zählungen
-        model_counts = dict(
-            queryset.values_list('model_name').annotate(count=Count('model_name'))
+        data = dashboard_cache.get_or_compute(
+            'stats', request.user.id, {}, lambda: self.get_stats_data(request)
         )
+        # Built from trusted columns; no serializer round-trip needed
+        return Response(data, status=status.HTTP_200_OK)
+    
+    def get_stats_data(self, request):
+        # Totals and counts come from the incrementally maintained rollup row
+        stats = rollups.get_stats(request.user.id)
         
         # Letzte Transkriptionen (max 5)
-        recent = queryset.order_by('-created_at')[:5]
-        recent_transcriptions = [
-            {
-                'id': t.id,
-                'title': t.title,
-                'status': t.status,
-                'language': t.language,
-                'created_at': t.created_at,
-                'duration_seconds': t.duration_seconds,
-            }
-            for t in recent
-        ]
+        recent_transcriptions = list(
+            Transcription.objects.filter(user=request.user).order_by('-created_at').values(
+                'id', 'title', 'status', 'language', 'created_at', 'duration_seconds'
+            )[:5]
+        )
         
-        data = {
-            'total_transcriptions': total_transcriptions,
-            'total_duration_seconds': total_duration,
-            'total_file_size_bytes': total_file_size,
-            'status_counts': status_counts,
-            'language_counts': language_counts,
-            'model_counts': model_counts,
+        return {
+            'total_transcriptions': stats.total_transcriptions,
+            'total_duration_seconds': stats.total_duration_seconds,
+            'total_file_size_bytes': stats.total_file_size_bytes,
+            'status_counts': stats.status_counts,
+            'language_counts': stats.language_counts,
+            'model_counts': stats.model_counts,
             'recent_transcriptions': recent_transcriptions,
         }
-        
-        serializer = TranscriptionStatsSerializer(data=data)
-        serializer.is_valid(raise_exception=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
 
     @action(detail=False, methods=['get'])
     def timeline(self, request):
@@ -289,49 +468,38 @@ class TranscriptionViewSet(viewsets.ModelViewSet):
         Zeitreihendaten für Transkriptionen (letzte 30 Tage)
         
         GET /rest/api/v1/transcribe/transcriptions/timeline/
-        Optional: ?days=30 (Anzahl Tage)
+        Optional: ?days=30 (Anzahl Tage), ?granularity=day|week|month,
+        ?tz=Europe/Berlin (Zeitzone der Tage, Standard TIME_ZONE)
         """
-        days = int(request.query_params.get('days', 30))
-        if days > 365:
-            days = 365
-        
-        end_date = timezone.now().date()
-        start_date = end_date - timedelta(days=days-1)
-        
-        user = request.user
-        queryset = Transcription.objects.filter(
-            user=user,
-            created_at__date__gte=start_date,
-            created_at__date__lte=end_date
-        )
+        try:
+            days = int(request.query_params.get('days', 30))
+        except ValueError:
+            return Response({'error': 'days must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+        days = max(1, min(days, 365))
         
-        # Gruppierung nach Tag
-        from django.db.models.functions import TruncDate
-        timeline_data = (
-            queryset
-            .annotate(date=TruncDate('created_at'))
-            .values('date')
-            .annotate(
-                count=Count('id'),
-                total_duration=Sum('duration_seconds')
-            )
-            .order_by('date')
-        )
+        granularity = request.query_params.get('granularity', 'day')
+        if granularity not in ('day', 'week', 'month'):
+            return Response({'error': 'granularity must be day, week or month'},
+                            status=status.HTTP_400_BAD_REQUEST)
         
-        # Lücken füllen
-        result = []
-        current_date = start_date
-        while current_date <= end_date:
-            entry = next(
-                (item for item in timeline_data if item['date'] == current_date),
-                {'date': current_date, 'count': 0, 'total_duration': 0}
-            )
-            result.append({
-                'date': entry['date'],
-                'count': entry['count'],
-                'total_duration': entry['total_duration'] or 0,
-            })
-            current_date += timedelta(days=1)
+        tz = None
+        if request.query_params.get('tz'):
+            try:
+                tz = zoneinfo.ZoneInfo(request.query_params['tz'])
+            except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+                return Response({'error': 'Unknown time zone'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        params = {
+            'days': days,
+            'granularity': granularity,
+            'tz': str(tz or ''),
+            # The range ends today; a new day starts a new entry
+            'today': timezone.localdate(timezone.now(), tz),
+        }
+        result = dashboard_cache.get_or_compute(
+            'timeline', request.user.id, params,
+            lambda: rollups.timeline(request.user.id, days, granularity, tz),
+        )
         
         serializer = TranscriptionTimelineSerializer(result, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -342,18 +510,241 @@ class TranscriptionViewSet(viewsets.ModelViewSet):
         Get current processing status.
         
         GET /transcriptions/{id}/status/
+        
+        Long poll: with ``?wait=<seconds>`` and an ``If-None-Match`` matching
+        the current status, the request blocks until the next transition
+        (200) or the timeout (304). Only under ASGI; WSGI answers at once.
         """
-        transcription = self.get_object()
-        return Response({
-            'id': transcription.id,
-            'status': transcription.status,
-            'created_at': transcription.created_at,
-            'updated_at': transcription.updated_at,
-            'completed_at': transcription.completed_at,
-            'error_message': transcription.error_message or '',
-            'is_processing': transcription.is_processing,
-            'is_complete': transcription.is_complete,
-        })
+        wait = self.get_long_poll_wait(request)
+        if wait:
+            return self.wait_for_status(request, pk, wait)
+        
+        not_modified = conditional.check_object(request, 'status', pk)
+        if not_modified is not None:
+            return not_modified
+        return self.status_response(request, self.get_status_row(request, pk))
+    
+    @action(detail=False, methods=['get'], url_path='status', url_name='bulk-status')
+    def bulk_status(self, request):
+        """
+        Get the processing status of many transcriptions at once.
+        
+        GET /transcriptions/status/?ids=1,2,3
+        
+        Returns ``{id: status}`` for the user's transcriptions among the ids;
+        unknown or foreign ids are left out.
+        """
+        try:
+            ids = self.get_ids(request)
+        except ValueError:
+            return Response({'error': 'ids must be a comma-separated list of integers'},
+                            status=status.HTTP_400_BAD_REQUEST)
+        if not ids:
+            return Response({'error': 'ids is required'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(ids) > settings.STATUS_BULK_MAX_IDS:
+            return Response({'error': f'At most {settings.STATUS_BULK_MAX_IDS} ids per request'},
+                            status=status.HTTP_400_BAD_REQUEST)
+        
+        rows = status_cache.read_many(ids, request.user.id)
+        missing = [pk for pk in ids if pk not in rows]
+        if missing:
+            fetched = list(
+                Transcription.objects
+                .filter(user=request.user, id__in=missing)
+                .values_list(*fastpath.STATUS_COLUMNS)
+            )
+            status_cache.fill_many(fetched, request.user.id)
+            rows.update((row[0], row) for row in fetched)
+        
+        data = {}
+        for pk in ids:
+            if pk in rows:
+                item = fastpath.serialize_status(rows[pk])
+                del item['id']
+                data[str(pk)] = item
+        return Response(data)
+    
+    def get_ids(self, request):
+        """Distinct ids of ``?ids=1,2,3`` in order; ValueError if malformed."""
+        return list(dict.fromkeys(
+            int(value) for value in request.query_params.get('ids', '').split(',') if value.strip()
+        ))
+    
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """
+        Transkripte als ZIP-Archiv herunterladen.
+        
+        GET /transcriptions/export/?file_format=txt&ids=1,2,3
+        GET /transcriptions/export/?file_format=json&status=completed&language=de
+            &created_after=<iso>&created_before=<iso>
+        
+        ``file_format`` is txt, srt, vtt or json (``format`` is taken by DRF's
+        content negotiation). Without ``ids`` the filters select the
+        transcriptions; the archive is streamed while it is built.
+        """
+        params = request.query_params
+        file_format = params.get('file_format', 'txt')
+        if file_format not in export.FORMATS:
+            return Response({'error': f"file_format must be one of {', '.join(export.FORMATS)}"},
+                            status=status.HTTP_400_BAD_REQUEST)
+        
+        queryset = Transcription.objects.filter(user=request.user)
+        try:
+            ids = self.get_ids(request)
+        except ValueError:
+            return Response({'error': 'ids must be a comma-separated list of integers'},
+                            status=status.HTTP_400_BAD_REQUEST)
+        if ids:
+            queryset = queryset.filter(id__in=ids)
+        for name in ('status', 'language'):
+            if params.get(name):
+                queryset = queryset.filter(**{name: params[name]})
+        for name, lookup in (('created_after', 'created_at__gte'), ('created_before', 'created_at__lt')):
+            if params.get(name):
+                try:
+                    value = parse_datetime(params[name])
+                except ValueError:
+                    value = None
+                if value is None or timezone.is_naive(value):
+                    return Response({'error': f'{name} must be an ISO 8601 datetime with offset'},
+                                    status=status.HTTP_400_BAD_REQUEST)
+                queryset = queryset.filter(**{lookup: value})
+        
+        if queryset.count() > settings.EXPORT_MAX_FILES:
+            return Response({'error': f'At most {settings.EXPORT_MAX_FILES} transcriptions per export'},
+                            status=status.HTTP_400_BAD_REQUEST)
+        
+        response = self.stream_response(
+            request, export.stream_archive(queryset, file_format), 'application/zip'
+        )
+        filename = f"transcripts-{timezone.now():%Y%m%d-%H%M%S}.zip"
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+    
+    @action(detail=True, methods=['get'], url_path=r'subtitles/(?P<file_format>srt|vtt)')
+    def subtitles(self, request, pk=None, file_format=None):
+        """
+        Untertitel einer Transkription herunterladen.
+        
+        GET /transcriptions/{id}/subtitles/srt/
+        GET /transcriptions/{id}/subtitles/vtt/
+        
+        Rendered from the stored segments; repeat downloads are served from
+        the copy cached in storage until the transcription changes.
+        """
+        try:
+            pk = int(pk)
+        except (TypeError, ValueError):
+            raise Http404
+        transcription = (
+            Transcription.objects
+            .filter(user=request.user, pk=pk)
+            .only('id', 'user_id', 'title', 'status', 'updated_at')
+            .first()
+        )
+        if transcription is None:
+            raise Http404
+        if transcription.status != 'completed':
+            return Response({'error': 'Transcription is not completed'}, status=status.HTTP_409_CONFLICT)
+        
+        filename = f"{slugify(transcription.title) or transcription.id}.{file_format}"
+        cached = subtitles.open_cached(transcription, file_format)
+        if cached is not None:
+            return FileResponse(
+                cached, as_attachment=True, filename=filename,
+                content_type=subtitles.FORMATS[file_format],
+            )
+        
+        segments, archive_key = (
+            Transcription.objects.values_list('segments', 'text_archive_key').get(pk=transcription.pk)
+        )
+        if archive_key:
+            # Archived with the text
+            segments = load_archived_segments(archive_key)
+        if not segments:
+            return Response({'error': 'No timestamped segments stored for this transcription'},
+                            status=status.HTTP_404_NOT_FOUND)
+        response = self.stream_response(
+            request,
+            subtitles.render_cached(transcription, segments, file_format),
+            subtitles.FORMATS[file_format],
+        )
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+    
+    def stream_response(self, request, content, content_type):
+        """StreamingHttpResponse over a sync iterator, stepped from worker threads under ASGI."""
+        if isinstance(request._request, ASGIRequest):
+            content = streams.iterate_async(content)
+        return StreamingHttpResponse(content, content_type=content_type)
+    
+    def get_long_poll_wait(self, request):
+        """Seconds a status request may block, 0 for a plain poll."""
+        if not events.enabled() or 'HTTP_IF_NONE_MATCH' not in request.META:
+            return 0
+        # Under WSGI a waiting request would hold one of the few worker
+        # threads; ASGI runs each sync request in a thread of its own
+        if not isinstance(request._request, ASGIRequest):
+            return 0
+        try:
+            wait = int(request.query_params.get('wait', 0))
+        except ValueError:
+            return 0
+        return max(0, min(wait, settings.STATUS_LONG_POLL_MAX_WAIT))
+    
+    def get_status_row(self, request, pk):
+        """STATUS_COLUMNS row from the status cache, else the database."""
+        try:
+            pk = int(pk)
+        except (TypeError, ValueError):
+            raise Http404
+        row = status_cache.read(pk, request.user.id)
+        if row is None:
+            row = (
+                Transcription.objects
+                .filter(user=request.user, pk=pk)
+                .values_list(*fastpath.STATUS_COLUMNS)
+                .first()
+            )
+            if row is None:
+                raise Http404
+            status_cache.fill(row, request.user.id)
+        return row
+    
+    def status_response(self, request, row):
+        data = fastpath.serialize_status(row)
+        etag = conditional.make_etag(request, 'status', data['id'], data['updated_at'])
+        return conditional.set_validators(Response(data), etag, data['updated_at'])
+    
+    def wait_for_status(self, request, pk, wait):
+        try:
+            with events.StatusListener(request.user.id) as listener:
+                row = self.get_status_row(request, pk)
+                etag = conditional.make_etag(request, 'status', row[0], row[3])
+                if conditional.is_not_modified(request, etag):
+                    # Nothing new yet: give the DB connection back while blocked
+                    if not connection.in_atomic_block:
+                        connection.close()
+                    row = listener.wait(row[0], wait) or row
+        except redis.RedisError as e:
+            logger.warning(f"Long poll for transcription {pk} fell back to a plain poll: {e}")
+            row = self.get_status_row(request, pk)
+        
+        etag = conditional.make_etag(request, 'status', row[0], row[3])
+        not_modified = conditional.not_modified_response(request, 'status', etag, row[3])
+        if not_modified is not None:
+            return not_modified
+        return self.status_response(request, row)
+    
+    @classmethod
+    def as_view(cls, actions=None, **initkwargs):
+        view = super().as_view(actions, **initkwargs)
+        if actions and {'status', 'bulk_status'} & set(actions.values()):
+            # Status polls are read-only, and a long poll must not hold a
+            # transaction (ATOMIC_REQUESTS) while it blocks
+            view = transaction.non_atomic_requests(view)
+        return view
 
 
 class TranscriptionSettingsViewSet(viewsets.ModelViewSet):
@@ -377,7 +768,7 @@ class TranscriptionSettingsViewSet(viewsets.ModelViewSet):
 
 # Infrastructure health check endpoint
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAdminUser
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
@@ -399,3 +790,46 @@ def health_check(request):
         {"status": status, "checks": checks},
         status=status_code
     )
+
+
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def conditional_get_metrics(request):
+    """
+    Request counts and 304 hit rate of the conditional GET endpoints (staff only).
+    """
+    return Response(conditional.metrics())
+
+
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def ops_metrics_stats(request):
+    """
+    Platform-wide job metrics from the minute/hour/day buckets (staff only).
+    
+    GET /rest/api/v1/transcribe/metrics/ops/
+    Optional: ?start=<ISO 8601>&end=<ISO 8601> (default: last 24 hours),
+    ?resolution=minute|hour|day (default: chosen from the range)
+    """
+    bounds = {}
+    for name in ('start', 'end'):
+        value = request.query_params.get(name)
+        if value is None:
+            continue
+        try:
+            bounds[name] = parse_datetime(value)
+        except ValueError:
+            bounds[name] = None
+        if bounds[name] is None or timezone.is_naive(bounds[name]):
+            return Response({'error': f'{name} must be an aware ISO 8601 datetime'},
+                            status=status.HTTP_400_BAD_REQUEST)
+    end = bounds.get('end') or timezone.now()
+    start = bounds.get('start') or end - timedelta(hours=24)
+    if start >= end:
+        return Response({'error': 'start must be before end'},
+                        status=status.HTTP_400_BAD_REQUEST)
+    resolution = request.query_params.get('resolution')
+    if resolution is not None and resolution not in ops_metrics.RESOLUTIONS:
+        return Response({'error': 'resolution must be minute, hour or day'},
+                        status=status.HTTP_400_BAD_REQUEST)
+    return Response(ops_metrics.query(start, end, resolution))
@@ -0,0 +1,34 @@
+from django.db import migrations
+
+# Trigrams of UPPER(email) serve the icontains lookups of admin searches
+# ("user__email"). PostgreSQL only, so the index is not part of the model
+# state; the test settings build this app without migrations.
+CREATE_INDEX = (
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS users_email_trgm_idx '
+    'ON users_user USING gin (UPPER(email) gin_trgm_ops)'
+)
+DROP_INDEX = 'DROP INDEX CONCURRENTLY IF EXISTS users_email_trgm_idx'
+
+
+def create_email_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        schema_editor.execute(CREATE_INDEX)
+
+
+def drop_email_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(DROP_INDEX)
+
+
+class Migration(migrations.Migration):
+    # Indexes are built concurrently, outside a transaction
+    atomic = False
+
+    dependencies = [
+        ('users', '0002_default_user'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_email_index, drop_email_index),
+    ]
@@ -58,7 +58,9 @@ class FrontendPasswordResetForm(PasswordResetForm):
             html_email = loader.render_to_string(html_email_template_name, context)
             email_message.attach_alternative(html_email, "text/html")
 
-        # Let SMTP/network failures bubble up so the API can return actionable errors.
+        # Let failures bubble up so the API can return actionable errors. With
+        # the email outbox enabled this only queues the message; SMTP errors
+        # are retried by the mail queue instead of surfacing here.
         email_message.send()
 
 
@@ -0,0 +1,22 @@
+"""
+ASGI config for My Awesome Project project.
+
+This module contains the ASGI application used by ASGI servers (uvicorn,
+gunicorn with uvicorn workers). It should expose a module-level variable
+named ``application``.
+
+Regular views keep running synchronously in Django's thread pool; async
+views such as the job event stream (``apps.transcriptions.streams``) run on
+the event loop, so idle streaming connections cost no worker thread.
+
+"""
+
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.production")
+
+# This application object is used by any ASGI server configured to use this
+# file.
+application = get_asgi_application()
@@ -1,5 +1,20 @@
+import gzip
+import hashlib
+import secrets
+import struct
+import zlib
+
+import zstandard
 from django.conf import settings
+from django.core.cache import cache
 from django.http import HttpResponseForbidden
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional
+    brotli = None
 
 
 class TraefikApiKeyMiddleware:
@@ -31,3 +46,210 @@ class TraefikApiKeyMiddleware:
             if provided != expected:
                 return HttpResponseForbidden("Forbidden")
         return self.get_response(request)
+
+
+# Random padding per response against BREACH, as GZipMiddleware does
+PADDING_MAX_BYTES = 100
+# First magic number of a zstd skippable frame (RFC 8878 3.1.2)
+ZSTD_SKIPPABLE_MAGIC = 0x184D2A50
+
+
+class _Codec:
+    """
+    A content-coding: an incremental compressor and a one-shot helper.
+
+    ``padded`` codecs add a random number of bytes to every response so its
+    length does not reveal how well a secret compressed against reflected
+    input (BREACH).
+    """
+
+    def __init__(self, name, compressor, padded):
+        self.name = name
+        self.compressor = compressor
+        self.padded = padded
+
+    def compress(self, data, level):
+        compress, finish = self.compressor(level)
+        return compress(data) + finish()
+
+
+def _gzip_compressor(level):
+    # Raw deflate behind a hand-written header whose FNAME field carries the
+    # padding, like django.utils.text.compress_sequence
+    obj = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    filename = b"a" * secrets.randbelow(PADDING_MAX_BYTES) + b"\x00"
+    header = b"\x1f\x8b\x08" + bytes([gzip.FNAME]) + b"\x00\x00\x00\x00\x00\xff" + filename
+    state = {"header": header, "crc": 0, "size": 0}
+
+    def compress(data):
+        state["crc"] = zlib.crc32(data, state["crc"])
+        state["size"] += len(data)
+        prefix, state["header"] = state["header"], b""
+        return prefix + obj.compress(data)
+
+    def finish():
+        trailer = struct.pack("<II", state["crc"], state["size"] & 0xFFFFFFFF)
+        return state["header"] + obj.flush() + trailer
+
+    return compress, finish
+
+
+def _zstd_compressor(level):
+    obj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def finish():
+        # Decoders skip the trailing skippable frame
+        padding = secrets.randbelow(PADDING_MAX_BYTES)
+        return obj.flush() + struct.pack("<II", ZSTD_SKIPPABLE_MAGIC, padding) + b"a" * padding
+
+    return obj.compress, finish
+
+
+def _brotli_compressor(level):
+    obj = brotli.Compressor(quality=level)
+    return obj.process, obj.finish
+
+
+def _available_codecs():
+    codecs = {}
+    if brotli is not None:
+        # The brotli format has no padding that the encoder can emit
+        codecs["br"] = _Codec("br", _brotli_compressor, padded=False)
+    codecs["zstd"] = _Codec("zstd", _zstd_compressor, padded=True)
+    codecs["gzip"] = _Codec("gzip", _gzip_compressor, padded=True)
+    return codecs
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Negotiate brotli, zstd or gzip from Accept-Encoding.
+
+    Replacement for Django's GZipMiddleware. Codings are preferred in the
+    order br, zstd, gzip when the client weights them equally; brotli is
+    skipped when the brotli package is not installed. Bodies smaller
+    than COMPRESSION_MIN_SIZE, non-text content types and event streams are
+    passed through untouched. Streaming responses (sync and async) are
+    compressed incrementally.
+
+    Views can set ``response.cache_compressed = True`` for bodies that never
+    change (completed transcripts); their compressed variants are cached by
+    coding and content digest and compressed once at a higher level.
+
+    zstd and gzip output carries random length padding against BREACH.
+    brotli cannot be padded, so it is only negotiated for those
+    ``cache_compressed`` bodies, which reflect no request input; every
+    other response falls back to a padded coding.
+    """
+
+    codecs = _available_codecs()
+    # (live level, cached level) per coding
+    levels = {"br": (5, 9), "zstd": (3, 12), "gzip": (6, 6)}
+    compressible_types = (
+        "text/",
+        "application/json",
+        "application/javascript",
+        "application/xml",
+        "application/problem+json",
+        "application/vnd.oai.openapi",
+    )
+    excluded_types = ("text/event-stream",)
+
+    def process_response(self, request, response):
+        if response.has_header("Content-Encoding") or response.status_code == 206:
+            return response
+        if not response.streaming and len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        content_type = response.get("Content-Type", "").split(";")[0].strip().lower()
+        if content_type.startswith(self.excluded_types):
+            return response
+        if not content_type.startswith(self.compressible_types):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        cache_compressed = getattr(response, "cache_compressed", False)
+        codec = self.negotiate(
+            request.META.get("HTTP_ACCEPT_ENCODING", ""), padded_only=not cache_compressed
+        )
+        if codec is None:
+            return response
+
+        if response.streaming:
+            response.streaming_content = self.compress_stream(
+                codec, response.streaming_content, response.is_async
+            )
+            # Unknown until the stream is consumed
+            del response.headers["Content-Length"]
+        else:
+            if cache_compressed:
+                content = self.cached_compress(codec, response.content)
+            else:
+                content = codec.compress(response.content, self.levels[codec.name][0])
+            if len(content) >= len(response.content):
+                return response
+            response.content = content
+            response.headers["Content-Length"] = str(len(content))
+
+        # A strong ETag names the identity representation (RFC 9110 8.8.1)
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = codec.name
+        return response
+
+    def negotiate(self, accept_encoding, padded_only=False):
+        """Return the best available codec for an Accept-Encoding header, or None."""
+        weights = {}
+        for part in accept_encoding.split(","):
+            coding, _, params = part.strip().partition(";")
+            coding = coding.strip().lower()
+            if not coding:
+                continue
+            quality = 1.0
+            params = params.strip()
+            if params.startswith("q="):
+                try:
+                    quality = float(params[2:])
+                except ValueError:
+                    quality = 0.0
+            weights[coding] = quality
+
+        best, best_quality = None, 0.0
+        for name, codec in self.codecs.items():
+            if padded_only and not codec.padded:
+                continue
+            quality = weights.get(name, weights.get("*", 0.0))
+            if quality > best_quality:
+                best, best_quality = codec, quality
+        return best
+
+    def cached_compress(self, codec, content):
+        digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+        key = f"compressed:{codec.name}:{digest}"
+        compressed = cache.get(key)
+        if compressed is None:
+            compressed = codec.compress(content, self.levels[codec.name][1])
+            cache.set(key, compressed, settings.COMPRESSION_CACHE_TIMEOUT)
+        return compressed
+
+    def compress_stream(self, codec, chunks, is_async):
+        compress, finish = codec.compressor(self.levels[codec.name][0])
+
+        if is_async:
+            async def async_wrapper():
+                async for chunk in chunks:
+                    data = compress(chunk)
+                    if data:
+                        yield data
+                yield finish()
+
+            return async_wrapper()
+
+        def wrapper():
+            for chunk in chunks:
+                data = compress(chunk)
+                if data:
+                    yield data
+            yield finish()
+
+        return wrapper()
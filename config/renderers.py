@@ -0,0 +1,74 @@
+"""
+orjson-based JSON renderer and parser for the REST API.
+
+Drop-in replacements for DRF's ``JSONRenderer``/``JSONParser`` that produce
+the same bytes (compact separators, UTF-8, ``Z`` for UTC datetimes, escaped
+U+2028/U+2029). Anything orjson cannot encode natively goes through DRF's
+own ``JSONEncoder.default``, so Decimals, lazy translation strings,
+timedeltas and querysets render exactly as before.
+
+Whenever orjson is not installed or a request asks for output orjson cannot
+produce (``indent=4``, non-UTF-8 charsets, integers beyond 64 bit), the
+stdlib-based DRF implementation is used instead.
+
+Known difference: with orjson, non-finite floats render as ``null`` instead of
+raising, and float exponents are written without padding (``1e16`` rather
+than ``1e+16``).
+"""
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+if orjson is not None:
+    DUMPS_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+else:
+    DUMPS_OPTIONS = 0
+
+_default = encoders.JSONEncoder().default
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSONRenderer that encodes with orjson where the output is identical."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=_default, option=DUMPS_OPTIONS)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bit; the stdlib encoder handles or
+            # rejects these exactly as before
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Same JavaScript-subset escaping as JSONRenderer
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
+
+
+class ORJSONParser(JSONParser):
+    """JSONParser that decodes UTF-8 request bodies with orjson."""
+
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', 'utf-8')
+        if orjson is None or encoding.lower().replace('_', '-') not in ('utf-8', 'utf8'):
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
@@ -2,6 +2,7 @@
 """Base settings to build other settings files upon."""
 
 
+from datetime import timedelta
 from pathlib import Path
 
 import environ
@@ -148,6 +149,7 @@ AUTH_PASSWORD_VALIDATORS = [
 # https://docs.djangoproject.com/en/dev/ref/settings/#middleware
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "config.middleware.CompressionMiddleware",
     "config.middleware.TraefikApiKeyMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -266,10 +268,26 @@ X_FRAME_OPTIONS = "DENY"
 # EMAIL
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#email-backend
-EMAIL_BACKEND = env(
+# Outgoing mail is queued in the database and delivered by the "mail" Celery
+# queue through EMAIL_DELIVERY_BACKEND (see apps/transcriptions/mail.py).
+EMAIL_DELIVERY_BACKEND = env(
     "DJANGO_EMAIL_BACKEND",
     default="django.core.mail.backends.smtp.EmailBackend",
 )
+EMAIL_OUTBOX_ENABLED = env.bool("EMAIL_OUTBOX_ENABLED", default=True)
+EMAIL_BACKEND = (
+    "apps.transcriptions.mail.OutboxEmailBackend"
+    if EMAIL_OUTBOX_ENABLED
+    else EMAIL_DELIVERY_BACKEND
+)
+EMAIL_OUTBOX_QUEUE = "mail"
+EMAIL_OUTBOX_BATCH_SIZE = env.int("EMAIL_OUTBOX_BATCH_SIZE", default=100)
+EMAIL_OUTBOX_MAX_BATCHES = env.int("EMAIL_OUTBOX_MAX_BATCHES", default=10)
+EMAIL_OUTBOX_MAX_ATTEMPTS = env.int("EMAIL_OUTBOX_MAX_ATTEMPTS", default=6)
+EMAIL_OUTBOX_RETRY_BASE_SECONDS = env.int("EMAIL_OUTBOX_RETRY_BASE_SECONDS", default=60)
+# Claimed rows are skipped by other drains this long; must exceed a batch's send time
+EMAIL_OUTBOX_LEASE_SECONDS = env.int("EMAIL_OUTBOX_LEASE_SECONDS", default=600)
+EMAIL_OUTBOX_DRAIN_DEBOUNCE = 5  # seconds
 # https://docs.djangoproject.com/en/dev/ref/settings/#email-timeout
 EMAIL_TIMEOUT = env.int("EMAIL_TIMEOUT", default=5)
 
@@ -366,6 +384,23 @@ LOGGING = {
 
 REDIS_URL = env("REDIS_URL", default="redis://localhost:6379/0")
 REDIS_SSL = REDIS_URL.startswith("rediss://")
+REDIS_SOCKET_TIMEOUT = env.float("REDIS_SOCKET_TIMEOUT", default=1.0)
+
+# Status polling reads a write-through Redis hash (apps/transcriptions/status_cache.py)
+STATUS_CACHE_ENABLED = env.bool("STATUS_CACHE_ENABLED", default=True)
+STATUS_CACHE_TIMEOUT = env.int("STATUS_CACHE_TIMEOUT", default=60 * 60 * 24)
+# Status transitions published on Redis pub/sub (apps/transcriptions/events.py)
+STATUS_EVENTS_ENABLED = env.bool("STATUS_EVENTS_ENABLED", default=True)
+# Upper bound for ?wait= on the status endpoint; keep below proxy timeouts.
+# Long polls only block under ASGI (config/asgi.py), WSGI answers at once.
+STATUS_LONG_POLL_MAX_WAIT = env.int("STATUS_LONG_POLL_MAX_WAIT", default=30)
+# Most ids accepted by GET /transcriptions/status/?ids=
+STATUS_BULK_MAX_IDS = env.int("STATUS_BULK_MAX_IDS", default=500)
+# Server-Sent Events job stream (apps/transcriptions/streams.py, served via config/asgi.py)
+SSE_HEARTBEAT_SECONDS = env.int("SSE_HEARTBEAT_SECONDS", default=15)
+SSE_RETRY_MS = env.int("SSE_RETRY_MS", default=5000)
+SSE_QUEUE_SIZE = env.int("SSE_QUEUE_SIZE", default=100)
+SSE_SNAPSHOT_LIMIT = env.int("SSE_SNAPSHOT_LIMIT", default=200)
 
 # ══════════════════════════════════════════════════════════════
 # CELERY CONFIGURATION
@@ -383,6 +418,92 @@ CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
 CELERY_RESULT_EXPIRES = 3600
 CELERY_TASK_ACKS_LATE = True
 CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+CELERY_TASK_ROUTES = {
+    'apps.transcriptions.tasks.send_queued_emails': {'queue': 'mail'},
+}
+CELERY_BEAT_SCHEDULE = {
+    'relay-task-outbox': {
+        'task': 'apps.transcriptions.tasks.relay_task_outbox',
+        'schedule': 15.0,
+    },
+    'send-queued-emails': {
+        'task': 'apps.transcriptions.tasks.send_queued_emails',
+        'schedule': 30.0,
+    },
+    'send-completion-digests': {
+        'task': 'apps.transcriptions.tasks.send_completion_digests',
+        'schedule': 60.0,
+    },
+    'purge-completed-audio': {
+        'task': 'apps.transcriptions.tasks.purge_completed_audio',
+        'schedule': 10 * 60,
+    },
+    'collect-orphaned-audio': {
+        'task': 'apps.transcriptions.tasks.collect_orphaned_audio_objects',
+        'schedule': 6 * 60 * 60,
+    },
+    'archive-old-transcripts': {
+        'task': 'apps.transcriptions.tasks.archive_old_transcripts',
+        'schedule': 24 * 60 * 60,
+    },
+    'index-archived-transcripts': {
+        'task': 'apps.transcriptions.tasks.index_archived_transcripts',
+        'schedule': 24 * 60 * 60,
+    },
+    'purge-task-outbox': {
+        'task': 'apps.transcriptions.tasks.purge_task_outbox',
+        'schedule': 60 * 60,
+    },
+    'purge-transcription-tombstones': {
+        'task': 'apps.transcriptions.tasks.purge_transcription_tombstones',
+        'schedule': 24 * 60 * 60,
+    },
+    'reconcile-transcription-stats': {
+        'task': 'apps.transcriptions.tasks.reconcile_transcription_stats',
+        'schedule': 6 * 60 * 60,
+    },
+    'rollup-ops-metrics': {
+        'task': 'apps.transcriptions.tasks.rollup_ops_metrics_buckets',
+        'schedule': 60.0,
+    },
+}
+
+# Audio lifecycle (see apps/transcriptions/lifecycle.py)
+# Global retention for completed audio in days; 0 keeps audio unless the
+# owner enabled auto_delete_audio.
+AUDIO_RETENTION_DAYS = env.int('AUDIO_RETENTION_DAYS', default=0)
+AUDIO_PURGE_BATCH_SIZE = env.int('AUDIO_PURGE_BATCH_SIZE', default=1000)
+AUDIO_PURGE_MAX_BATCHES = env.int('AUDIO_PURGE_MAX_BATCHES', default=20)
+# Stored audio without a referencing row is deleted once older than this
+AUDIO_ORPHAN_GRACE = timedelta(hours=env.int('AUDIO_ORPHAN_GRACE_HOURS', default=24))
+AUDIO_ORPHAN_MAX_PAGES = env.int('AUDIO_ORPHAN_MAX_PAGES', default=100)
+
+# Transcript cold-tier archive (see apps/transcriptions/archive.py)
+TRANSCRIPT_ARCHIVE_AFTER_DAYS = env.int('TRANSCRIPT_ARCHIVE_AFTER_DAYS', default=180)
+TRANSCRIPT_PREVIEW_CHARS = env.int('TRANSCRIPT_PREVIEW_CHARS', default=500)
+TRANSCRIPT_ARCHIVE_ZSTD_LEVEL = env.int('TRANSCRIPT_ARCHIVE_ZSTD_LEVEL', default=10)
+TRANSCRIPT_ARCHIVE_BATCH_SIZE = env.int('TRANSCRIPT_ARCHIVE_BATCH_SIZE', default=200)
+TRANSCRIPT_ARCHIVE_MAX_ROWS = env.int('TRANSCRIPT_ARCHIVE_MAX_ROWS', default=10000)
+
+# Per-user stats rollups (see apps/transcriptions/rollups.py)
+TRANSCRIPTION_STATS_RECONCILE_BATCH_SIZE = env.int('TRANSCRIPTION_STATS_RECONCILE_BATCH_SIZE', default=500)
+
+# Stats/timeline response cache (see apps/transcriptions/dashboard_cache.py)
+DASHBOARD_CACHE_ENABLED = env.bool('DASHBOARD_CACHE_ENABLED', default=True)
+# Bounds staleness after changes that bypass save() (QuerySet.update)
+DASHBOARD_CACHE_TIMEOUT = env.int('DASHBOARD_CACHE_TIMEOUT', default=5 * 60)
+DASHBOARD_CACHE_VERSION_TIMEOUT = env.int('DASHBOARD_CACHE_VERSION_TIMEOUT', default=60 * 60 * 24)
+# Single-flight: how long concurrent misses wait for the first computation
+DASHBOARD_CACHE_LOCK_TIMEOUT = env.int('DASHBOARD_CACHE_LOCK_TIMEOUT', default=10)
+DASHBOARD_CACHE_POLL_INTERVAL = env.float('DASHBOARD_CACHE_POLL_INTERVAL', default=0.05)
+
+# Platform ops metrics buckets (see apps/transcriptions/ops_metrics.py)
+OPS_METRICS_MINUTE_RETENTION = timedelta(days=env.int('OPS_METRICS_MINUTE_RETENTION_DAYS', default=2))
+OPS_METRICS_HOUR_RETENTION = timedelta(days=env.int('OPS_METRICS_HOUR_RETENTION_DAYS', default=90))
+
+# Transactional task outbox (see apps/transcriptions/outbox.py)
+TASK_OUTBOX_BATCH_SIZE = env.int('TASK_OUTBOX_BATCH_SIZE', default=500)
+TASK_OUTBOX_RETENTION = timedelta(days=env.int('TASK_OUTBOX_RETENTION_DAYS', default=7))
 
 # ══════════════════════════════════════════════════════════════
 # VOXTRAL TRANSCRIPTION SERVICE
@@ -440,6 +561,16 @@ REST_FRAMEWORK = {
         "rest_framework.authentication.TokenAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ],
+    # orjson-backed JSON; falls back to DRF's stdlib encoder without orjson
+    "DEFAULT_RENDERER_CLASSES": [
+        "config.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "config.renderers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "DEFAULT_THROTTLE_CLASSES": [
         "rest_framework.throttling.AnonRateThrottle",
         "rest_framework.throttling.UserRateThrottle",
@@ -448,10 +579,49 @@ REST_FRAMEWORK = {
         "anon": "100/day",
         "user": "1000/day",
         "transcription": "10/hour",
+        "export": "30/hour",
     },
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
 
+# Keyset pagination for the transcription list (apps/transcriptions/pagination.py)
+TRANSCRIPTION_PAGE_SIZE = env.int("TRANSCRIPTION_PAGE_SIZE", default=50)
+TRANSCRIPTION_MAX_PAGE_SIZE = env.int("TRANSCRIPTION_MAX_PAGE_SIZE", default=200)
+
+# Delta sync via /transcriptions/changes/ (apps/transcriptions/sync.py)
+CHANGES_PAGE_SIZE = env.int("CHANGES_PAGE_SIZE", default=500)
+# Longest expected transaction; changes this recent are delivered again
+CHANGES_SETTLE_SECONDS = env.int("CHANGES_SETTLE_SECONDS", default=10)
+# Older sync tokens get 410 Gone and the client reloads the full list
+TRANSCRIPTION_TOMBSTONE_RETENTION = timedelta(days=env.int("TRANSCRIPTION_TOMBSTONE_RETENTION_DAYS", default=30))
+
+# Full-text search via /transcriptions/search/ (apps/transcriptions/search.py)
+SEARCH_PAGE_SIZE = env.int("SEARCH_PAGE_SIZE", default=20)
+SEARCH_MAX_PAGE_SIZE = env.int("SEARCH_MAX_PAGE_SIZE", default=100)
+SEARCH_MAX_QUERY_LENGTH = env.int("SEARCH_MAX_QUERY_LENGTH", default=200)
+# Title autocomplete via /transcriptions/autocomplete/; shorter input returns nothing
+AUTOCOMPLETE_LIMIT = env.int("AUTOCOMPLETE_LIMIT", default=10)
+AUTOCOMPLETE_MAX_LIMIT = env.int("AUTOCOMPLETE_MAX_LIMIT", default=25)
+AUTOCOMPLETE_MIN_LENGTH = env.int("AUTOCOMPLETE_MIN_LENGTH", default=2)
+# Per-user result cache shared by repeated keystrokes (dashboard_cache.py)
+AUTOCOMPLETE_CACHE_TIMEOUT = env.int("AUTOCOMPLETE_CACHE_TIMEOUT", default=30)
+
+# Streaming ZIP export via /transcriptions/export/ (apps/transcriptions/export.py)
+EXPORT_CHUNK_SIZE = env.int("EXPORT_CHUNK_SIZE", default=200)
+EXPORT_MAX_FILES = env.int("EXPORT_MAX_FILES", default=10000)
+
+# Subtitle rendering (apps/transcriptions/subtitles.py)
+SUBTITLE_MAX_LINE_CHARS = env.int("SUBTITLE_MAX_LINE_CHARS", default=42)
+SUBTITLE_MAX_LINES = env.int("SUBTITLE_MAX_LINES", default=2)
+SUBTITLE_MAX_CUE_SECONDS = env.float("SUBTITLE_MAX_CUE_SECONDS", default=7.0)
+
+# Cached ETag/Last-Modified versions (apps/transcriptions/conditional.py)
+CONDITIONAL_VERSION_TIMEOUT = env.int("CONDITIONAL_VERSION_TIMEOUT", default=60 * 60 * 24)
+
+# Response compression (config.middleware.CompressionMiddleware)
+COMPRESSION_MIN_SIZE = env.int("COMPRESSION_MIN_SIZE", default=1024)
+COMPRESSION_CACHE_TIMEOUT = env.int("COMPRESSION_CACHE_TIMEOUT", default=60 * 60 * 24)
+
 PASSWORD_RESET_CONFIRM_URL = env(
     "PASSWORD_RESET_CONFIRM_URL",
     default="http://localhost:3003/reset-password/{token}/?uid={uid}",
@@ -1,6 +1,7 @@
 # ruff: noqa: E501
 from .base import *  # noqa: F403
 from .base import DATABASES
+from .base import EMAIL_OUTBOX_ENABLED
 from .base import INSTALLED_APPS
 from .base import REDIS_URL
 from .base import env
@@ -19,7 +20,9 @@ ALLOWED_HOSTS = env.list(
 
 # DATABASES
 # ------------------------------------------------------------------------------
-DATABASES["default"]["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=60)
+# Served through ASGI (config.asgi): sync views run in per-request threads,
+# so persistent connections would pile up instead of being reused.
+DATABASES["default"]["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=0)
 
 # CACHES
 # ------------------------------------------------------------------------------
@@ -169,7 +172,9 @@ if mailgun_api_key and mailgun_domain:
     # https://docs.djangoproject.com/en/dev/ref/settings/#email-backend
     # https://anymail.readthedocs.io/en/stable/installation/#anymail-settings-reference
     # https://anymail.readthedocs.io/en/stable/esps/mailgun/
-    EMAIL_BACKEND = "anymail.backends.mailgun.EmailBackend"
+    EMAIL_DELIVERY_BACKEND = "anymail.backends.mailgun.EmailBackend"
+    if not EMAIL_OUTBOX_ENABLED:
+        EMAIL_BACKEND = EMAIL_DELIVERY_BACKEND
     ANYMAIL = {
         "MAILGUN_API_KEY": mailgun_api_key,
         "MAILGUN_SENDER_DOMAIN": mailgun_domain,
@@ -52,6 +52,15 @@ CELERY_TASK_ALWAYS_EAGER = False
 CELERY_BROKER_URL = "memory://"
 CELERY_RESULT_BACKEND = "cache+memory://"
 
+# STATUS CACHE
+# ------------------------------------------------------------------------------
+# No Redis server in tests; status cache/event tests enable them against fakeredis
+STATUS_CACHE_ENABLED = False
+STATUS_EVENTS_ENABLED = False
+# The locmem cache outlives each test's rolled-back transaction (and its
+# on_commit version bumps); dashboard cache tests enable it explicitly
+DASHBOARD_CACHE_ENABLED = False
+
 # PASSWORDS
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#password-hashers
@@ -61,6 +70,7 @@ PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#email-backend
 EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+EMAIL_DELIVERY_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
 
 # DEBUGGING FOR TEMPLATES
 # ------------------------------------------------------------------------------
@@ -0,0 +1,160 @@
+import asyncio
+import gzip
+import json
+
+import pytest
+import zstandard
+from django.core.cache import cache
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory
+
+from config.middleware import CompressionMiddleware
+
+brotli = pytest.importorskip("brotli")
+
+BODY = json.dumps({"transcribed_text": "Guten Morgen und willkommen zur Besprechung. " * 200}).encode()
+
+
+def decompress(coding, data):
+    if coding == "br":
+        return brotli.decompress(data)
+    if coding == "zstd":
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    return gzip.decompress(data)
+
+
+@pytest.fixture
+def middleware():
+    return CompressionMiddleware(lambda request: None)
+
+
+def _process(middleware, response, accept_encoding):
+    request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING=accept_encoding)
+    return middleware.process_response(request, response)
+
+
+class TestNegotiation:
+    @pytest.mark.parametrize(("header", "expected"), [
+        ("gzip, deflate, br, zstd", "br"),
+        ("gzip, zstd", "zstd"),
+        ("gzip", "gzip"),
+        ("br;q=0.5, gzip;q=0.8", "gzip"),
+        ("*", "br"),
+        ("*, br;q=0", "zstd"),
+        ("identity", None),
+        ("", None),
+        ("gzip;q=bogus", None),
+    ])
+    def test_picks_best_coding(self, middleware, header, expected):
+        codec = middleware.negotiate(header)
+        assert (codec.name if codec else None) == expected
+
+
+    def test_padded_only_skips_brotli(self, middleware):
+        assert middleware.negotiate("br, zstd", padded_only=True).name == "zstd"
+        assert middleware.negotiate("br", padded_only=True) is None
+
+
+class TestCompression:
+    @pytest.mark.parametrize("coding", ["zstd", "gzip"])
+    def test_compresses_json(self, middleware, coding):
+        response = _process(middleware, HttpResponse(BODY, content_type="application/json"), coding)
+
+        assert response["Content-Encoding"] == coding
+        assert response["Vary"] == "Accept-Encoding"
+        assert int(response["Content-Length"]) == len(response.content) < len(BODY)
+        assert decompress(coding, response.content) == BODY
+
+    @pytest.mark.parametrize("coding", ["zstd", "gzip"])
+    def test_length_is_padded(self, middleware, coding):
+        lengths = {
+            len(_process(middleware, HttpResponse(BODY, content_type="application/json"), coding).content)
+            for _ in range(20)
+        }
+        assert len(lengths) > 1
+
+    def test_brotli_only_for_cached_bodies(self, middleware):
+        response = _process(middleware, HttpResponse(BODY, content_type="application/json"), "br, gzip")
+        assert response["Content-Encoding"] == "gzip"
+
+        response = HttpResponse(BODY, content_type="application/json")
+        response.cache_compressed = True
+        response = _process(middleware, response, "br, gzip")
+        assert response["Content-Encoding"] == "br"
+        assert brotli.decompress(response.content) == BODY
+
+    def test_skips_small_bodies(self, middleware, settings):
+        settings.COMPRESSION_MIN_SIZE = len(BODY) + 1
+        response = _process(middleware, HttpResponse(BODY, content_type="application/json"), "br")
+        assert not response.has_header("Content-Encoding")
+
+    @pytest.mark.parametrize("content_type", ["audio/mpeg", "application/zip", "text/event-stream"])
+    def test_skips_incompressible_types(self, middleware, content_type):
+        response = _process(middleware, HttpResponse(BODY, content_type=content_type), "br")
+        assert not response.has_header("Content-Encoding")
+
+    def test_weakens_strong_etag(self, middleware):
+        response = HttpResponse(BODY, content_type="application/json")
+        response["ETag"] = '"abc"'
+        assert _process(middleware, response, "gzip")["ETag"] == 'W/"abc"'
+
+    @pytest.mark.parametrize("coding", ["zstd", "gzip"])
+    def test_streaming_response(self, middleware, coding):
+        chunks = [BODY[i:i + 1000] for i in range(0, len(BODY), 1000)]
+        response = StreamingHttpResponse(iter(chunks), content_type="text/plain")
+
+        response = _process(middleware, response, coding)
+
+        assert response["Content-Encoding"] == coding
+        assert not response.has_header("Content-Length")
+        assert decompress(coding, b"".join(response.streaming_content)) == BODY
+
+    def test_async_streaming_response(self, middleware):
+        async def chunks():
+            for i in range(0, len(BODY), 1000):
+                yield BODY[i:i + 1000]
+
+        response = _process(middleware, StreamingHttpResponse(chunks(), content_type="text/plain"), "zstd")
+
+        async def collect():
+            return b"".join([chunk async for chunk in response.streaming_content])
+
+        assert decompress("zstd", asyncio.run(collect())) == BODY
+
+    def test_caches_immutable_bodies(self, middleware, monkeypatch):
+        cache.clear()
+        calls = []
+        codec = middleware.codecs["br"]
+        original = codec.compress
+        monkeypatch.setattr(codec, "compress", lambda data, level: calls.append(level) or original(data, level))
+
+        for _ in range(3):
+            response = HttpResponse(BODY, content_type="application/json")
+            response.cache_compressed = True
+            response = _process(middleware, response, "br")
+            assert brotli.decompress(response.content) == BODY
+
+        assert calls == [middleware.levels["br"][1]]
+
+
+@pytest.mark.django_db
+def test_completed_transcript_detail_is_compressed(client):
+    from apps.transcriptions.models import Transcription
+    from apps.users.tests.factories import UserFactory
+
+    user = UserFactory()
+    transcription = Transcription.objects.create(
+        user=user, title="Interview", status="completed",
+        transcribed_text="Das ist ein langer Satz. " * 500,
+    )
+    client.force_login(user)
+
+    response = client.get(
+        f"/rest/api/v1/transcribe/transcriptions/{transcription.id}/",
+        HTTP_ACCEPT_ENCODING="br, gzip",
+        HTTP_ACCEPT="application/json",
+    )
+
+    assert response["Content-Encoding"] == "br"
+    data = json.loads(brotli.decompress(response.content))
+    assert data["transcribed_text"] == transcription.transcribed_text
@@ -0,0 +1,123 @@
+import datetime
+import decimal
+import io
+import uuid
+from zoneinfo import ZoneInfo
+
+import pytest
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+from config import renderers
+from config.renderers import ORJSONParser, ORJSONRenderer
+
+pytest.importorskip("orjson")
+
+UTC = datetime.UTC
+BERLIN = ZoneInfo("Europe/Berlin")
+LONG_TEXT = "Das ist ein Satz aus einem langen deutschen Transkript – mit Ümlauten. " * 20_000
+
+PAYLOADS = [
+    None,
+    {},
+    [],
+    {"id": 1, "title": "Meeting", "flag": True, "missing": None, "ratio": 0.25},
+    {"created_at": datetime.datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=UTC)},
+    {"created_at": datetime.datetime(2024, 5, 1, 12, 30, tzinfo=BERLIN)},
+    {"naive": datetime.datetime(2024, 5, 1, 12, 30), "day": datetime.date(2024, 5, 1)},
+    {"time": datetime.time(8, 15, 30, 500)},
+    {"price": decimal.Decimal("12.50"), "elapsed": datetime.timedelta(minutes=3)},
+    {"uuid": uuid.UUID("12345678-1234-5678-1234-567812345678")},
+    {"label": gettext_lazy("Transcription")},
+    {"text": "Zeilen\u2028trenner\u2029 und \"Anführungszeichen\" \\ \n\t"},
+    {1: "int key", "nested": {"list": [1, 2.5, "drei", [None]], "tuple": (1, 2)}},
+    {"big": 2 ** 70},
+    ReturnDict({"id": 3, "status": "completed"}, serializer=None),
+    ReturnList([{"id": 1}, {"id": 2}], serializer=None),
+    {"transcribed_text": LONG_TEXT},
+]
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_output_is_byte_identical_to_json_renderer(payload):
+    assert ORJSONRenderer().render(payload) == JSONRenderer().render(payload)
+
+
+def test_indent_requests_use_stdlib_renderer():
+    payload = {"id": 1, "items": [1, 2]}
+    media_type = "application/json; indent=4"
+    assert (
+        ORJSONRenderer().render(payload, media_type)
+        == JSONRenderer().render(payload, media_type)
+    )
+
+
+def test_falls_back_without_orjson(monkeypatch):
+    monkeypatch.setattr(renderers, "orjson", None)
+    payload = {"created_at": datetime.datetime(2024, 5, 1, tzinfo=UTC)}
+    assert ORJSONRenderer().render(payload) == JSONRenderer().render(payload)
+
+
+@pytest.mark.django_db
+def test_api_responses_match_json_renderer(rf):
+    from apps.transcriptions.models import Transcription
+    from apps.transcriptions.serializers import TranscriptionSerializer
+    from apps.users.tests.factories import UserFactory
+
+    transcription = Transcription.objects.create(
+        user=UserFactory(),
+        title="Interview",
+        transcribed_text=LONG_TEXT,
+        duration_seconds=3600,
+    )
+    data = TranscriptionSerializer(transcription, context={"request": rf.get("/")}).data
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+class TestParser:
+    def _parse(self, parser, body, encoding="utf-8"):
+        return parser.parse(io.BytesIO(body), "application/json", {"encoding": encoding})
+
+    def test_matches_json_parser(self):
+        body = '{"title": "Besprechung ü", "n": [1, 2.5, null, true]}'.encode()
+        assert self._parse(ORJSONParser(), body) == self._parse(JSONParser(), body)
+
+    def test_invalid_json_raises_parse_error(self):
+        with pytest.raises(ParseError):
+            self._parse(ORJSONParser(), b'{"title": ')
+
+    def test_rejects_non_finite_constants(self):
+        with pytest.raises(ParseError):
+            self._parse(ORJSONParser(), b'{"n": NaN}')
+
+    def test_non_utf8_bodies_use_stdlib_parser(self):
+        body = '{"title": "Grüße"}'.encode("latin-1")
+        assert self._parse(ORJSONParser(), body, "latin-1") == {"title": "Grüße"}
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("renderer_class", [JSONRenderer, ORJSONRenderer])
+def test_benchmark_large_transcript_payload(benchmark, renderer_class):
+    """pytest-benchmark: a 50-row page of ~1.4 MB transcripts."""
+    pytest.importorskip("pytest_benchmark")
+    now = datetime.datetime(2024, 5, 1, tzinfo=UTC)
+    payload = {
+        "next": None,
+        "previous": None,
+        "results": [
+            {
+                "id": i,
+                "title": f"Recording {i}",
+                "transcribed_text": LONG_TEXT,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(50)
+        ],
+    }
+    renderer = renderer_class()
+    result = benchmark.pedantic(renderer.render, args=(payload,), rounds=5, iterations=1)
+    assert result.startswith(b'{"next":null')